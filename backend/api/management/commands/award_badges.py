@@ -0,0 +1,31 @@
+import time
+from django.core.management.base import BaseCommand
+from api.models.badge import UserBadge
+from api.models.reading import ReadingGoal
+
+
+class Command(BaseCommand):
+    help = "Re-evaluate badges for every user in user-id chunks (nightly). Safe to rerun: only missing badges are awarded."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Users evaluated per transaction")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        users = awarded = 0
+        after = 0
+        while True:
+            # 🔥 Keyset over goal owners; each chunk is one locked, set-based evaluation
+            chunk = list(
+                ReadingGoal.objects.filter(user_id__gt=after).order_by("user_id").values_list("user_id", flat=True)[:options["chunk_size"]]
+            )
+            if not chunk:
+                break
+            awarded += len(UserBadge.objects.award_missing(user_id_range=(after, chunk[-1])))
+            users += len(chunk)
+            after = chunk[-1]
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Evaluated {users} users in {elapsed:.1f}s ({users / elapsed if elapsed else 0:.0f} users/s), awarded {awarded} badges"
+        ))
@@ -0,0 +1,44 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models.calendar import ReadingCalendar, day_index
+from api.models.reading import ReadingHistory
+
+
+class Command(BaseCommand):
+    help = "Build every user's ReadingCalendar bitmaps from ReadingHistory. Safe to rerun: existing days are kept."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000, help="History rows fetched per round trip")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        history = ReadingHistory.objects.order_by("user_id", "date").values_list("user_id", "date")
+        calendars, rows, current = {}, 0, None
+        for user_id, day in history.iterator(chunk_size=options["chunk_size"]):
+            if user_id != current and len(calendars) >= options["chunk_size"]:
+                self.save(calendars)  # 🔥 History streams in user order; flush only between users
+                calendars = {}
+            current = user_id
+            calendars[user_id, day.year] = calendars.get((user_id, day.year), 0) | 1 << day_index(day)
+            rows += 1
+        self.save(calendars)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Folded {rows} history rows into calendars in {elapsed:.1f}s"))
+
+    @transaction.atomic
+    def save(self, calendars):
+        if not calendars:
+            return
+        users = {user_id for user_id, _ in calendars}
+        existing = {
+            (calendar.user_id, calendar.year): calendar.bits
+            for calendar in ReadingCalendar.objects.select_for_update().filter(user_id__in=users)
+        }
+        rows = []
+        for (user_id, year), bits in calendars.items():
+            calendar = ReadingCalendar(user_id=user_id, year=year)
+            calendar.bits = bits | existing.get((user_id, year), 0)  # ✅ Keep days marked since history was read
+            rows.append(calendar)
+        ReadingCalendar.objects.bulk_create(rows, update_conflicts=True, unique_fields=["user", "year"], update_fields=["days"])
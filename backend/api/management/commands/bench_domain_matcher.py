@@ -0,0 +1,80 @@
+import random
+import string
+import time
+from django.core.management.base import BaseCommand, CommandError
+from core.domains import DomainTrie, normalize_host, parse_rule
+
+TLDS = ["com", "net", "org", "io", "co.uk", "com.ng", "de", "app"]
+
+
+class Command(BaseCommand):
+    help = "Benchmark DomainTrie lookups against scanning a flat rule list, and the size of its binary artifact."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rules", type=int, default=100_000, help="Blocklist rules to compile")
+        parser.add_argument("--lookups", type=int, default=1_000_000, help="Trie lookups to time")
+        parser.add_argument("--baseline-lookups", type=int, default=200, help="Flat-list lookups to time (slow)")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+
+        def name():
+            return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+
+        rules = [
+            f"{'*.' if rng.random() < 0.2 else ''}{name()}.{rng.choice(TLDS)}"
+            for _ in range(options["rules"])
+        ]
+        hosts = []
+        for _ in range(options["lookups"]):
+            if rng.random() < 0.5:  # 🔥 Half hit a rule (itself or a subdomain), half miss
+                host = parse_rule(rng.choice(rules))[0]
+                hosts.append(f"{rng.choice(['www', 'm', 'cdn.static'])}.{host}" if rng.random() < 0.6 else host)
+            else:
+                hosts.append(f"{rng.choice(['www.', ''])}{name()}.{rng.choice(TLDS)}")
+
+        started = time.perf_counter()
+        trie = DomainTrie(rules)
+        compiled = time.perf_counter() - started
+        started = time.perf_counter()
+        data = trie.to_bytes()
+        encoded = time.perf_counter() - started
+        flat = sum(len(rule) + 1 for rule in rules)
+        self.stdout.write(
+            f"{len(rules)} rules compiled in {compiled:.2f}s, artifact {len(data) / 1024:.0f} KiB "
+            f"(flat list {flat / 1024:.0f} KiB) encoded in {encoded:.2f}s"
+        )
+
+        started = time.perf_counter()
+        blocked = sum(1 for host in hosts if trie.match(host))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{'trie':<10} {len(hosts) / elapsed:12,.0f} lookups/s   ({blocked} of {len(hosts)} blocked)")
+
+        with_urls = [f"https://{host}/path?q=1" for host in hosts[:100_000]]
+        started = time.perf_counter()
+        for url in with_urls:
+            trie.match(normalize_host(url))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{'trie+url':<10} {len(with_urls) / elapsed:12,.0f} lookups/s   (parsing full URLs)")
+
+        parsed = [parse_rule(rule) for rule in rules]
+
+        def scan(host):
+            for domain, flags in parsed:
+                if host == domain and flags & 1 or host.endswith("." + domain):
+                    return True
+            return False
+
+        sample = hosts[:options["baseline_lookups"]]
+        started = time.perf_counter()
+        for host in sample:
+            scan(host)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{'flat scan':<10} {len(sample) / elapsed:12,.0f} lookups/s")
+
+        decoded = DomainTrie.from_bytes(data)
+        mismatches = sum(1 for host in sample if bool(decoded.match(host)) != scan(host))
+        if mismatches:
+            raise CommandError(f"{mismatches} lookups disagree with the flat scan")
+        self.stdout.write(self.style.SUCCESS("Decoded artifact agrees with the flat scan"))
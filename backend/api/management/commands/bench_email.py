@@ -0,0 +1,216 @@
+import asyncio
+import datetime
+import ipaddress
+import os
+import socket
+import ssl
+import tempfile
+import threading
+import time
+from django.core.mail import get_connection, send_mail
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from api.models.jobs import Job
+from core.mail import close_pools, send_each
+from core.notifications import send_email_notification
+from core.tasks import Worker
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:  # 🔥 Benchmark-only dependency
+    Controller = None
+
+
+class SinkHandler:
+    """aiosmtpd handler that accepts everything and can advertise PIPELINING (aiosmtpd reads commands in order, so it copes)."""
+
+    def __init__(self):
+        self.received = 0
+        self.pipelining = True
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        if self.pipelining:
+            responses.insert(-1, "250-PIPELINING")
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 Message accepted"
+
+
+class LatencyProxy:
+    """TCP proxy that delays every chunk by half the round trip in each direction, without serializing chunks."""
+
+    def __init__(self, target_port, rtt):
+        self.target_port = target_port
+        self.delay = rtt / 2
+        self.ready = threading.Event()
+        self.writers = set()
+
+    def start(self):
+        threading.Thread(target=self.serve, daemon=True).start()
+        self.ready.wait()
+        return self
+
+    def serve(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, "127.0.0.1", 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        self.loop.run_forever()
+
+    def stop(self):
+        async def shutdown():
+            self.server.close()
+            for writer in self.writers:
+                writer.transport.abort()  # ✅ Pipes see the connection end and finish on their own
+            await asyncio.gather(*[task for task in asyncio.all_tasks() if task is not asyncio.current_task()])
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    async def handle(self, reader, writer):
+        upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", self.target_port)
+        self.writers |= {writer, upstream_writer}
+        await asyncio.gather(self.pipe(reader, upstream_writer), self.pipe(upstream_reader, writer), return_exceptions=True)
+        self.writers -= {writer, upstream_writer}
+
+    async def pipe(self, reader, writer):
+        chunks = asyncio.Queue()
+
+        async def deliver():
+            while True:
+                due, chunk = await chunks.get()
+                await asyncio.sleep(max(0, due - self.loop.time()))
+                if chunk is None:
+                    writer.close()
+                    return
+                writer.write(chunk)
+                await writer.drain()
+
+        delivery = asyncio.create_task(deliver())
+        try:
+            while chunk := await reader.read(65536):
+                chunks.put_nowait((self.loop.time() + self.delay, chunk))
+        except ConnectionError:
+            pass
+        chunks.put_nowait((self.loop.time() + self.delay, None))
+        await delivery
+
+
+def self_signed_certificate(directory):
+    """Writes a throwaway certificate for 127.0.0.1 and returns (cert path, key path)."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    today = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(today - datetime.timedelta(days=1))
+        .not_valid_after(today + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as file:
+        file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as file:
+        file.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = "Benchmark SMTP delivery (connection per email vs pooled vs pooled + pipelined from the queue) against a local aiosmtpd server."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--emails", type=int, default=300, help="Emails per mode")
+        parser.add_argument("--rtt", type=int, default=20, help="Simulated network round trip in ms")
+        parser.add_argument("--no-tls", action="store_true", help="Plain SMTP instead of STARTTLS")
+
+    def handle(self, *args, **options):
+        if Controller is None:
+            raise CommandError("bench_email needs aiosmtpd: pip install aiosmtpd")
+
+        with tempfile.TemporaryDirectory() as directory:
+            tls_context = None
+            if not options["no_tls"]:
+                cert_path, key_path = self_signed_certificate(directory)
+                tls_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+                tls_context.load_cert_chain(cert_path, key_path)
+                os.environ["SSL_CERT_FILE"] = cert_path  # 🔥 Clients verify the throwaway certificate
+
+            self.handler = SinkHandler()
+            controller = Controller(self.handler, hostname="127.0.0.1", port=free_port(), tls_context=tls_context)
+            controller.start()
+            proxy = LatencyProxy(controller.port, options["rtt"] / 1000).start()
+            server = override_settings(
+                EMAIL_HOST="127.0.0.1", EMAIL_PORT=proxy.port, EMAIL_USE_TLS=tls_context is not None,
+                EMAIL_USE_SSL=False, EMAIL_HOST_USER="", EMAIL_HOST_PASSWORD="", JOB_RUN_INLINE=False,
+            )
+            try:
+                with server:
+                    self.stdout.write(f"{options['emails']} emails, {options['rtt']} ms RTT, {'plain' if tls_context is None else 'STARTTLS'}")
+                    self.run_mode("per email", self.per_email, options["emails"], pipelining=False)
+                    self.run_mode("pooled", self.pooled, options["emails"], pipelining=False)
+                    self.run_mode("pipelined", self.queued, options["emails"], pipelining=True)
+            finally:
+                close_pools()
+                controller.stop()
+                proxy.stop()
+
+    def run_mode(self, name, send, count, pipelining):
+        close_pools()
+        self.handler.pipelining = pipelining
+        received = self.handler.received
+        started = time.perf_counter()
+        send(count)
+        elapsed = time.perf_counter() - started
+        delivered = self.handler.received - received
+        self.stdout.write(f"{name:<10} {elapsed:7.2f}s  {count / elapsed:8.1f} emails/s  ({delivered} delivered)")
+
+    def per_email(self, count):
+        """What the senders did before: send_mail, one SMTP connection and handshake per email."""
+        with override_settings(EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend"):
+            for index in range(count):
+                send_mail("Your Codexia Verification Code", f"Your OTP code is: {index:06d}", "noreply@example.com", [f"bench-{index}@example.com"])
+
+    def pooled(self, count):
+        with override_settings(EMAIL_BACKEND="core.mail.PooledSMTPEmailBackend"):
+            connection = get_connection()
+            messages = [
+                EmailMessage("Your Codexia Verification Code", f"Your OTP code is: {index:06d}", "noreply@example.com", [f"bench-{index}@example.com"])
+                for index in range(count)
+            ]
+            errors = [outcome for outcome in send_each(messages, connection) if outcome is not None]
+            if errors:
+                raise CommandError(f"{len(errors)} emails failed: {errors[0]!r}")
+
+    def queued(self, count):
+        """The production path: senders enqueue, a worker drains batches through the pooled backend."""
+        with override_settings(EMAIL_BACKEND="core.mail.PooledSMTPEmailBackend"):
+            for index in range(count):
+                send_email_notification(f"bench-{index}@example.com", "Your Codexia Verification Code", f"Your OTP code is: {index:06d}")
+            worker = Worker(batch_size=50)
+            try:
+                worker.run(burst=True)
+            finally:
+                Job.objects.filter(name="notifications.email").delete()
+            if worker.failed:
+                raise CommandError(f"{worker.failed} email jobs failed")
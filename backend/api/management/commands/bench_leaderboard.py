@@ -0,0 +1,105 @@
+import random
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.timezone import now
+from api.models.leaderboard import STREAK, LeaderboardBucket, LeaderboardEntry
+from api.models.reading import ReadingGoal
+from api.models.user import User
+from services.leaderboards import LeaderboardService
+
+INSERT_BATCH = 5000
+
+
+class Rollback(Exception):
+    pass
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = "Benchmark leaderboard rank, top N and neighbour queries against sorting ReadingGoal on synthetic users."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5_000_000, help="Synthetic users with goals")
+        parser.add_argument("--queries", type=int, default=200, help="Queries of each kind to time")
+        parser.add_argument("--baseline-queries", type=int, default=20, help="Sort-based queries to time (slow)")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        users = options["users"]
+        self.stdout.write(f"{users} users, {options['queries']} queries")
+        try:
+            with transaction.atomic():
+                user_ids = self.populate(rng, users)
+                report = LeaderboardService.rebuild(INSERT_BATCH)
+                self.stdout.write(f"{'rebuild':<18} {report['entries']} entries, {report['buckets']} buckets in {report['seconds']}s")
+                self.bench(rng, user_ids, options["queries"], options["baseline_queries"])
+                self.bench_updates(rng, user_ids, options["queries"])
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def populate(self, rng, count):
+        started = time.perf_counter()
+        today = now().date()
+        user_ids = []
+        for offset in range(0, count, INSERT_BATCH):
+            batch = User.objects.bulk_create([
+                User(email=f"bench-leaderboard-{offset + index}@example.invalid", password="!")
+                for index in range(min(INSERT_BATCH, count - offset))
+            ])
+            goals = []
+            for user in batch:
+                streak = min(int(rng.expovariate(1 / 12)), 3650)  # 🔥 Long tail: most streaks short, a few years long
+                goals.append(ReadingGoal(
+                    user=user, goal_target=20, streak_count=streak, longest_streak=streak + int(rng.expovariate(1 / 6)),
+                    last_completed_date=today - timedelta(days=1) if streak else None, progress_date=today,
+                ))
+            ReadingGoal.objects.bulk_create(goals)
+            user_ids.extend(user.pk for user in batch)
+        self.stdout.write(f"{'populate':<18} {time.perf_counter() - started:.1f}s")
+        return user_ids
+
+    def bench(self, rng, user_ids, queries, baseline_queries):
+        ranked = list(LeaderboardEntry.objects.filter(board=STREAK, user_id__in=rng.sample(user_ids, min(len(user_ids), queries * 4))).values_list("user_id", "score")[:queries])
+
+        def timed(label, calls):
+            samples = []
+            for call in calls:
+                started = time.perf_counter()
+                call()
+                samples.append(time.perf_counter() - started)
+            self.stdout.write(f"{label:<18} p50 {percentile(samples, 0.5) * 1000:9.2f} ms   p99 {percentile(samples, 0.99) * 1000:9.2f} ms")
+
+        timed("rank", [lambda score=score: LeaderboardEntry.objects.with_ranks(STREAK, [LeaderboardEntry(score=score)]) for _, score in ranked])
+        timed("top 50", [lambda: LeaderboardEntry.objects.top(STREAK, 50)] * queries)
+        timed("around 5", [lambda user_id=user_id: LeaderboardEntry.objects.around(STREAK, user_id, 5) for user_id, _ in ranked])
+
+        baseline = ranked[:baseline_queries]
+        goals = ReadingGoal.objects.filter(streak_count__gt=0)
+        timed("rank (sort)", [lambda score=score: goals.filter(streak_count__gt=score).count() for _, score in baseline])
+        timed("top 50 (sort)", [lambda: list(goals.order_by("-streak_count", "user_id").values_list("user_id", "streak_count")[:50])] * baseline_queries)
+        timed("around 5 (sort)", [
+            lambda score=score: list(goals.order_by("-streak_count", "user_id").values_list("user_id", "streak_count")[
+                max(0, goals.filter(streak_count__gt=score).count() - 5):][:11])
+            for _, score in baseline
+        ])
+
+        # ✅ Spot-check the maintained ranks against the sort
+        for user_id, score in baseline:
+            me, _ = LeaderboardEntry.objects.around(STREAK, user_id, 0)
+            assert me.rank == 1 + goals.filter(streak_count__gt=score).count(), (user_id, me.rank)
+        self.stdout.write(f"{'total ranked':<18} {LeaderboardBucket.objects.size(STREAK)}")
+
+    def bench_updates(self, rng, user_ids, queries):
+        started = time.perf_counter()
+        for user_id in rng.sample(user_ids, min(len(user_ids), queries)):
+            LeaderboardEntry.objects.set_scores({(STREAK, user_id): rng.randint(0, 400)})
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{'score update':<18} {elapsed / queries * 1000:9.2f} ms each")
@@ -0,0 +1,75 @@
+import statistics
+import time
+from django.core import mail
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from api.models.badge import Badge, UserBadge
+from api.models.rewards import Reward
+from api.models.user import User
+from core import catalog
+from core.push import LocMemPushBackend
+from core.tasks import Worker
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = "Benchmark badge-award latency with notifications sent inline versus queued, against local FCM/SMTP sinks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--awards", type=int, default=50, help="Badges awarded per mode")
+        parser.add_argument("--push-latency", type=int, default=80, help="Simulated FCM round trip in ms")
+        parser.add_argument("--email-latency", type=int, default=150, help="Simulated SMTP round trip in ms")
+
+    def handle(self, *args, **options):
+        sinks = override_settings(
+            PUSH_BACKEND="core.push.LocMemPushBackend",
+            EMAIL_BACKEND="core.mail.LocMemSinkEmailBackend",
+            PUSH_SINK_LATENCY_MS=options["push_latency"],
+            EMAIL_SINK_LATENCY_MS=options["email_latency"],
+        )
+        with sinks:
+            self.stdout.write(f"{'mode':<8} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9}")
+            for mode, inline in (("inline", True), ("queued", False)):
+                with override_settings(JOB_RUN_INLINE=inline):
+                    self.bench(mode, options["awards"])
+
+    def bench(self, mode, awards):
+        """Runs outside a transaction so the worker sees committed jobs; cleans up after itself."""
+        LocMemPushBackend.outbox.clear()
+        mail.outbox = []
+        user = User.objects.create_user(email=f"bench-notify-{mode}@example.com", password="unused-password", device_token="local-device")
+        badges = Badge.objects.bulk_create([
+            Badge(name=f"bench-{mode}-{index}", description="", streak_required=index) for index in range(awards)
+        ])
+        try:
+            Reward.objects.bulk_create([Reward(badge=badge, description="Bench reward", reward_type="discount") for badge in badges])
+            catalog.badges.invalidate()  # 🔥 bulk_create skips the signals that refresh the catalogs
+            catalog.rewards.invalidate()
+
+            samples = []
+            for badge in badges:
+                started = time.perf_counter()
+                UserBadge.objects.create(user=user, badge=badge)  # 🔥 Sends badge push + email and reward push
+                samples.append(time.perf_counter() - started)
+
+            self.stdout.write(
+                f"{mode:<8} {percentile(samples, 0.5) * 1000:9.1f} {percentile(samples, 0.95) * 1000:9.1f}"
+                f" {statistics.mean(samples) * 1000:9.1f}"
+            )
+
+            if mode == "queued":
+                started = time.perf_counter()
+                worker = Worker(batch_size=50)
+                worker.run(burst=True)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"worker drained {worker.processed} jobs in {elapsed:.1f}s "
+                    f"({worker.processed / elapsed:.1f} jobs/s, {len(LocMemPushBackend.outbox)} pushes, {len(mail.outbox)} emails)"
+                )
+        finally:
+            user.delete()
+            Badge.objects.filter(pk__in=[badge.pk for badge in badges]).delete()
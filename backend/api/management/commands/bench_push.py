@@ -0,0 +1,75 @@
+import time
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from api.models.jobs import Job
+from api.models.user import User
+from core import push
+from core.notifications import push_metrics, send_push_notifications
+from core.push import get_push_backend
+from core.tasks import Worker
+
+
+class Command(BaseCommand):
+    help = "Benchmark push delivery, one request per message versus send_each batches, against LocMemPushBackend."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5000, help="Users with a device token to notify")
+        parser.add_argument("--invalid", type=float, default=0.02, help="Fraction of tokens FCM reports as unregistered")
+        parser.add_argument("--latency", type=int, default=20, help="Simulated FCM round trip in ms")
+        parser.add_argument("--single-sample", type=int, default=200, help="Messages sent one by one for the baseline")
+
+    def handle(self, *args, **options):
+        settings = override_settings(PUSH_BACKEND="core.push.LocMemPushBackend", PUSH_SINK_LATENCY_MS=options["latency"], JOB_RUN_INLINE=False)
+
+        users = self.seed(options["users"], options["invalid"])
+        try:
+            with settings:
+                push._backend = None
+                self.single(users[:options["single_sample"]])
+                self.batched(users)
+        finally:
+            push._backend = None
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            Job.objects.filter(name="notifications.push", status="dead").delete()
+
+    def seed(self, count, invalid):
+        every = round(1 / invalid) if invalid else 0
+        password = make_password(None)
+        return User.objects.bulk_create([
+            User(
+                email=f"bench-push-{index}@example.com",
+                password=password,
+                device_token=f"invalid-{index}" if every and index % every == 0 else f"device-{index}",
+            )
+            for index in range(count)
+        ], batch_size=1000)
+
+    def single(self, users):
+        """Baseline: one FCM request per message, as before batching."""
+        backend = get_push_backend()
+        started = time.perf_counter()
+        for user in users:
+            backend.send(user.device_token, "Bench", "Single send")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{'single':<8} {len(users):>7} msgs in {elapsed:7.2f}s  {len(users) / elapsed:9.1f} msg/s")
+
+    def batched(self, users):
+        push_metrics.reset()
+        send_push_notifications([user.pk for user in users], "Batched send", title="Bench")
+
+        started = time.perf_counter()
+        worker = Worker(batch_size=50)
+        worker.run(burst=True)
+        elapsed = time.perf_counter() - started
+
+        metrics = push_metrics.snapshot()
+        remaining = User.objects.filter(pk__in=[user.pk for user in users], device_token__startswith="invalid").count()
+        self.stdout.write(
+            f"{'batched':<8} {len(users):>7} msgs in {elapsed:7.2f}s  {len(users) / elapsed:9.1f} msg/s"
+            f"  ({metrics['batches']} batches, {metrics['messages_per_second']} msg/s in send_each)"
+        )
+        self.stdout.write(
+            f"sent {metrics['sent']}, failed {metrics['failed']}, pruned {metrics['pruned_tokens']} tokens"
+            f" ({remaining} invalid left), {worker.failed} jobs to retry"
+        )
@@ -0,0 +1,147 @@
+import itertools
+import random
+import statistics
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from api.models.book import Book, Category
+from api.models.user import User
+from services.search import InvertedIndex, PostgresBookSearch
+
+VOCABULARY_SIZE = 20000
+INSERT_BATCH = 5000
+
+
+class Rollback(Exception):
+    pass
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = "Benchmark full-text book search against the old substring scan on a synthetic catalogue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--books", type=int, default=1_000_000, help="Synthetic books to index")
+        parser.add_argument("--queries", type=int, default=200, help="Search queries to time")
+        parser.add_argument("--baseline-queries", type=int, default=20, help="Substring-scan queries to time (slow)")
+        parser.add_argument("--backend", choices=["memory", "postgres"], help="Defaults to the database's backend")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        backend = options["backend"] or ("postgres" if connection.vendor == "postgresql" else "memory")
+        if backend == "postgres" and connection.vendor != "postgresql":
+            raise CommandError("The postgres backend needs a PostgreSQL database.")
+
+        rng = random.Random(options["seed"])
+        # 🔥 Zipf-like word frequencies so common terms have long posting lists, as in real titles
+        words = [f"w{index:05d}" for index in range(VOCABULARY_SIZE)]
+        weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY_SIZE)))
+        authors = [f"author{index}" for index in range(options["books"] // 20 + 1)]
+        categories = ["fiction", "history", "science", "poetry", "biography", "philosophy"]
+
+        def books():
+            for book_id in range(1, options["books"] + 1):
+                yield book_id, {
+                    "title": " ".join(rng.choices(words, cum_weights=weights, k=rng.randint(2, 6))),
+                    "author": rng.choice(authors),
+                    "tags": "",
+                    "category": rng.choice(categories),
+                }
+
+        queries = [
+            " ".join(rng.choices(words, cum_weights=weights, k=rng.choice([1, 1, 2, 2, 3])))
+            for _ in range(options["queries"])
+        ]
+
+        self.stdout.write(f"Backend: {backend}, {options['books']} books, {len(queries)} queries")
+        if backend == "memory":
+            self.bench_memory(books(), queries, options["baseline_queries"])
+        else:
+            self.bench_postgres(books(), categories, queries, options["baseline_queries"])
+
+    def report(self, label, samples, hits):
+        self.stdout.write(
+            f"{label:<18} p50 {percentile(samples, 0.5) * 1000:9.2f} ms   p95 {percentile(samples, 0.95) * 1000:9.2f} ms"
+            f"   p99 {percentile(samples, 0.99) * 1000:9.2f} ms   mean hits {statistics.mean(hits):.1f}"
+        )
+
+    def bench_memory(self, books, queries, baseline_queries):
+        index = InvertedIndex()
+        corpus = []
+        started = time.perf_counter()
+        for book_id, fields in books:
+            index.add_book(book_id, None, fields)
+            corpus.append(f"{fields['title']} {fields['author']}".lower())
+        self.stdout.write(f"Index build: {time.perf_counter() - started:.1f}s")
+
+        samples, hits = [], []
+        for query in queries:
+            started = time.perf_counter()
+            results = index.search(query, 20)
+            samples.append(time.perf_counter() - started)
+            hits.append(len(results))
+        self.report("inverted index", samples, hits)
+
+        samples, hits = [], []
+        for query in queries[:baseline_queries]:
+            started = time.perf_counter()
+            matches = [position for position, text in enumerate(corpus) if query in text]
+            samples.append(time.perf_counter() - started)
+            hits.append(len(matches))
+        if samples:
+            self.report("substring scan", samples, hits)
+
+    def bench_postgres(self, books, categories, queries, baseline_queries):
+        search = PostgresBookSearch()
+        try:
+            with transaction.atomic():
+                user, _ = User.objects.get_or_create(email="bench-search@example.com")
+                category_ids = {name: Category.objects.get_or_create(name=f"bench-{name}")[0].pk for name in categories}
+
+                started = time.perf_counter()
+                batch = []
+                for _, fields in books:
+                    batch.append(Book(
+                        user=user,
+                        title=fields["title"],
+                        author=fields["author"],
+                        category_id=category_ids[fields["category"]],
+                        file="books/bench.pdf",
+                    ))
+                    if len(batch) >= INSERT_BATCH:
+                        Book.objects.bulk_create(batch)
+                        batch = []
+                Book.objects.bulk_create(batch)
+                self.stdout.write(f"Insert: {time.perf_counter() - started:.1f}s")
+
+                started = time.perf_counter()
+                search.rebuild()
+                with connection.cursor() as cursor:
+                    cursor.execute(f"ANALYZE {Book._meta.db_table}")
+                self.stdout.write(f"Index build: {time.perf_counter() - started:.1f}s")
+
+                samples, hits = [], []
+                for query in queries:
+                    started = time.perf_counter()
+                    results = search.search(query, 20)
+                    samples.append(time.perf_counter() - started)
+                    hits.append(len(results))
+                self.report("tsvector + GIN", samples, hits)
+
+                samples, hits = [], []
+                for query in queries[:baseline_queries]:
+                    started = time.perf_counter()
+                    count = len(Book.objects.filter(Q(title__icontains=query) | Q(author__icontains=query)).values_list("pk", flat=True))
+                    samples.append(time.perf_counter() - started)
+                    hits.append(count)
+                if samples:
+                    self.report("ILIKE scan", samples, hits)
+
+                raise Rollback()
+        except Rollback:
+            pass
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import threading
+import time
+import psutil
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models.user import User
+from api.views.book_views import UploadBookView
+
+BOUNDARY = "CodexiaBenchBoundary"
+MB = 1024 * 1024
+
+
+class PeakRSSSampler(threading.Thread):
+    """Polls the process RSS in the background and keeps the highest value seen."""
+
+    def __init__(self, interval=0.002):
+        super().__init__(daemon=True)
+        self.process = psutil.Process()
+        self.interval = interval
+        self.baseline = self.process.memory_info().rss
+        self.peak = self.baseline
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            time.sleep(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.peak - self.baseline
+
+
+class Command(BaseCommand):
+    help = "Benchmark book upload latency and peak RSS against file size."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50, 100, 300], help="File sizes in MB")
+        parser.add_argument("--runs", type=int, default=3, help="Uploads per size")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'size MB':>8} {'latency ms':>12} {'MB/s':>8} {'peak RSS +MB':>13}")
+
+        with tempfile.TemporaryDirectory() as workdir, override_settings(MEDIA_ROOT=os.path.join(workdir, "media")):
+            with transaction.atomic():
+                user, _ = User.objects.get_or_create(email="bench-upload@example.com")
+                token = str(RefreshToken.for_user(user).access_token)
+
+                for size in options["sizes"]:
+                    latencies, peaks = [], []
+                    for run in range(options["runs"]):
+                        body_path = self.write_body(workdir, f"Bench {size}MB #{run}", size * MB)
+                        latency, peak = self.upload(body_path, token)
+                        os.remove(body_path)
+                        latencies.append(latency)
+                        peaks.append(peak)
+
+                    latency = sorted(latencies)[len(latencies) // 2]
+                    self.stdout.write(
+                        f"{size:>8} {latency * 1000:>12.1f} {size / latency:>8.1f} {max(peaks) / MB:>13.1f}"
+                    )
+
+                transaction.set_rollback(True)  # 🔥 Leave no benchmark rows behind
+
+    def write_body(self, workdir, title, size):
+        """Write a multipart body to disk so the benchmark itself never holds the file in memory."""
+        fd, path = tempfile.mkstemp(dir=workdir)
+        with os.fdopen(fd, "wb") as body:
+            body.write(
+                f"--{BOUNDARY}\r\n"
+                f'Content-Disposition: form-data; name="title"\r\n\r\n{title}\r\n'
+                f"--{BOUNDARY}\r\n"
+                f'Content-Disposition: form-data; name="file"; filename="bench.pdf"\r\n'
+                f"Content-Type: application/pdf\r\n\r\n".encode()
+            )
+            remaining = size
+            while remaining:
+                chunk = os.urandom(min(remaining, MB))
+                body.write(chunk)
+                remaining -= len(chunk)
+            body.write(f"\r\n--{BOUNDARY}--\r\n".encode())
+        return path
+
+    def upload(self, body_path, token):
+        with open(body_path, "rb") as body:
+            request = WSGIRequest({
+                "REQUEST_METHOD": "POST",
+                "PATH_INFO": "/api/v1/books/upload/",
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80",
+                "HTTP_HOST": "localhost",
+                "wsgi.url_scheme": "http",
+                "wsgi.input": body,
+                "CONTENT_TYPE": f"multipart/form-data; boundary={BOUNDARY}",
+                "CONTENT_LENGTH": str(os.path.getsize(body_path)),
+                "HTTP_AUTHORIZATION": f"Bearer {token}",
+            })
+
+            sampler = PeakRSSSampler()
+            sampler.start()
+            started = time.perf_counter()
+            response = UploadBookView.as_view()(request)
+            elapsed = time.perf_counter() - started
+            peak = sampler.stop()
+            request.close()  # 🔥 Release the upload's temp file, as the WSGI handler would
+
+        if response.status_code != 201:
+            self.stderr.write(f"Upload failed ({response.status_code}): {response.data}")
+        return elapsed, peak
@@ -0,0 +1,28 @@
+import os
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from api.models.upload import UploadSession
+
+
+class Command(BaseCommand):
+    help = "Delete expired resumable upload sessions and their staged chunks."
+
+    def handle(self, *args, **kwargs):
+        expired = 0
+        for session in UploadSession.objects.expired().iterator():
+            session.delete()  # 🔥 post_delete removes the staged file
+            expired += 1
+
+        # 🔥 Sweep staged files whose session row is already gone (e.g. deleted with its user)
+        orphaned = 0
+        staging_dir = settings.BOOK_UPLOAD_STAGING_DIR
+        cutoff = time.time() - settings.BOOK_UPLOAD_SESSION_TTL.total_seconds()
+        if os.path.isdir(staging_dir):
+            live = {f"{pk}.part" for pk in UploadSession.objects.values_list("pk", flat=True)}
+            for entry in os.scandir(staging_dir):
+                if entry.name not in live and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    orphaned += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Expired {expired} upload sessions, removed {orphaned} orphaned staging files."))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from api.models.book import BookBlob
+from services.text_extraction import TextExtractionService
+
+
+class Command(BaseCommand):
+    help = "Extract per-page text for uploaded books synchronously (backfill or retry)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--blob", type=int, help="Only extract this blob id")
+        parser.add_argument("--retry-failed", action="store_true", help="Also retry blobs whose extraction failed")
+        parser.add_argument("--force", action="store_true", help="Re-extract every selected blob regardless of status")
+
+    def handle(self, *args, **options):
+        blobs = BookBlob.objects.all()
+        if options["blob"]:
+            blobs = blobs.filter(pk=options["blob"])
+        elif not options["force"]:
+            statuses = ["pending", "failed"] if options["retry_failed"] else ["pending"]
+            blobs = blobs.filter(text_status__in=statuses)
+
+        for blob_id in blobs.values_list("pk", flat=True):
+            if options["retry_failed"]:
+                BookBlob.objects.filter(pk=blob_id, text_status="failed").update(text_status="pending")
+            TextExtractionService.run(blob_id, force=options["force"])
+            blob = BookBlob.objects.get(pk=blob_id)
+            self.stdout.write(f"Blob {blob_id}: {blob.text_status} ({blob.page_count or 0} pages)")
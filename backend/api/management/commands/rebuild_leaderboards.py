@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from services.leaderboards import LeaderboardService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the streak, longest and category leaderboards from reading goals."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Entries written per round trip")
+
+    def handle(self, *args, **options):
+        report = LeaderboardService.rebuild(options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {report['entries']} entries in {report['buckets']} score buckets in {report['seconds']}s"
+        ))
@@ -0,0 +1,57 @@
+from collections import defaultdict
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models.focus import ReadingSession
+from api.models.stats import DailyReadingStats, ReadingStats, session_minutes
+from core.timezones import local_date
+
+
+class Command(BaseCommand):
+    help = "Recompute reading aggregates from finished sessions (backfill, or repair after manual edits)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="Only rebuild this user id")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Sessions fetched per round trip")
+
+    def handle(self, *args, **options):
+        sessions = ReadingSession.objects.filter(completed=True, end_time__isnull=False).order_by("user_id", "pk")
+        if options["user"]:
+            sessions = sessions.filter(user_id=options["user"])
+
+        fields = ("user_id", "user__timezone", "start_time", "end_time", "focus_score", "interruptions")
+        current, days, users = None, None, 0
+        # 🔥 Sessions stream in user order, so only one user's days are held in memory at a time
+        for session in sessions.select_related("user").only(*fields).iterator(chunk_size=options["chunk_size"]):
+            if session.user_id != current:
+                if current is not None:
+                    self.save_user(current, days)
+                    users += 1
+                current, days = session.user_id, defaultdict(lambda: [0, 0, 0, 0])
+            day = days[local_date(session.user.timezone, session.start_time)]
+            day[0] += session_minutes(session)
+            day[1] += 1
+            day[2] += int(session.focus_score)
+            day[3] += session.interruptions
+        if current is not None:
+            self.save_user(current, days)
+            users += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt reading stats for {users} users"))
+
+    @transaction.atomic
+    def save_user(self, user_id, days):
+        DailyReadingStats.objects.filter(user_id=user_id).delete()
+        DailyReadingStats.objects.bulk_create([
+            DailyReadingStats(user_id=user_id, date=date, minutes=minutes, session_count=count, focus_score_total=score, interruptions=interruptions)
+            for date, (minutes, count, score, interruptions) in days.items()
+        ])
+
+        best_day, (best_minutes, *_) = max(days.items(), key=lambda item: (item[1][0], -item[0].toordinal()))
+        ReadingStats.objects.update_or_create(user_id=user_id, defaults={
+            "total_minutes": sum(day[0] for day in days.values()),
+            "session_count": sum(day[1] for day in days.values()),
+            "focus_score_total": sum(day[2] for day in days.values()),
+            "interruptions": sum(day[3] for day in days.values()),
+            "best_day": best_day,
+            "best_day_minutes": best_minutes,
+        })
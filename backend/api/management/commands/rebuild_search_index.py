@@ -0,0 +1,17 @@
+import time
+from django.core.management.base import BaseCommand
+from services.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for every book and extracted page (backfill, or after renaming tags/categories)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per UPDATE on Postgres")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        counts = get_search_backend().rebuild(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+        summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Indexed {summary} in {elapsed:.1f}s"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+from api.models.jobs import Job
+
+
+class Command(BaseCommand):
+    help = "List or requeue dead-lettered background jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--name", help="Only jobs of this task")
+        parser.add_argument("--list", action="store_true", help="Show dead jobs instead of requeueing them")
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.filter(status="dead")
+        if options["name"]:
+            jobs = jobs.filter(name=options["name"])
+
+        if options["list"]:
+            for job in jobs.order_by("finished_at")[:100]:
+                error = job.last_error.strip().splitlines()[-1] if job.last_error else ""
+                self.stdout.write(f"{job.pk} {job.name} {job.finished_at:%Y-%m-%d %H:%M} {error}")
+            return
+
+        count = jobs.update(status="queued", attempts=0, run_at=now(), finished_at=None)
+        self.stdout.write(self.style.SUCCESS(f"Requeued {count} dead jobs"))
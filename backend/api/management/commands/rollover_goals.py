@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from services.goal_rollover import GoalRolloverService
+
+
+class Command(BaseCommand):
+    help = "Roll over daily goals whose owners' local midnight has passed (workers also run this every ROLLOVER_INTERVAL_MINUTES). Safe to rerun."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, help="User ids per transaction (default ROLLOVER_CHUNK_SIZE)")
+        parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an interrupted run and start from the lowest user id")
+
+    def handle(self, *args, **options):
+        report = GoalRolloverService.run(chunk_size=options["chunk_size"], restart=options["restart"])
+        if report["resumed_from"] is not None:
+            self.stdout.write(f"Resumed after user id {report['resumed_from']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Rolled over {report['rolled_over']} goals in {report['chunks']} chunks, "
+            f"{report['seconds']}s ({report['goals_per_second']} goals/s)"
+        ))
@@ -0,0 +1,30 @@
+import importlib
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.mail import close_pools
+from core.tasks import Worker
+
+
+class Command(BaseCommand):
+    help = "Run a background job worker (see core.tasks). Start several for more throughput."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queue", default="default", help="Queue to consume")
+        parser.add_argument("--batch-size", type=int, default=10, help="Jobs claimed per round trip")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when the queue is empty")
+        parser.add_argument("--burst", action="store_true", help="Exit once no job is due")
+        parser.add_argument("--max-jobs", type=int, help="Exit after this many jobs")
+
+    def handle(self, *args, **options):
+        for module in settings.JOB_TASK_MODULES:
+            importlib.import_module(module)  # 🔥 Tasks register themselves on import
+
+        worker = Worker(options["queue"], batch_size=options["batch_size"], poll_interval=options["poll_interval"])
+        self.stdout.write(f"Worker {worker.worker_id} consuming '{options['queue']}'")
+        try:
+            worker.run(burst=options["burst"], max_jobs=options["max_jobs"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            close_pools()  # ✅ QUIT pooled SMTP connections instead of dropping them
+        self.stdout.write(f"Processed {worker.processed} jobs, {worker.failed} failed")
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from api.models.badge import Badge
+from core import catalog
 
 BADGES = [
     {"name": "First Streak", "description": "Read for 2 days in a row", "streak_required": 2},
@@ -26,3 +27,4 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.SUCCESS(f"Badge created: {badge.name}"))
             else:
                 self.stdout.write(self.style.WARNING(f"Badge already exists: {badge.name}"))
+        catalog.badges.invalidate()  # ✅ Republish even when nothing was created, e.g. after a cache flush
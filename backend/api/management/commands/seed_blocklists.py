@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from api.models.blocklists import BlocklistCategory, BlocklistEntry, BlocklistExclusion
+from api.models.focus import BlockedApp, BlockedWebsite
+from core import catalog
+from core.blocklists import CURATED_BLOCKLISTS
+from core.domains import parse_rule
+
+
+class Command(BaseCommand):
+    help = "Seed the curated blocklist catalog (core.blocklists) into the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fold-user-rows", action="store_true",
+            help="Delete users' own blocked apps/websites that a category they subscribe to already blocks",
+        )
+
+    def handle(self, *args, **options):
+        for data in CURATED_BLOCKLISTS:
+            with transaction.atomic():
+                category, created = BlocklistCategory.objects.update_or_create(
+                    slug=data["slug"], defaults={"name": data["name"], "description": data["description"]},
+                )
+                counts = self.sync_entries(category, {
+                    **{("app", package): name for package, name in data["apps"]},
+                    **{("website", website): "" for website in data["websites"]},
+                })
+            label = "created" if created else "updated"
+            self.stdout.write(self.style.SUCCESS(
+                f"Category {label}: {category.slug} ({counts['created']} entries created, "
+                f"{counts['updated']} renamed, {counts['deleted']} removed)"
+            ))
+        # ✅ Republish even when nothing was created, e.g. after a cache flush
+        catalog.blocklist_categories.invalidate()
+        catalog.blocklist_entries.invalidate()
+
+        if options["fold_user_rows"]:
+            for model, field, kind in ((BlockedApp, "package_name", "app"), (BlockedWebsite, "url", "website")):
+                deleted = self.fold(model, field, kind)
+                self.stdout.write(f"Folded {deleted} {model.__name__} rows into subscriptions")
+
+    def sync_entries(self, category, wanted):
+        """Makes `wanted` ({(kind, value): name}) the category's entries; returns what changed."""
+        existing = {
+            (kind, value): (pk, name)
+            for pk, kind, value, name in BlocklistEntry.objects.filter(category=category).values_list("pk", "kind", "value", "name")
+        }
+        created = [key for key in wanted if key not in existing]
+        renamed = [key for key in wanted if key in existing and existing[key][1] != wanted[key]]
+        stale = [pk for key, (pk, _) in existing.items() if key not in wanted]
+        if created or renamed:
+            BlocklistEntry.objects.bulk_create(
+                [BlocklistEntry(category=category, kind=kind, value=value, name=wanted[kind, value]) for kind, value in created + renamed],
+                update_conflicts=True, unique_fields=["category", "kind", "value"], update_fields=["name"],
+            )
+        if stale:
+            BlocklistEntry.objects.filter(pk__in=stale).delete()
+        return {"created": len(created), "updated": len(renamed), "deleted": len(stale)}
+
+    def fold(self, model, field, kind):
+        """
+        Deletes own rows a subscribed category already blocks, except those the
+        user also excludes: the profile always blocks own rows but drops
+        excluded curated entries, so folding those would unblock them.
+        """
+        covered = BlocklistEntry.objects.filter(kind=kind, value=OuterRef(field), category__subscriptions__user=OuterRef("user"))
+        rows = list(model.objects.filter(Exists(covered)).values_list("pk", "user_id", field))
+        key = (lambda value: parse_rule(value)[0]) if kind == "website" else (lambda value: value)  # 🔥 Websites are excluded by host
+        excluded = {
+            (user_id, key(value))
+            for user_id, value in BlocklistExclusion.objects.filter(kind=kind, user_id__in={user_id for _, user_id, _ in rows}).values_list("user_id", "value")
+        }
+        folded = [pk for pk, user_id, value in rows if (user_id, key(value)) not in excluded]
+        deleted, _ = model.objects.filter(pk__in=folded).delete()
+        return deleted
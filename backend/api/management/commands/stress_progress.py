@@ -0,0 +1,84 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from api.models.reading import ReadingGoal, ReadingHistory
+from api.models.user import User
+from core.timezones import local_date
+
+
+class Command(BaseCommand):
+    help = "Hammer one reading goal with parallel progress writers and check no increment is lost and it completes exactly once."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=100, help="Parallel writers (threads, one DB connection each)")
+        parser.add_argument("--updates", type=int, default=20, help="Progress updates per writer")
+        parser.add_argument("--legacy", action="store_true", help="Also run the old load / += / save() path for comparison")
+
+    def handle(self, *args, **options):
+        writers, updates = options["writers"], options["updates"]
+        total = writers * updates
+        user = User.objects.create_user(email="stress-progress@example.com", password="unused-password")
+        try:
+            if options["legacy"]:
+                self.reset(user, total)
+                self.run(writers, updates, self.legacy_update, user.pk)
+                progress = ReadingGoal.objects.get(user=user).progress
+                self.stdout.write(f"{'legacy':<8} progress {progress}/{total}, {total - progress} increments lost")
+
+            self.reset(user, total)
+            elapsed, completions = self.run(writers, updates, self.atomic_update, user.pk)
+            goal = ReadingGoal.objects.get(user=user)
+            history = ReadingHistory.objects.filter(user=user, date=local_date(user.timezone)).count()
+            self.stdout.write(
+                f"{'atomic':<8} progress {goal.progress}/{total}, {total - goal.progress} increments lost, "
+                f"{completions} completions, streak {goal.streak_count}, {total / elapsed:.0f} updates/s"
+            )
+
+            problems = []
+            if goal.progress != total:
+                problems.append(f"lost {total - goal.progress} increments")
+            if completions != 1 or history != 1:
+                problems.append(f"completed {completions} times with {history} history rows")
+            if goal.streak_count != 5 or goal.longest_streak != 5:
+                problems.append(f"streak {goal.streak_count} / longest {goal.longest_streak}, expected 5")
+            if problems:
+                raise CommandError("; ".join(problems))
+            self.stdout.write(self.style.SUCCESS("No lost updates, exactly one completion"))
+        finally:
+            user.delete()
+
+    def reset(self, user, total):
+        """Goal completes halfway through the run; yesterday's completion makes it day 5 of a streak."""
+        ReadingHistory.objects.filter(user=user).delete()
+        ReadingGoal.objects.update_or_create(user=user, defaults={
+            "goal_target": total // 2, "progress": 0, "is_completed": False,
+            "streak_count": 4, "longest_streak": 4, "last_completed_date": local_date(user.timezone) - timedelta(days=1),
+        })
+
+    def run(self, writers, updates, update, user_id):
+        barrier = threading.Barrier(writers)
+
+        def writer():
+            try:
+                barrier.wait()  # 🔥 Start everyone together for maximum contention
+                return sum(update(user_id) for _ in range(updates))
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            completions = sum(pool.map(lambda _: writer(), range(writers)))
+        return time.perf_counter() - started, completions
+
+    def atomic_update(self, user_id):
+        goal, just_completed = ReadingGoal.objects.add_progress(user_id, 1)
+        return just_completed
+
+    def legacy_update(self, user_id):
+        goal = ReadingGoal.objects.get(user_id=user_id)
+        goal.progress += 1
+        goal.save()
+        return False
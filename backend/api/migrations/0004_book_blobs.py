@@ -0,0 +1,62 @@
+# Generated by Django 5.2 on 2026-10-18 04:45
+
+import api.models.book
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_blobs(apps, schema_editor):
+    """Give every existing book a blob that points at the file it already has."""
+    Book = apps.get_model('api', 'Book')
+    BookBlob = apps.get_model('api', 'BookBlob')
+
+    for book in Book.objects.exclude(file_hash='').filter(blob__isnull=True).iterator():
+        blob, created = BookBlob.objects.get_or_create(
+            sha256=book.file_hash,
+            defaults={'file': book.file.name},
+        )
+        if created and book.file:
+            try:
+                blob.size = book.file.size
+            except OSError:
+                blob.size = 0
+        blob.ref_count += 1
+        blob.save(update_fields=['size', 'ref_count'])
+        book.blob = blob
+        book.save(update_fields=['blob'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_user_first_login_user_profile_image_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file', models.FileField(upload_to=api.models.book.blob_upload_to)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='file_hash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='books', to='api.bookblob'),
+        ),
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.UniqueConstraint(condition=models.Q(('file_hash', ''), _negated=True), fields=('user', 'file_hash'), name='unique_book_file_per_user'),
+        ),
+        migrations.RunPython(backfill_blobs, migrations.RunPython.noop),
+    ]
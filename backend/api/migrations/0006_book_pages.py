@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-18 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bookblob',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='bookblob',
+            name='text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('ready', 'Ready'), ('failed', 'Failed'), ('unsupported', 'Unsupported')], default='pending', max_length=12),
+        ),
+        migrations.CreateModel(
+            name='BookPage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('text', models.TextField(blank=True, default='')),
+                ('blob', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pages', to='api.bookblob')),
+            ],
+            options={
+                'unique_together': {('blob', 'number')},
+            },
+        ),
+    ]
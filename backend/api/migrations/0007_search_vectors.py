@@ -0,0 +1,55 @@
+# Generated by Django 5.2 on 2026-10-18 04:52
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_INDEXES = [
+    ('book', django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='book_search_gin')),
+    ('bookpage', django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='bookpage_search_gin')),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    """GIN indexes only exist on Postgres; other databases use the in-process index."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, index in SEARCH_INDEXES:
+        schema_editor.add_index(apps.get_model('api', model_name), index)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, index in SEARCH_INDEXES:
+        schema_editor.remove_index(apps.get_model('api', model_name), index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_book_pages'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='bookpage',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in SEARCH_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_indexes, drop_search_indexes),
+            ],
+        ),
+    ]
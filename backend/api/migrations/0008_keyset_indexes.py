@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-18 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['uploaded_at', 'id'], name='book_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookmark',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='bookmark_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='highlight',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='highlight_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readingsession',
+            index=models.Index(fields=['user', 'start_time', 'id'], name='readingsession_user_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userbadge',
+            index=models.Index(fields=['user', 'earned_at', 'id'], name='userbadge_user_earned_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userreward',
+            index=models.Index(fields=['user', 'earned_at', 'id'], name='userreward_user_earned_idx'),
+        ),
+    ]
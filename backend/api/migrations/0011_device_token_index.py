@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 05:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_jobs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='device_token',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+    ]
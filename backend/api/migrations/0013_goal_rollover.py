@@ -0,0 +1,47 @@
+# Generated by Django 5.2 on 2026-10-18 05:30
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def backfill_progress_dates(apps, schema_editor):
+    """Existing progress counts toward the (UTC) day it was last updated, so today's survives the first rollover."""
+    ReadingGoal = apps.get_model("api", "ReadingGoal")
+    ReadingGoal.objects.update(progress_date=TruncDate("last_updated"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_offline_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Checkpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('position', models.BigIntegerField(default=0)),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='unique_key',
+            field=models.CharField(blank=True, max_length=150, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='readinggoal',
+            name='progress_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_progress_dates, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='user',
+            name='timezone',
+            field=models.CharField(db_index=True, default='UTC', max_length=64),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-18 05:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_goal_rollover'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimezoneDayBoundary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timezone', models.CharField(max_length=64)),
+                ('date', models.DateField()),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['timezone', 'starts_at'], name='tzday_zone_start_idx')],
+                'unique_together': {('timezone', 'date')},
+            },
+        ),
+    ]
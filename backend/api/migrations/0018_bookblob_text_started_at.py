@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_blocklist_catalog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bookblob',
+            name='text_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -5,4 +5,12 @@ from .book import Book
 from .reading import ReadingGoal, ReadingHistory
 from .badge import Badge, UserBadge
 from .rewards import Reward, UserReward
-from .bookmark import Bookmark, Highlight
\ No newline at end of file
+from .bookmark import Bookmark, Highlight
+from .upload import UploadSession
+from .stats import ReadingStats, DailyReadingStats
+from .jobs import Job, Checkpoint
+from .sync import SyncEvent
+from .timezones import TimezoneDayBoundary
+from .calendar import ReadingCalendar
+from .leaderboard import LeaderboardEntry, LeaderboardBucket
+from .blocklists import BlocklistCategory, BlocklistEntry, BlocklistSubscription, BlocklistExclusion
@@ -1,7 +1,9 @@
-from django.db import models
+from django.apps import apps
+from django.db import connection, models, transaction
 from django.conf import settings
 from django.utils.timezone import now
-from core.notifications import send_push_notification, send_email_notification
+from core import catalog
+from core.notifications import send_email_notification_batch, send_push_notification_batch
 from api.models.rewards import Reward, UserReward
 
 class Badge(models.Model):
@@ -17,6 +19,94 @@ class Badge(models.Model):
         return f"{self.name} - {self.streak_required} Days"
 
 
+class UserBadgeManager(models.Manager):
+    """
+    Set-based badge awarding: a fixed number of queries however many users and badges are involved.
+    """
+
+    def award_missing(self, user_ids=None, user_id_range=None):
+        """
+        Awards every badge the given users qualify for but don't hold yet, with
+        their rewards and notifications. Pass `user_ids`, or `user_id_range` as
+        (after, up_to) for chunked runs over all users.
+
+        Qualification uses `longest_streak`, so a badge missed while a streak
+        was live is still awarded after it resets. The users' goal rows are
+        locked first, so concurrent evaluations of one user serialize. Awards
+        are inserted with ON CONFLICT DO NOTHING RETURNING, so only rows this
+        call actually inserted are notified, even when another writer (e.g.
+        `UserBadge.save`) got there first. Returns the (user_id, badge_id) pairs awarded.
+        """
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            if not user_ids:
+                return []
+            condition, params = f"IN ({', '.join(['%s'] * len(user_ids))})", user_ids
+        else:
+            condition, params = "> %s AND g.user_id <= %s", list(user_id_range)
+
+        ReadingGoal = apps.get_model("api", "ReadingGoal")
+        quote = connection.ops.quote_name
+        sql = f"""
+            INSERT INTO {quote(self.model._meta.db_table)} (user_id, badge_id, earned_at)
+            SELECT g.user_id, b.id, %s
+            FROM {quote(ReadingGoal._meta.db_table)} g
+            JOIN {quote(Badge._meta.db_table)} b ON b.streak_required <= g.longest_streak
+            WHERE g.user_id {condition}
+            AND NOT EXISTS (
+                SELECT 1 FROM {quote(self.model._meta.db_table)} ub
+                WHERE ub.user_id = g.user_id AND ub.badge_id = b.id
+            )
+            ON CONFLICT (user_id, badge_id) DO NOTHING
+            RETURNING user_id, badge_id
+        """
+
+        with transaction.atomic():
+            goals = ReadingGoal.objects.select_for_update()
+            goals = goals.filter(user_id__in=user_ids) if user_ids is not None else goals.filter(
+                user_id__gt=user_id_range[0], user_id__lte=user_id_range[1]
+            )
+            list(goals.values_list("pk", flat=True))
+
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [now(), *params])  # 🔥 One anti-join insert instead of an exists() per badge
+                inserted = cursor.fetchall()
+            badges = [(user_id, catalog.badges.get(badge_id) or Badge.objects.get(pk=badge_id)) for user_id, badge_id in inserted]
+            badges.sort(key=lambda award: (award[0], award[1].streak_required))  # ✅ RETURNING order is unspecified
+            awards = [(user_id, badge.pk, badge.name) for user_id, badge in badges]
+            if awards:
+                self.granted(awards)
+        return [(user_id, badge_id) for user_id, badge_id, _ in awards]
+
+    def granted(self, awards):
+        """
+        Follow-up for newly inserted (user_id, badge_id, badge_name) awards: unlocks
+        their rewards (looked up in the catalog cache) with one insert, and queues
+        the notifications in batch. Runs in the caller's transaction, so nothing is sent for a rollback.
+        """
+        User = apps.get_model(settings.AUTH_USER_MODEL)
+        rewards = catalog.rewards.derive("by_badge", lambda rows: {row.badge_id: row for row in rows})
+        UserReward.objects.bulk_create([
+            UserReward(user_id=user_id, reward=rewards[badge_id]) for user_id, badge_id, _ in awards if badge_id in rewards
+        ], ignore_conflicts=True)
+
+        contacts = {
+            pk: (email, device_token)
+            for pk, email, device_token in User.objects.filter(pk__in={user_id for user_id, _, _ in awards}).values_list("pk", "email", "device_token")
+        }
+        pushes, emails = [], []
+        for user_id, badge_id, badge_name in awards:
+            email, device_token = contacts[user_id]
+            message = f"🎉 Congratulations! You earned the '{badge_name}' badge!"
+            emails.append((email, "New Badge Earned!", message))
+            if device_token:  # ✅ Skip if user has no push notification token
+                pushes.append((user_id, "New Achievement!", message))
+                if badge_id in rewards:
+                    pushes.append((user_id, "New Achievement!", f"🎁 You unlocked a reward: {rewards[badge_id].description}!"))
+        send_push_notification_batch(pushes)
+        send_email_notification_batch(emails)
+
+
 class UserBadge(models.Model):
     """
     Stores badges earned by users.
@@ -25,29 +115,25 @@ class UserBadge(models.Model):
     badge = models.ForeignKey(Badge, on_delete=models.CASCADE)
     earned_at = models.DateTimeField(auto_now_add=True)
 
+    objects = UserBadgeManager()
+
     class Meta:
         unique_together = ("user", "badge")  # 🔥 Prevents duplicate badges
+        indexes = [models.Index(fields=["user", "earned_at", "id"], name="userbadge_user_earned_idx")]  # 🔥 Keyset pages
 
 
    
     def save(self, *args, **kwargs):
         """
         Override save method to send notifications and assign rewards.
+        Bulk awarding goes through `UserBadge.objects.award_missing` instead.
         """
         is_new = self.pk is None
-        super().save(*args, **kwargs)
-
-        if is_new:
-            message = f"🎉 Congratulations! You earned the '{self.badge.name}' badge!"
-            send_push_notification(self.user, message)
-            send_email_notification(self.user.email, "New Badge Earned!", message)
-
-            # 🔥 Check if this badge unlocks a reward
-            reward = Reward.objects.filter(badge=self.badge).first()
-            if reward:
-                UserReward.objects.create(user=self.user, reward=reward)
-                send_push_notification(self.user, f"🎁 You unlocked a reward: {reward.description}!")
-
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_new:
+                badge = catalog.badges.get(self.badge_id) or self.badge
+                UserBadge.objects.granted([(self.user_id, self.badge_id, badge.name)])
 
     def __str__(self):
         return f"{self.user.email} - {self.badge.name}"
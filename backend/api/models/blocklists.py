@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.db import models
+
+
+class BlocklistCategory(models.Model):
+    """A shared, curated group of apps and websites users can subscribe to (e.g. "social")."""
+    slug = models.SlugField(max_length=50, unique=True)
+    name = models.CharField(max_length=100)
+    description = models.CharField(max_length=255, blank=True)
+
+    def __str__(self):
+        return self.name
+
+
+class BlocklistEntry(models.Model):
+    """One app package or website rule (see core.domains.parse_rule) in a curated category."""
+    KINDS = [
+        ("app", "App"),
+        ("website", "Website"),
+    ]
+
+    category = models.ForeignKey(BlocklistCategory, on_delete=models.CASCADE, related_name="entries")
+    kind = models.CharField(max_length=10, choices=KINDS)
+    value = models.CharField(max_length=255)  # 🔥 Package name for apps, domain rule for websites
+    name = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        unique_together = ("category", "kind", "value")
+
+    def __str__(self):
+        return f"{self.category_id}: {self.kind} {self.value}"
+
+
+class BlocklistSubscription(models.Model):
+    """A user blocking everything in a curated category."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    category = models.ForeignKey(BlocklistCategory, on_delete=models.CASCADE, related_name="subscriptions")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("user", "category")
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.category_id}"
+
+
+class BlocklistExclusion(models.Model):
+    """An app or website a user keeps reachable although a subscribed category blocks it."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    kind = models.CharField(max_length=10, choices=BlocklistEntry.KINDS)
+    value = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("user", "kind", "value")
+
+    def __str__(self):
+        return f"{self.user_id} keeps {self.kind} {self.value}"
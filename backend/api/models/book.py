@@ -1,6 +1,11 @@
 import hashlib
-from django.db import models
+import os
+import threading
+from contextlib import contextmanager
+from django.db import models, transaction
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 
 
@@ -20,32 +25,177 @@ class Tag(models.Model):
         return self.name
 
 
+def blob_upload_to(instance, filename):
+    """Fan blobs out over two directory levels so no single directory grows huge."""
+    digest = instance.sha256
+    extension = os.path.splitext(filename)[1].lower()
+    return f"blobs/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+
+_storing = threading.local()
+
+
+class BookBlobManager(models.Manager):
+    """
+    Reference-counted access to content-addressed book files.
+
+    Files follow their rows: a file `acquire` wrote is removed again if the
+    surrounding `storing()` block rolls back, and a released blob's file is
+    only deleted once the delete of its row has committed.
+    """
+
+    @contextmanager
+    def storing(self):
+        """
+        An atomic block whose rollback removes the files `acquire` wrote inside
+        it. Blocks nest: an inner block that commits hands its files to the
+        enclosing one, so they still go if that one rolls back.
+        """
+        stack = _storing.__dict__.setdefault("stack", [])
+        written = []
+        stack.append(written)
+        try:
+            with transaction.atomic():
+                yield
+        except BaseException:
+            storage = self.model._meta.get_field("file").storage
+            for name in written:
+                storage.delete(name)
+            raise
+        else:
+            if len(stack) > 1:
+                stack[-2].extend(written)
+        finally:
+            stack.pop()
+
+    def acquire(self, content, sha256=""):
+        """
+        Returns the blob holding `content`, storing it only if no blob has these bytes yet,
+        and takes one reference on it. Run it inside the caller's `storing()` block, so a
+        rollback of the caller's transaction does not leave the new file behind.
+        """
+        if not sha256:
+            hasher = hashlib.sha256()
+            for chunk in content.chunks():
+                hasher.update(chunk)
+            sha256 = hasher.hexdigest()
+
+        with self.storing():
+            blob, created = self.select_for_update().get_or_create(
+                sha256=sha256, defaults={"size": content.size}
+            )
+            # 🔥 Only the first copy of these bytes is written; a lost file is restored by the next upload
+            if created or not blob.file.storage.exists(blob.file.name):
+                blob.file.save(content.name, content, save=False)
+                _storing.stack[-1].append(blob.file.name)
+            blob.ref_count += 1
+            blob.save(update_fields=["file", "ref_count"])
+        return blob
+
+    def release(self, blob_id):
+        """
+        Drops one reference and deletes the blob once nothing points at it; its
+        file goes once that commits, so a rollback never leaves a row without a file.
+        """
+        with transaction.atomic():
+            blob = self.select_for_update().filter(pk=blob_id).first()
+            if not blob:
+                return
+
+            blob.ref_count = max(0, blob.ref_count - 1)
+            if blob.ref_count:
+                blob.save(update_fields=["ref_count"])
+                return
+
+            storage, name = blob.file.storage, blob.file.name
+            blob.delete()
+            # 🔥 An upload of the same bytes in between finds the name taken and stores its file under another
+            transaction.on_commit(lambda: storage.delete(name))
+
+
+class BookBlob(models.Model):
+    """Content-addressed book file shared by every Book with the same SHA-256."""
+
+    TEXT_STATUSES = [
+        ("pending", "Pending"),
+        ("processing", "Processing"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+        ("unsupported", "Unsupported"),
+    ]
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to=blob_upload_to)
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    page_count = models.PositiveIntegerField(null=True, blank=True)  # 🔥 Known once text extraction finishes
+    text_status = models.CharField(max_length=12, choices=TEXT_STATUSES, default="pending")
+    text_started_at = models.DateTimeField(null=True, blank=True)  # 🔥 When the current extraction claimed the blob
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = BookBlobManager()
+
+    def __str__(self):
+        return f"{self.sha256} ({self.ref_count} refs)"
+
+
+class BookPage(models.Model):
+    """Extracted text of one page, stored per blob so shared files are extracted once."""
+    blob = models.ForeignKey(BookBlob, on_delete=models.CASCADE, related_name="pages")
+    number = models.PositiveIntegerField()  # 🔥 1-based, matching the reader's page numbers
+    text = models.TextField(blank=True, default="")
+    search_vector = SearchVectorField(null=True, editable=False)  # 🔥 Maintained by services.search
+
+    class Meta:
+        unique_together = ("blob", "number")
+        indexes = [GinIndex(fields=["search_vector"], name="bookpage_search_gin")]
+
+    def __str__(self):
+        return f"{self.blob.sha256[:12]} - Page {self.number}"
+
+
 class Book(models.Model):
     """Model to store uploaded books and prevent duplicates."""
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
     author = models.CharField(max_length=255, blank=True, default="")
     file = models.FileField(upload_to="books/")
-    file_hash = models.CharField(max_length=64, unique=True, blank=True, default="")  # ✅ Prevent duplicates, no NULL
+    file_hash = models.CharField(max_length=64, db_index=True, blank=True, default="")  # ✅ No NULL
+    blob = models.ForeignKey(BookBlob, on_delete=models.PROTECT, null=True, blank=True, related_name="books")
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True)
     tags = models.ManyToManyField(Tag, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    search_vector = SearchVectorField(null=True, editable=False)  # 🔥 Weighted title/author/tags/category, see services.search
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="book_search_gin"),
+            models.Index(fields=["uploaded_at", "id"], name="book_uploaded_idx"),  # 🔥 Keyset pages of the catalogue
+        ]
+        constraints = [
+            # 🔥 Different users may share the same bytes, but nobody uploads the same book twice
+            models.UniqueConstraint(
+                fields=["user", "file_hash"],
+                condition=~models.Q(file_hash=""),
+                name="unique_book_file_per_user",
+            ),
+        ]
 
     def clean(self):
         """Check for duplicate books before saving."""
-        if self.file:
-            self.file_hash = self.calculate_file_hash()
-    
-            # ✅ Instead of raising ValueError, use Django's validation system
-            if Book.objects.filter(file_hash=self.file_hash).exists():
-                raise ValidationError("This book has already been uploaded.")
-        else:
+        if not self.file:
             raise ValidationError("File is required to calculate the file hash.")
 
+        # ✅ Uploads arrive with the digest computed while streaming; only hash files that came without one
+        if not self.file_hash:
+            self.file_hash = self.calculate_file_hash()
+
+        # ✅ Instead of raising ValueError, use Django's validation system
+        if Book.objects.filter(user_id=self.user_id, file_hash=self.file_hash).exclude(pk=self.pk).exists():
+            raise ValidationError("This book has already been uploaded.")
+
     def save(self, *args, **kwargs):
         """Override save method to calculate file hash and prevent duplicates."""
-        if not self.file_hash and self.file:
-            self.file_hash = self.calculate_file_hash()
         self.clean()  # ✅ Ensure validation is called before saving
         super().save(*args, **kwargs)
 
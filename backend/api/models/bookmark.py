@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils.timezone import now
 from api.models.book import Book
 
 class Bookmark(models.Model):
@@ -11,10 +12,11 @@ class Bookmark(models.Model):
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
     page_number = models.PositiveIntegerField()
     note = models.TextField(blank=True, null=True)  # Optional user note
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=now)  # 🔥 Synced offline rows keep their client time
 
     class Meta:
         unique_together = ("user", "book", "page_number")  # 🔥 Prevent duplicate bookmarks
+        indexes = [models.Index(fields=["user", "created_at", "id"], name="bookmark_user_created_idx")]  # 🔥 Keyset pages
 
     def __str__(self):
         return f"Bookmark - {self.book.title} (Page {self.page_number})"
@@ -30,10 +32,11 @@ class Highlight(models.Model):
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
     page_number = models.PositiveIntegerField()
     text = models.TextField()  # 🔥 The highlighted text
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=now)  # 🔥 Synced offline rows keep their client time
 
     class Meta:
         ordering = ["page_number", "created_at"]  # 🔥 Order highlights by page & time
+        indexes = [models.Index(fields=["user", "created_at", "id"], name="highlight_user_created_idx")]  # 🔥 Keyset pages
 
     def __str__(self):
         return f"Highlight - {self.book.title} (Page {self.page_number}): {self.text[:30]}..."
\ No newline at end of file
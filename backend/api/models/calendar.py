@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+from django.conf import settings
+from django.db import models, transaction
+
+CALENDAR_BYTES = 46  # 🔥 366 bits: bit n is day n of the year (January 1st is bit 0)
+
+
+def day_index(day):
+    return day.timetuple().tm_yday - 1
+
+
+def days_in_year(year):
+    return (date(year + 1, 1, 1) - date(year, 1, 1)).days
+
+
+class ReadingDays:
+    """
+    The days a user completed their goal, as one int bitmap per year, with
+    popcount and shift arithmetic for counts and streaks instead of row scans.
+    """
+
+    def __init__(self, calendars):
+        self.years = {calendar.year: calendar.bits for calendar in calendars}
+
+    def read(self, day):
+        return bool(self.years.get(day.year, 0) >> day_index(day) & 1)
+
+    def count(self, first, last):
+        """Days read from `first` to `last`, inclusive."""
+        total = 0
+        for year in range(first.year, last.year + 1):
+            start = day_index(first) if year == first.year else 0
+            end = day_index(last) if year == last.year else days_in_year(year) - 1
+            total += (self.years.get(year, 0) >> start & ((1 << (end - start + 1)) - 1)).bit_count()
+        return total
+
+    def streak_ending(self, day):
+        """Consecutive days read up to and including `day` (0 if `day` itself was not read)."""
+        length, index, year = 0, day_index(day), day.year
+        while True:
+            misses = ~self.years.get(year, 0) & ((1 << (index + 1)) - 1)
+            if misses:
+                return length + index + 1 - misses.bit_length()  # 🔥 Ones above the highest unread day
+            length += index + 1
+            year -= 1
+            index = days_in_year(year) - 1  # ✅ Read since January 1st: carry on into December
+
+    def current_streak(self, today):
+        """The streak as of `today`: still alive if the last read day is today or yesterday."""
+        return self.streak_ending(today) or self.streak_ending(today - timedelta(days=1))
+
+    def longest_streak(self, year):
+        """Longest run of read days within `year`."""
+        bits, length = self.years.get(year, 0), 0
+        while bits:
+            bits &= bits >> 1  # 🔥 Each step shortens every run by one
+            length += 1
+        return length
+
+    def heatmap(self, year):
+        """One character per day of `year`, "1" for read."""
+        bits = self.years.get(year, 0)
+        return "".join("1" if bits >> index & 1 else "0" for index in range(days_in_year(year)))
+
+
+class ReadingCalendarManager(models.Manager):
+    def mark(self, user_id, day):
+        """Records that the user completed their goal on `day`."""
+        with transaction.atomic():
+            calendar, _ = self.select_for_update().get_or_create(user_id=user_id, year=day.year)
+            if not calendar.bits >> day_index(day) & 1:
+                calendar.bits |= 1 << day_index(day)
+                calendar.save(update_fields=["days"])
+
+    def days_for(self, user_id):
+        """All of the user's years in one query (a few dozen bytes each)."""
+        return ReadingDays(self.filter(user_id=user_id))
+
+
+class ReadingCalendar(models.Model):
+    """
+    One user's completed days for one year as a 366-bit map, kept alongside
+    ReadingHistory so calendars, heatmaps and streaks are one small read.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    year = models.PositiveSmallIntegerField()
+    days = models.BinaryField(max_length=CALENDAR_BYTES, default=bytes(CALENDAR_BYTES))
+
+    objects = ReadingCalendarManager()
+
+    class Meta:
+        unique_together = ("user", "year")
+
+    @property
+    def bits(self):
+        return int.from_bytes(bytes(self.days), "little")
+
+    @bits.setter
+    def bits(self, value):
+        self.days = value.to_bytes(CALENDAR_BYTES, "little")
+
+    def __str__(self):
+        return f"{self.user_id} - {self.year}: {self.bits.bit_count()} days"
@@ -1,6 +1,7 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.utils.timezone import now, timedelta
+from api.models.stats import ReadingStats
 
 User = get_user_model()
 
@@ -8,7 +9,7 @@ class ReadingSession(models.Model):
     
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     book_id = models.CharField(max_length=255)  # Track what book user is reading
-    start_time = models.DateTimeField(auto_now_add=True)
+    start_time = models.DateTimeField(default=now)  # 🔥 Not auto_now_add: synced offline sessions keep their client time
     end_time = models.DateTimeField(null=True, blank=True)
     reading_duration = models.PositiveIntegerField()  # Tracks reading duration
     completed = models.BooleanField(default=False)
@@ -16,6 +17,8 @@ class ReadingSession(models.Model):
     focus_score = models.PositiveIntegerField(default=100)
     hard_lock = models.BooleanField(default=False) 
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "start_time", "id"], name="readingsession_user_start_idx")]  # 🔥 Keyset pages
 
     def calculate_focus_score(self):
         """Calculate focus score based on reading session and interruptions."""
@@ -28,7 +31,7 @@ class ReadingSession(models.Model):
         time_penalty = max(0, (expected_time - time_spent) / expected_time * 50)
         interruption_penalty = min(50, self.interruptions * 10)
 
-        self.focus_score = max(0, 100 - (time_penalty + interruption_penalty))
+        self.focus_score = round(max(0, 100 - (time_penalty + interruption_penalty)))  # ✅ Stored as an integer
         return self.focus_score
 
     def end_session(self):
@@ -42,7 +45,20 @@ class ReadingSession(models.Model):
 
         self.completed = True
         self.calculate_focus_score()
-        self.save()
+
+        with transaction.atomic():
+            if self.pk is None:
+                self.save()
+                newly_completed = True
+            else:
+                # 🔥 Only the call that flips `completed` counts the session in the aggregates
+                newly_completed = ReadingSession.objects.filter(pk=self.pk, completed=False).update(
+                    end_time=self.end_time, completed=True, focus_score=self.focus_score
+                )
+                if not newly_completed:
+                    self.save(update_fields=["end_time", "completed", "focus_score"])
+            if newly_completed:
+                ReadingStats.objects.record_session(self)
 
     def __str__(self):
         return f"{self.user.username} - {self.book_id} - {self.reading_duration} min - Score: {self.focus_score}%"
@@ -0,0 +1,56 @@
+from django.db import models
+from django.utils.timezone import now
+
+
+class Job(models.Model):
+    """
+    A unit of background work in the database-backed queue (see core.tasks).
+
+    Jobs are inserted in the caller's transaction, so they only become
+    visible to workers once the work that produced them has committed.
+    Successful jobs are deleted; jobs that exhaust their attempts stay
+    behind as `dead` for inspection and requeueing.
+    """
+
+    STATUSES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("dead", "Dead"),
+    ]
+
+    queue = models.CharField(max_length=50, default="default")
+    name = models.CharField(max_length=100)  # 🔥 Registered task name
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUSES, default="queued")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=now)  # 🔥 Not picked up before this, pushed back on each retry
+    unique_key = models.CharField(max_length=150, null=True, blank=True, unique=True)  # 🔥 Enqueued at most once, e.g. one periodic slot
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # 🔥 The worker's claim query: next due jobs of one queue
+            models.Index(fields=["queue", "status", "run_at"], name="job_claim_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status}, attempt {self.attempts}/{self.max_attempts})"
+
+
+class Checkpoint(models.Model):
+    """
+    How far a long-running, resumable job got, saved in the transaction of
+    each unit of work it commits, so a restarted run carries on from there.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    position = models.BigIntegerField(default=0)
+    started_at = models.DateTimeField(default=now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} at {self.position}"
@@ -0,0 +1,211 @@
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Sum, When
+from api.models.book import Book
+from api.models.calendar import ReadingCalendar
+
+STREAK = "streak"
+LONGEST = "longest"
+
+
+def weekly_board(day):
+    """The board of the ISO week `day` (a user's local date) falls in."""
+    year, week, _ = day.isocalendar()
+    return f"weekly:{year}-W{week:02d}"
+
+
+def category_board(category_id):
+    return f"category:{category_id}"
+
+
+class LeaderboardEntryManager(models.Manager):
+    """
+    Incremental maintenance and rank queries for the leaderboards.
+
+    Every board keeps a histogram of its scores (LeaderboardBucket) in the
+    same transaction as its entries, so a rank is one indexed sum over the
+    distinct scores above it, whatever the number of users; top N and the
+    neighbours of a user are short seeks on the (board, -score, user) index.
+    Users tied on a score share a rank (1, 2, 2, 4).
+    """
+
+    def set_scores(self, scores):
+        """
+        Applies {(board, user_id): score}; a score of 0 takes the user off that board.
+        The users' rows are locked first, so two calls creating the same entry
+        cannot both count it in the histogram.
+        """
+        if not scores:
+            return
+        user_ids = {user_id for _, user_id in scores}
+        with transaction.atomic():
+            # 🔥 select_for_update below only locks entries that exist; in id order, so callers never deadlock
+            list(get_user_model().objects.select_for_update().filter(pk__in=user_ids).order_by("pk").values_list("pk"))
+            old = {
+                (board, user_id): score
+                for board, user_id, score in self.select_for_update().filter(
+                    board__in={board for board, _ in scores}, user_id__in=user_ids,
+                ).values_list("board", "user_id", "score")
+            }
+            deltas, upserts, removed = Counter(), [], {}
+            for (board, user_id), score in scores.items():
+                before = old.get((board, user_id), 0)
+                if score == before:
+                    continue
+                if before:
+                    deltas[board, before] -= 1
+                if score:
+                    deltas[board, score] += 1
+                    upserts.append(LeaderboardEntry(board=board, user_id=user_id, score=score))
+                else:
+                    removed.setdefault(board, []).append(user_id)
+
+            if upserts:
+                self.bulk_create(upserts, update_conflicts=True, unique_fields=["board", "user"], update_fields=["score"])
+            if removed:
+                self.filter(reduce(or_, (Q(board=board, user_id__in=users) for board, users in removed.items()))).delete()
+            LeaderboardBucket.objects.apply(deltas)
+
+    def record_goal(self, goal, completed_on=None):
+        """
+        Puts the goal owner's current and longest streak on their boards (the
+        global ones and one per category of their books), plus, for a
+        completion on the local date `completed_on`, that week's reading days.
+        """
+        user_id = goal.user_id
+        scores = {(STREAK, user_id): goal.streak_count, (LONGEST, user_id): goal.longest_streak}
+        scores.update(self.category_scores(user_id, goal.streak_count))
+        if completed_on is not None:
+            week_start = completed_on - timedelta(days=completed_on.weekday())
+            days = ReadingCalendar.objects.days_for(user_id)
+            scores[weekly_board(completed_on), user_id] = days.count(week_start, week_start + timedelta(days=6))
+        self.set_scores(scores)
+
+    def category_scores(self, user_id, streak):
+        """The user's streak on the board of every category they have books in, and 0 on boards they left."""
+        categories = Book.objects.filter(user_id=user_id, category__isnull=False).values_list("category_id", flat=True).distinct()
+        scores = {(board, user_id): 0 for board in self.filter(user_id=user_id, board__startswith="category:").values_list("board", flat=True)}
+        scores.update({(category_board(category_id), user_id): streak for category_id in categories})
+        return scores
+
+    def sync_categories(self, user_id):
+        """Joins or leaves category boards after the user's books changed."""
+        from api.models.reading import ReadingGoal
+
+        streak = ReadingGoal.objects.filter(user_id=user_id).values_list("streak_count", flat=True).first() or 0
+        self.set_scores(self.category_scores(user_id, streak))
+
+    def sync_streaks(self, user_id_range):
+        """
+        Brings streak-scored boards in line with the goals of users in
+        `user_id_range` (exclusive start, inclusive end), e.g. after the
+        rollover broke their streaks. Only users whose score changed are touched.
+        """
+        start, end = user_id_range
+        stale = self.filter(
+            Q(board=STREAK) | Q(board__startswith="category:"), user_id__gt=start, user_id__lte=end,
+        ).exclude(score=F("user__readinggoal__streak_count")).values_list("board", "user_id", "user__readinggoal__streak_count")
+        self.set_scores({(board, user_id): streak or 0 for board, user_id, streak in stale})
+
+    def remove_user(self, user_id):
+        """Takes the user off every board (before their entries are deleted with them)."""
+        self.set_scores({(board, user_id): 0 for board in self.filter(user_id=user_id).values_list("board", flat=True)})
+
+    def ranked(self, board):
+        return self.filter(board=board).select_related("user").only(
+            "board", "score", "user_id", "user__username", "user__profile_image_url"
+        )
+
+    def top(self, board, limit):
+        return self.with_ranks(board, list(self.ranked(board).order_by("-score", "user_id")[:limit]))
+
+    def around(self, board, user_id, count):
+        """
+        The user's entry with up to `count` entries either side, ranked, or
+        (None, []) when the user is not on the board. Each side is at most two
+        index seeks: the rest of the user's tie, then the next scores.
+        """
+        me = self.ranked(board).filter(user_id=user_id).first()
+        if me is None:
+            return None, []
+        entries = self.ranked(board)
+        above = list(entries.filter(score=me.score, user_id__lt=user_id).order_by("-user_id")[:count])
+        if len(above) < count:
+            above += entries.filter(score__gt=me.score).order_by("score", "-user_id")[:count - len(above)]
+        below = list(entries.filter(score=me.score, user_id__gt=user_id).order_by("user_id")[:count])
+        if len(below) < count:
+            below += entries.filter(score__lt=me.score).order_by("-score", "user_id")[:count - len(below)]
+        window = self.with_ranks(board, above[::-1] + [me] + below)
+        return me, window
+
+    def with_ranks(self, board, entries):
+        """Sets `rank` on entries of one board from its histogram, in one query."""
+        if not entries:
+            return entries
+        counts = dict(
+            LeaderboardBucket.objects.filter(board=board, score__gte=min(entry.score for entry in entries)).values_list("score", "count")
+        )
+        for entry in entries:
+            entry.rank = 1 + sum(count for score, count in counts.items() if score > entry.score)
+        return entries
+
+
+class LeaderboardEntry(models.Model):
+    """
+    A user's score on one board: "streak" (current streak), "longest"
+    (longest streak), "weekly:<ISO week>" (days read that week) or
+    "category:<id>" (current streak among readers of that category).
+    Users with a score of 0 are not on the board.
+    """
+    board = models.CharField(max_length=40)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    score = models.PositiveIntegerField()
+
+    objects = LeaderboardEntryManager()
+
+    class Meta:
+        unique_together = ("board", "user")
+        indexes = [models.Index(fields=["board", "-score", "user"], name="leaderboard_rank_idx")]  # 🔥 Top N and neighbour seeks
+
+    def __str__(self):
+        return f"{self.board}: {self.user_id} = {self.score}"
+
+
+class LeaderboardBucketManager(models.Manager):
+    def apply(self, deltas):
+        """Adds {(board, score): change} to the histograms in one UPDATE, dropping emptied buckets."""
+        deltas = {key: change for key, change in deltas.items() if change}
+        if not deltas:
+            return
+        self.bulk_create([
+            LeaderboardBucket(board=board, score=score, count=0) for (board, score), change in deltas.items() if change > 0
+        ], ignore_conflicts=True)
+        buckets = self.filter(reduce(or_, (Q(board=board, score=score) for board, score in deltas)))
+        buckets.update(count=Case(
+            *[When(board=board, score=score, then=F("count") + change) for (board, score), change in deltas.items()],
+            default=F("count"), output_field=models.PositiveIntegerField(),
+        ))
+        buckets.filter(count=0).delete()
+
+    def size(self, board):
+        return self.filter(board=board).aggregate(total=Sum("count"))["total"] or 0
+
+
+class LeaderboardBucket(models.Model):
+    """How many users have each score on a board: the order statistics behind ranks."""
+    board = models.CharField(max_length=40)
+    score = models.PositiveIntegerField()
+    count = models.PositiveIntegerField(default=0)
+
+    objects = LeaderboardBucketManager()
+
+    class Meta:
+        unique_together = ("board", "score")  # 🔥 Also the index for "sum of counts above a score"
+
+    def __str__(self):
+        return f"{self.board}: {self.count} users at {self.score}"
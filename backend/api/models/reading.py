@@ -1,8 +1,135 @@
 from datetime import timedelta
-from django.db import models
+from django.db import connection, models, transaction
 from django.conf import settings
-from django.utils.timezone import now, localtime
-from api.models.badge import Badge, UserBadge
+from django.contrib.auth import get_user_model
+from django.utils.timezone import now
+from api.models.badge import UserBadge
+from api.models.calendar import ReadingCalendar
+from api.models.leaderboard import LeaderboardEntry
+from api.models.timezones import TimezoneDayBoundary
+from core import catalog
+from core.timezones import local_date
+
+
+def convert_from_db(field, value):
+    """Applies the backend and field converters a queryset would, for rows read with a raw cursor."""
+    expression = field.cached_col
+    for converter in connection.ops.get_db_converters(expression) + field.get_db_converters(connection):
+        value = converter(value, expression, connection)
+    return value
+
+
+class ReadingGoalManager(models.Manager):
+    """
+    Race-free progress ingestion.
+    """
+
+    def add_progress(self, user_id, amount, today=None):
+        """
+        Adds `amount` to the user's goal in one UPDATE ... RETURNING, so concurrent
+        writers (phone and tablet) never lose an increment.
+
+        `today` is the user's local date (looked up from their timezone if not
+        given). A goal still on an earlier day is rolled over in the same
+        statement, exactly as the rollover job would, so progress and streaks
+        are right whether or not the job has reached this user yet.
+
+        Completion and the streak transition are decided in the same statement
+        from the row's pre-update values: the goal completes when this update
+        takes progress from below the target to at least the target, which
+        happens for exactly one writer however many race. That writer records
+        the day in ReadingHistory and evaluates badges in the same transaction.
+        Returns (goal, just_completed), or (None, False) if the user has no goal.
+        """
+        if today is None:
+            today = local_date(get_user_model().objects.values_list("timezone", flat=True).get(pk=user_id))
+
+        quote = connection.ops.quote_name
+        fields = self.model._meta.concrete_fields
+        stale = "(progress_date IS NULL OR progress_date < %(today)s)"  # 🔥 Not rolled over yet: the day starts from zero
+        current = f"CASE WHEN {stale} THEN 0 ELSE progress END"
+        completes = f"{current} < goal_target AND {current} + %(amount)s >= goal_target"
+        streak = (
+            "CASE WHEN last_completed_date IS NULL THEN 1"
+            " WHEN last_completed_date = %(yesterday)s THEN streak_count + 1"  # 🔥 Completed yesterday: streak continues
+            " WHEN last_completed_date < %(yesterday)s THEN 1"
+            " ELSE streak_count END"
+        )
+        sql = f"""
+            UPDATE {quote(self.model._meta.db_table)} SET
+                progress = {current} + %(amount)s,
+                is_completed = CASE WHEN {completes} THEN %(true)s WHEN {stale} THEN %(false)s ELSE is_completed END,
+                streak_count = CASE
+                    WHEN {completes} THEN {streak}
+                    WHEN {stale} AND last_completed_date < %(yesterday)s THEN 0
+                    ELSE streak_count END,
+                longest_streak = CASE WHEN {completes} AND {streak} > longest_streak THEN {streak} ELSE longest_streak END,
+                last_completed_date = CASE WHEN {completes} THEN %(today)s ELSE last_completed_date END,
+                progress_date = %(today)s,
+                last_updated = %(now)s
+            WHERE user_id = %(user_id)s
+            RETURNING {", ".join(quote(field.column) for field in fields)}
+        """
+        params = {
+            "amount": amount, "today": today, "yesterday": today - timedelta(days=1),
+            "true": True, "false": False, "now": now(), "user_id": user_id,
+        }
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+            if row is None:
+                return None, False
+            goal = self.model.from_db(self.db, [field.attname for field in fields], [
+                convert_from_db(field, value) for field, value in zip(fields, row)
+            ])
+
+            just_completed = goal.progress - amount < goal.goal_target <= goal.progress
+            if just_completed:
+                ReadingHistory.objects.update_or_create(user_id=user_id, date=today, defaults={"streak_count": goal.streak_count})
+                ReadingCalendar.objects.mark(user_id, today)
+                LeaderboardEntry.objects.record_goal(goal, today)
+                goal.check_for_badges()
+        return goal, just_completed
+
+    def roll_over(self, user_id_range, at):
+        """
+        Starts a new day for the goals of users in `user_id_range` (exclusive
+        start, inclusive end) whose local day at `at` is later than their
+        progress_date: progress and completion are reset and a streak whose
+        last completion is older than local yesterday is broken.
+
+        One UPDATE that finds each user's day by joining their timezone to the
+        TimezoneDayBoundary rows containing `at` (and the day before it), so
+        users in every timezone are handled together without converting
+        timestamps per row. The days must be stored (core.timezones.ensure_current_days).
+        Goals already on their current day are left alone, so a rerun changes nothing.
+        Returns the number of goals rolled over.
+        """
+        quote = connection.ops.quote_name
+        goal = quote(self.model._meta.db_table)
+        user = quote(get_user_model()._meta.db_table)
+        days = quote(TimezoneDayBoundary._meta.db_table)
+        sql = f"""
+            UPDATE {goal} SET
+                progress = 0,
+                is_completed = %(false)s,
+                streak_count = CASE WHEN {goal}.last_completed_date < yesterday.date THEN 0 ELSE {goal}.streak_count END,
+                progress_date = today.date,
+                last_updated = %(now)s
+            FROM {user} owner
+            JOIN {days} today ON today.timezone = owner.timezone AND today.starts_at <= %(at)s AND today.ends_at > %(at)s
+            JOIN {days} yesterday ON yesterday.timezone = owner.timezone AND yesterday.ends_at = today.starts_at
+            WHERE owner.id = {goal}.user_id
+                AND {goal}.user_id > %(start)s AND {goal}.user_id <= %(end)s
+                AND ({goal}.progress_date IS NULL OR {goal}.progress_date < today.date)
+        """
+        start, end = user_id_range
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {"false": False, "now": now(), "at": at, "start": start, "end": end})
+            return cursor.rowcount
+
 
 class ReadingGoal(models.Model):
     """
@@ -22,28 +149,50 @@ class ReadingGoal(models.Model):
     streak_count = models.PositiveIntegerField(default=0)
     longest_streak = models.PositiveIntegerField(default=0)  # 🔥 NEW: Stores the longest streak
     last_completed_date = models.DateField(null=True, blank=True)
+    progress_date = models.DateField(null=True, blank=True)  # 🔥 Local day `progress` counts toward; advanced by the rollover
 
     created_at = models.DateTimeField(auto_now_add=True)
     last_updated = models.DateTimeField(auto_now=True)
 
+    objects = ReadingGoalManager()
+
     def update_progress(self, amount):
         """
-        Increases progress and checks if the goal is completed.
+        Increases progress atomically (see `ReadingGoalManager.add_progress`) and refreshes this instance.
+        Returns whether this update completed the goal.
         """
-        self.progress += amount
-        if self.progress >= self.goal_target and not self.is_completed:
-            self.complete_goal()
-        self.save()
+        goal, just_completed = ReadingGoal.objects.add_progress(self.user_id, amount)
+        if goal is not None:
+            for field in ("progress", "is_completed", "streak_count", "longest_streak", "last_completed_date", "progress_date", "last_updated"):
+                setattr(self, field, getattr(goal, field))
+        return just_completed
+
+    def local_today(self):
+        """The owner's current date in their timezone."""
+        return local_date(self.user.timezone)
+
+    def current_streak(self, today):
+        """
+        The streak as of the local date `today`: one whose last completion is
+        older than yesterday is already broken, whether or not the rollover
+        job has reached this user yet.
+        """
+        if self.last_completed_date is None or (today - self.last_completed_date).days > 1:
+            return 0
+        return self.streak_count
 
     def complete_goal(self):
         """
         Marks the goal as completed and updates the streak count.
         Also updates historical streak tracking.
         """
-        today = localtime(now()).date()
+        today = self.local_today()
 
-        if self.is_completed:  
+        if self.is_completed and self.progress_date == today:
             return  
+        if self.progress_date != today:
+            self.progress = 0  # 🔥 Not rolled over yet: today's progress starts from zero
+            self.progress_date = today
 
         if self.last_completed_date:
             difference = (today - self.last_completed_date).days
@@ -62,23 +211,25 @@ class ReadingGoal(models.Model):
         self.last_completed_date = today  
 
         # 🔥 Save history for tracking
-        ReadingHistory.objects.create(user=self.user, date=today, streak_count=self.streak_count)
+        ReadingHistory.objects.update_or_create(user_id=self.user_id, date=today, defaults={"streak_count": self.streak_count})
+        ReadingCalendar.objects.mark(self.user_id, today)
 
-        self.save()
+        self.save(update_fields=["progress", "progress_date", "streak_count", "longest_streak", "is_completed", "last_completed_date", "last_updated"])
+        LeaderboardEntry.objects.record_goal(self, today)
+        self.check_for_badges()
 
     def reset_goal(self):
         """
-        Resets the goal for a new day.
+        Resets the goal for a new day in the owner's timezone.
         If the user missed a day, streak is reset.
         """
-        today = localtime(now()).date()
-
-        if self.last_completed_date and (today - self.last_completed_date).days > 1:
-            self.streak_count = 0  
-
+        today = self.local_today()
+        self.streak_count = self.current_streak(today)
         self.progress = 0
         self.is_completed = False
-        self.save()
+        self.progress_date = today
+        self.save(update_fields=["progress", "is_completed", "progress_date", "streak_count", "last_updated"])
+        LeaderboardEntry.objects.record_goal(self)
 
     def __str__(self):
         return f"{self.user.email} - {self.goal_target} {self.goal_type} (Streak: {self.streak_count})"
@@ -86,12 +237,12 @@ class ReadingGoal(models.Model):
 
     def check_for_badges(self):
         """
-        Checks if user qualifies for a new badge and awards it.
+        Checks if user qualifies for new badges and awards them, with a fixed number of queries.
         """
-        eligible_badges = Badge.objects.filter(streak_required__lte=self.streak_count)
-        for badge in eligible_badges:
-            if not UserBadge.objects.filter(user=self.user, badge=badge).exists():
-                UserBadge.objects.create(user=self.user, badge=badge)
+        lowest = catalog.badges.derive("lowest_streak", lambda rows: min((row.streak_required for row in rows), default=None))
+        if lowest is None or self.longest_streak < lowest:
+            return []  # ✅ Nothing reachable yet: no queries at all
+        return UserBadge.objects.award_missing(user_ids=[self.user_id])
 
 
 
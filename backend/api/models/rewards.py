@@ -29,6 +29,7 @@ class UserReward(models.Model):
 
     class Meta:
         unique_together = ("user", "reward")
+        indexes = [models.Index(fields=["user", "earned_at", "id"], name="userreward_user_earned_idx")]  # 🔥 Keyset pages
 
     def __str__(self):
         return f"{self.user.email} - {self.reward.description}"
@@ -0,0 +1,110 @@
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F
+from core.timezones import local_date
+
+
+def session_minutes(session):
+    """Minutes actually spent in a finished session, the unit every aggregate is kept in."""
+    return max(0, round((session.end_time - session.start_time).total_seconds() / 60))
+
+
+class ReadingStatsManager(models.Manager):
+    """
+    Incremental maintenance of the per-user and per-day reading aggregates.
+    """
+
+    def record_session(self, session):
+        """
+        Folds one newly finished session into the user's totals and into the
+        rollup of the (local) day it started. See `record_sessions`.
+        """
+        self.record_sessions([session])
+
+    def record_sessions(self, sessions):
+        """
+        Folds newly finished sessions of one user into their totals and into
+        the rollups of the days they started in the user's timezone, with one F() increment per
+        touched day plus one for the totals, so concurrent sessions never lose
+        an update. Must run in the transaction that marks the sessions
+        completed, so each session is counted exactly once.
+        """
+        if not sessions:
+            return
+        user_id = sessions[0].user_id
+        timezone = sessions[0].user.timezone
+        days = {}
+        for session in sessions:
+            increments = days.setdefault(local_date(timezone, session.start_time), dict.fromkeys(
+                ("minutes", "session_count", "focus_score_total", "interruptions"), 0
+            ))
+            increments["minutes"] += session_minutes(session)
+            increments["session_count"] += 1
+            increments["focus_score_total"] += int(session.focus_score)
+            increments["interruptions"] += session.interruptions
+
+        with transaction.atomic():
+            DailyReadingStats.objects.bulk_create(
+                [DailyReadingStats(user_id=user_id, date=day) for day in days], ignore_conflicts=True
+            )
+            for day, increments in days.items():
+                DailyReadingStats.objects.filter(user_id=user_id, date=day).update(
+                    **{field: F(field) + value for field, value in increments.items()}
+                )
+            day_minutes = dict(
+                DailyReadingStats.objects.filter(user_id=user_id, date__in=days).values_list("date", "minutes")
+            )
+
+            self.get_or_create(user_id=user_id)
+            stats = self.filter(user_id=user_id)
+            stats.update(
+                total_minutes=F("total_minutes") + sum(increments["minutes"] for increments in days.values()),
+                **{
+                    field: F(field) + sum(increments[field] for increments in days.values())
+                    for field in ("session_count", "focus_score_total", "interruptions")
+                },
+            )
+            # 🔥 Day totals only grow, so a conditional update keeps the best day right under concurrency
+            best_day = max(day_minutes, key=day_minutes.get)
+            stats.filter(best_day_minutes__lt=day_minutes[best_day]).update(best_day=best_day, best_day_minutes=day_minutes[best_day])
+
+
+class ReadingStats(models.Model):
+    """Running reading totals per user, so stats never scan the session history."""
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="reading_stats")
+    total_minutes = models.PositiveIntegerField(default=0)
+    session_count = models.PositiveIntegerField(default=0)
+    focus_score_total = models.PositiveBigIntegerField(default=0)  # 🔥 Average = total / session_count
+    interruptions = models.PositiveIntegerField(default=0)
+    best_day = models.DateField(null=True, blank=True)
+    best_day_minutes = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ReadingStatsManager()
+
+    @property
+    def average_focus_score(self):
+        return round(self.focus_score_total / self.session_count, 1) if self.session_count else None
+
+    def __str__(self):
+        return f"{self.user_id} - {self.total_minutes} min over {self.session_count} sessions"
+
+
+class DailyReadingStats(models.Model):
+    """Per-user, per-day rollup of finished reading sessions."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    date = models.DateField()
+    minutes = models.PositiveIntegerField(default=0)
+    session_count = models.PositiveIntegerField(default=0)
+    focus_score_total = models.PositiveBigIntegerField(default=0)
+    interruptions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("user", "date")  # 🔥 One row per day, also the index for date-range reads
+
+    @property
+    def average_focus_score(self):
+        return round(self.focus_score_total / self.session_count, 1) if self.session_count else None
+
+    def __str__(self):
+        return f"{self.user_id} - {self.date}: {self.minutes} min"
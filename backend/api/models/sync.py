@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.db import models
+
+
+class SyncEvent(models.Model):
+    """
+    An offline client event applied through the sync endpoint, remembered by
+    its idempotency key so a retried or overlapping batch never applies it twice.
+    """
+
+    KINDS = [
+        ("progress", "Progress"),
+        ("session", "Reading session"),
+        ("bookmark", "Bookmark"),
+        ("highlight", "Highlight"),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    key = models.CharField(max_length=64)  # 🔥 Client-generated, e.g. a UUID per event
+    kind = models.CharField(max_length=10, choices=KINDS)
+    client_time = models.DateTimeField()
+    applied_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("user", "key")  # 🔥 Also the index for the per-batch key lookup
+
+    def __str__(self):
+        return f"{self.user_id} - {self.kind} {self.key}"
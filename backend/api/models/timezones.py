@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class TimezoneDayBoundary(models.Model):
+    """
+    The UTC instants one local day starts and ends at in one timezone, so
+    set-based queries can find a user's day by joining on their timezone
+    instead of converting timestamps row by row. Days are 23 or 25 hours
+    long across DST changes; a day's end is the next day's start.
+    Rows are computed on demand and never change (see core.timezones).
+    """
+    timezone = models.CharField(max_length=64)
+    date = models.DateField()
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ("timezone", "date")
+        indexes = [models.Index(fields=["timezone", "starts_at"], name="tzday_zone_start_idx")]  # 🔥 "Which day is it now" lookups
+
+    def __str__(self):
+        return f"{self.timezone} {self.date}: {self.starts_at:%Y-%m-%d %H:%M} - {self.ends_at:%Y-%m-%d %H:%M} UTC"
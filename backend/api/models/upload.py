@@ -0,0 +1,51 @@
+import os
+import uuid
+from django.db import models
+from django.conf import settings
+from django.utils.timezone import now
+
+
+class UploadSessionQuerySet(models.QuerySet):
+    def active(self):
+        return self.filter(expires_at__gt=now())
+
+    def expired(self):
+        return self.filter(expires_at__lte=now())
+
+
+class UploadSession(models.Model):
+    """
+    A resumable book upload whose chunks are staged on local disk until finalized.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    title = models.CharField(max_length=255)
+    author = models.CharField(max_length=255, blank=True, default="")
+    category = models.CharField(max_length=100, blank=True, default="")
+    tags = models.JSONField(default=list, blank=True)
+    filename = models.CharField(max_length=255)
+    total_size = models.PositiveBigIntegerField()
+    sha256 = models.CharField(max_length=64)  # 🔥 Declared by the client, verified at finalize
+    offset = models.PositiveBigIntegerField(default=0)  # 🔥 Bytes durably staged so far
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    objects = UploadSessionQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        """Every write extends the session, so only abandoned uploads expire."""
+        self.expires_at = now() + settings.BOOK_UPLOAD_SESSION_TTL
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "expires_at"}
+        super().save(*args, **kwargs)
+
+    @property
+    def staging_path(self):
+        return os.path.join(settings.BOOK_UPLOAD_STAGING_DIR, f"{self.pk}.part")
+
+    @property
+    def is_complete(self):
+        return self.offset == self.total_size
+
+    def __str__(self):
+        return f"{self.user.email} - {self.title} ({self.offset}/{self.total_size} bytes)"
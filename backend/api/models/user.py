@@ -74,6 +74,8 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     google_auth = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     profile_image_url = models.URLField(blank=True, null=True)
+    device_token = models.CharField(max_length=255, blank=True, null=True, db_index=True)  # 🔥 FCM registration token; indexed for pruning
+    timezone = models.CharField(max_length=64, default="UTC", db_index=True)  # 🔥 IANA name; decides when the user's day rolls over
     first_login = models.BooleanField(default=True)
     last_login = models.DateTimeField(blank=True, null=True)
 
@@ -2,6 +2,7 @@ from django.contrib.auth import authenticate
 from rest_framework import serializers
 from api.models.user import User
 from rest_framework_simplejwt.tokens import RefreshToken
+from core.timezones import valid_timezones
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -42,6 +43,20 @@ class RegisterSerializer(serializers.ModelSerializer):
         return User.objects.create_user(**validated_data)
 
 
+class TimezoneSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the user's timezone, an IANA name such as "Europe/Berlin".
+    """
+    class Meta:
+        model = User
+        fields = ("timezone",)
+
+    def validate_timezone(self, value):
+        if value not in valid_timezones():
+            raise serializers.ValidationError("Unknown timezone.")
+        return value
+
+
 class LoginSerializer(serializers.Serializer):
     """
     Serializer for user login.
@@ -31,10 +31,11 @@ class BookSerializer(serializers.ModelSerializer):
 
     category = CategorySerializer(read_only=True)  # 🔥 Nested category details
     tags = TagSerializer(many=True, read_only=True)  
+    page_count = serializers.IntegerField(source="blob.page_count", read_only=True, default=None)
 
     class Meta:
         model = Book
-        fields = ["id", "user", "title", "author", "file", "category", "tags", "uploaded_at"]
+        fields = ["id", "user", "title", "author", "file", "category", "tags", "page_count", "uploaded_at"]
         read_only_fields = ["user", "uploaded_at"]
 
     def validate_author(self, value):
@@ -1,8 +1,11 @@
+from django.conf import settings
 from rest_framework import serializers
+from core import catalog
+from api.models.blocklists import BlocklistCategory, BlocklistExclusion
 from api.models.focus import ReadingSession, BlockedApp, BlockedWebsite
+from api.models.stats import ReadingStats, DailyReadingStats
 
 class ReadingSessionSerializer(serializers.ModelSerializer):
-    focus_score = serializers.SerializerMethodField()
     total_reading_time = serializers.SerializerMethodField()
 
     class Meta:
@@ -10,9 +13,6 @@ class ReadingSessionSerializer(serializers.ModelSerializer):
         fields = ["id", "user", "book_id", "start_time", "end_time", "reading_duration", "completed", "interruptions", "focus_score", "total_reading_time", "hard_lock"]
         read_only_fields = ["id", "start_time", "end_time", "completed", "focus_score", "total_reading_time"]
 
-    def get_focus_score(self, obj):
-        return obj.calculate_focus_score()
-
     def validate_reading_duration(self, value):
         """Ensure reading duration is reasonable."""
         if value < 5 or value > 180:
@@ -26,6 +26,21 @@ class ReadingSessionSerializer(serializers.ModelSerializer):
             return round(time_spent, 2)
         return 0
 
+class ReadingStatsSerializer(serializers.ModelSerializer):
+    average_focus_score = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = ReadingStats
+        fields = ["total_minutes", "session_count", "average_focus_score", "interruptions", "best_day", "best_day_minutes", "updated_at"]
+
+
+class DailyReadingStatsSerializer(serializers.ModelSerializer):
+    average_focus_score = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = DailyReadingStats
+        fields = ["date", "minutes", "session_count", "average_focus_score", "interruptions"]
+
 class BlockedAppSerializer(serializers.ModelSerializer):
     class Meta:
         model = BlockedApp
@@ -37,3 +52,64 @@ class BlockedWebsiteSerializer(serializers.ModelSerializer):
         model = BlockedWebsite
         fields = ["id", "user", "url", "created_at"]
         read_only_fields = ["id", "user", "created_at"]
+
+
+class BlockedAppBulkSerializer(serializers.Serializer):
+    """The full desired list of a user's blocked apps."""
+    items = BlockedAppSerializer(many=True, allow_empty=True, max_length=settings.BLOCKLIST_BULK_MAX_ITEMS)
+
+
+class BlockedWebsiteBulkSerializer(serializers.Serializer):
+    """The full desired list of a user's blocked websites."""
+    items = BlockedWebsiteSerializer(many=True, allow_empty=True, max_length=settings.BLOCKLIST_BULK_MAX_ITEMS)
+
+
+def catalog_entries_by_category():
+    def build(rows):
+        grouped = {}
+        for entry in rows:
+            grouped.setdefault(entry.category_id, []).append(entry)
+        return grouped
+    return catalog.blocklist_entries.derive("by_category", build)
+
+
+class BlocklistCategorySerializer(serializers.ModelSerializer):
+    """A curated category with its entries, from the catalog cache."""
+    apps = serializers.SerializerMethodField()
+    websites = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BlocklistCategory
+        fields = ["id", "slug", "name", "description", "apps", "websites"]
+
+    def get_apps(self, obj):
+        entries = catalog_entries_by_category().get(obj.pk, [])
+        return [{"package_name": entry.value, "name": entry.name} for entry in entries if entry.kind == "app"]
+
+    def get_websites(self, obj):
+        return [entry.value for entry in catalog_entries_by_category().get(obj.pk, []) if entry.kind == "website"]
+
+
+class BlocklistSubscriptionSerializer(serializers.Serializer):
+    """The full set of curated categories a user subscribes to, by slug."""
+    categories = serializers.ListField(child=serializers.SlugField(), allow_empty=True)
+
+    def validate_categories(self, value):
+        slugs = {category.slug for category in catalog.blocklist_categories.all()}
+        unknown = sorted(set(value) - slugs)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown categories: {unknown}")
+        return sorted(set(value))
+
+
+class BlocklistExclusionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BlocklistExclusion
+        fields = ["id", "kind", "value", "created_at"]
+        read_only_fields = ["id", "created_at"]
+
+    def validate(self, attrs):
+        user = self.context["request"].user
+        if BlocklistExclusion.objects.filter(user=user, kind=attrs["kind"], value=attrs["value"]).exists():
+            raise serializers.ValidationError("Already excluded.")
+        return attrs
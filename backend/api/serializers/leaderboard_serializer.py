@@ -0,0 +1,12 @@
+from rest_framework import serializers
+from api.models.leaderboard import LeaderboardEntry
+
+
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    rank = serializers.IntegerField(read_only=True)
+    username = serializers.CharField(source="user.username", read_only=True)
+    profile_image_url = serializers.URLField(source="user.profile_image_url", read_only=True)
+
+    class Meta:
+        model = LeaderboardEntry
+        fields = ["rank", "user_id", "username", "profile_image_url", "score"]  # ✅ Public: never the email
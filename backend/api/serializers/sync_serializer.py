@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.utils.timezone import now
+from rest_framework import serializers
+from api.models.sync import SyncEvent
+
+
+class SyncEventSerializer(serializers.Serializer):
+    """
+    One offline event. Which fields it carries depends on `type`.
+    """
+
+    REQUIRED_FIELDS = {
+        "progress": ["amount"],
+        "session": ["book_id", "start_time", "end_time", "reading_duration"],
+        "bookmark": ["book", "page_number"],
+        "highlight": ["book", "page_number", "text"],
+    }
+
+    key = serializers.CharField(max_length=64)
+    type = serializers.ChoiceField(choices=[kind for kind, _ in SyncEvent.KINDS])
+    client_time = serializers.DateTimeField()
+    amount = serializers.IntegerField(min_value=0, required=False)
+    book_id = serializers.CharField(max_length=255, required=False)
+    start_time = serializers.DateTimeField(required=False)
+    end_time = serializers.DateTimeField(required=False)
+    reading_duration = serializers.IntegerField(min_value=5, max_value=180, required=False)
+    interruptions = serializers.IntegerField(min_value=0, default=0)
+    book = serializers.IntegerField(required=False)
+    page_number = serializers.IntegerField(min_value=0, required=False)
+    note = serializers.CharField(allow_blank=True, allow_null=True, required=False)
+    text = serializers.CharField(required=False)
+
+    def validate(self, data):
+        missing = [field for field in self.REQUIRED_FIELDS[data["type"]] if field not in data]
+        if missing:
+            raise serializers.ValidationError({field: f"Required for {data['type']} events." for field in missing})
+        if data["type"] == "session" and data["end_time"] < data["start_time"]:
+            raise serializers.ValidationError({"end_time": "Must not be before start_time."})
+
+        # 🔥 Client clocks drift; nothing synced may claim to be from the future
+        current = now()
+        for field in ("client_time", "start_time", "end_time"):
+            if field in data:
+                data[field] = min(data[field], current)
+        return data
+
+
+class ReadingSyncSerializer(serializers.Serializer):
+    """
+    An ordered batch of offline events, applied as a whole or not at all.
+    """
+
+    events = SyncEventSerializer(many=True, allow_empty=False, max_length=settings.SYNC_MAX_EVENTS)
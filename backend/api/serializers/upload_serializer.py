@@ -0,0 +1,33 @@
+from django.conf import settings
+from rest_framework import serializers
+from api.models.upload import UploadSession
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Serializer for resumable upload sessions.
+    """
+
+    size = serializers.IntegerField(source="total_size", min_value=1)
+    sha256 = serializers.RegexField(r"^[0-9a-fA-F]{64}$")
+    tags = serializers.ListField(child=serializers.CharField(max_length=50), required=False)
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = ["id", "title", "author", "category", "tags", "filename", "size", "sha256", "offset", "chunk_size", "expires_at"]
+        read_only_fields = ["id", "offset", "expires_at"]
+
+    def get_chunk_size(self, obj):
+        return settings.BOOK_UPLOAD_MAX_CHUNK_BYTES
+
+    def validate_size(self, value):
+        if value > settings.BOOK_UPLOAD_MAX_BYTES:
+            raise serializers.ValidationError("File exceeds the maximum allowed size.")
+        return value
+
+    def validate_sha256(self, value):
+        return value.lower()
+
+    def validate_author(self, value):
+        return value or ""
@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from api.models import Book, User
+from api.models.book import BookBlob
+
+
+class BookBlobManagerTests(TestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def acquire(self, data=b"It was a dark and stormy night."):
+        return BookBlob.objects.acquire(ContentFile(data, name="novel.txt"))
+
+    def exists(self, blob):
+        return blob.file.storage.exists(blob.file.name)
+
+    def test_identical_content_shares_blob(self):
+        first, second = self.acquire(), self.acquire()
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(BookBlob.objects.get(pk=first.pk).ref_count, 2)
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertTrue(first.file.name.endswith(".txt"))
+
+    def test_different_content_gets_own_blob(self):
+        self.assertNotEqual(self.acquire(b"one").pk, self.acquire(b"two").pk)
+
+    def test_release_keeps_blob_while_referenced(self):
+        blob = self.acquire()
+        self.acquire()
+        with self.captureOnCommitCallbacks(execute=True):
+            BookBlob.objects.release(blob.pk)
+        self.assertEqual(BookBlob.objects.get(pk=blob.pk).ref_count, 1)
+        self.assertTrue(self.exists(blob))
+
+    def test_last_release_deletes_file_on_commit(self):
+        blob = self.acquire()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            BookBlob.objects.release(blob.pk)
+        self.assertFalse(BookBlob.objects.filter(pk=blob.pk).exists())
+        self.assertTrue(self.exists(blob))  # 🔥 Not committed yet
+
+        for callback in callbacks:
+            callback()
+        self.assertFalse(self.exists(blob))
+
+    def test_release_of_missing_blob(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            BookBlob.objects.release(0)
+        self.assertEqual(callbacks, [])
+
+    def test_reacquire_restores_lost_file(self):
+        blob = self.acquire()
+        blob.file.storage.delete(blob.file.name)
+        blob = self.acquire()
+        self.assertTrue(self.exists(blob))
+        self.assertEqual(blob.ref_count, 2)
+
+    def test_rollback_removes_new_file(self):
+        with self.assertRaises(RuntimeError):
+            with BookBlob.objects.storing():
+                blob = self.acquire()
+                self.assertTrue(self.exists(blob))
+                raise RuntimeError
+        self.assertFalse(BookBlob.objects.filter(pk=blob.pk).exists())
+        self.assertFalse(self.exists(blob))
+
+    def test_rollback_keeps_existing_file(self):
+        blob = self.acquire()
+        with self.assertRaises(RuntimeError):
+            with BookBlob.objects.storing():
+                self.acquire()
+                raise RuntimeError
+        self.assertEqual(BookBlob.objects.get(pk=blob.pk).ref_count, 1)
+        self.assertTrue(self.exists(blob))
+
+    def test_outer_rollback_removes_nested_file(self):
+        with self.assertRaises(RuntimeError):
+            with BookBlob.objects.storing():
+                with BookBlob.objects.storing():
+                    blob = self.acquire()
+                raise RuntimeError
+        self.assertFalse(self.exists(blob))
+
+    def test_book_delete_releases_blob(self):
+        user = User.objects.create_user(email="owner@example.com", password="x")
+        blob = self.acquire()
+        book = Book.objects.create(user=user, title="Stormy", blob=blob, file=blob.file.name, file_hash=blob.sha256)
+        with self.captureOnCommitCallbacks(execute=True):
+            book.delete()
+        self.assertFalse(BookBlob.objects.filter(pk=blob.pk).exists())
+        self.assertFalse(self.exists(blob))
@@ -0,0 +1,200 @@
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from api.models import BlocklistCategory, BlocklistEntry, BlocklistExclusion, BlocklistSubscription, User
+from api.models.focus import BlockedApp, BlockedWebsite
+from core import catalog
+from services.blocking import BlockingService
+
+
+class BlockingTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="blocker@example.com", password="x")
+        cls.social = BlocklistCategory.objects.create(slug="social", name="Social")
+        BlocklistEntry.objects.bulk_create([
+            BlocklistEntry(category=cls.social, kind="app", value="com.facebook.katana", name="Facebook"),
+            BlocklistEntry(category=cls.social, kind="app", value="com.instagram.android", name="Instagram"),
+            BlocklistEntry(category=cls.social, kind="website", value="facebook.com"),
+            BlocklistEntry(category=cls.social, kind="website", value="instagram.com"),
+        ])
+
+    def setUp(self):
+        cache.clear()
+        catalog.blocklist_categories.invalidate()  # ✅ No catalog copy left over from another test
+        catalog.blocklist_entries.invalidate()
+        self.client = APIClient(SERVER_NAME="localhost")
+        self.client.force_authenticate(self.user)
+
+    def put_apps(self, items):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.put(reverse("blocked-apps-bulk"), {"items": items}, format="json")
+
+
+class BulkReplaceTests(BlockingTestCase):
+    def test_diff(self):
+        BlockedApp.objects.bulk_create([
+            BlockedApp(user=self.user, app_name="Kept", package_name="com.kept"),
+            BlockedApp(user=self.user, app_name="Old name", package_name="com.renamed"),
+            BlockedApp(user=self.user, app_name="Gone", package_name="com.gone"),
+        ])
+        response = self.put_apps([
+            {"app_name": "Kept", "package_name": "com.kept"},
+            {"app_name": "New name", "package_name": "com.renamed"},
+            {"app_name": "Added", "package_name": "com.added"},
+            {"app_name": "No package"},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["created"], response.data["updated"], response.data["deleted"]), (2, 1, 1))
+        self.assertEqual(
+            list(BlockedApp.objects.filter(user=self.user).order_by("id").values_list("app_name", flat=True)),
+            ["Kept", "New name", "Added", "No package"],
+        )
+        self.assertEqual(response.data["version"], BlockingService.profile(self.user)["version"])
+
+        response = self.put_apps([{"app_name": "Kept", "package_name": "com.kept"}])
+        self.assertEqual((response.data["created"], response.data["updated"], response.data["deleted"]), (0, 0, 3))
+
+    def test_websites_match_by_host(self):
+        BlockedWebsite.objects.create(user=self.user, url="https://www.reddit.com/r/books")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse("blocked-websites-bulk"), {"items": [
+                {"url": "https://reddit.com"}, {"url": "https://news.ycombinator.com"},
+            ]}, format="json")
+        self.assertEqual((response.data["created"], response.data["updated"], response.data["deleted"]), (1, 1, 0))
+
+    def test_constant_queries(self):
+        # 🔥 Savepoint, user lock, rows, insert, release, listing, four profile reads and the catalog's slugs
+        for count in (1, 80):
+            with self.subTest(items=count):
+                with self.assertNumQueries(11):
+                    response = self.put_apps([{"app_name": f"App {index}", "package_name": f"com.app{index}"} for index in range(count)])
+                self.assertEqual(response.data["created"], count)
+                BlockedApp.objects.filter(user=self.user).delete()
+
+    def test_constant_queries_with_changes(self):
+        for count in (1, 80):
+            with self.subTest(items=count):
+                BlockedApp.objects.bulk_create(
+                    [BlockedApp(user=self.user, app_name="Old", package_name=f"com.app{index}") for index in range(count)]
+                    + [BlockedApp(user=self.user, app_name="Gone", package_name=f"com.gone{index}") for index in range(count)]
+                )
+                with self.assertNumQueries(13):  # ✅ Plus one bulk UPDATE and one DELETE
+                    response = self.put_apps([{"app_name": "New", "package_name": f"com.app{index}"} for index in range(count)])
+                self.assertEqual((response.data["updated"], response.data["deleted"]), (count, count))
+                BlockedApp.objects.filter(user=self.user).delete()
+
+
+class ProfileTests(BlockingTestCase):
+    def profile(self, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get(reverse("blocking-profile"), **headers)
+
+    def test_not_modified(self):
+        response = self.profile()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], f'"{response.data["version"]}"')
+        self.assertEqual(self.profile(response["ETag"]).status_code, 304)
+        self.assertEqual(self.profile(f'W/{response["ETag"]}').status_code, 304)
+        self.assertEqual(self.profile('"other"').status_code, 200)
+
+        self.put_apps([{"app_name": "Added", "package_name": "com.added"}])
+        changed = self.profile(response["ETag"])
+        self.assertEqual(changed.status_code, 200)
+        self.assertIn("com.added", changed.data["block_apps"])
+
+    @mock.patch("services.blocking.shared_cache", return_value=True)
+    def test_version_changes_after_commit(self, shared):
+        with mock.patch("django.db.connection.in_atomic_block", False):  # 🔥 Tests run in a transaction; let the profile be cached
+            before = BlockingService.profile(self.user)["version"]
+        with self.captureOnCommitCallbacks() as callbacks:
+            BlockedApp.objects.create(user=self.user, app_name="Added", package_name="com.added")
+        self.assertEqual(BlockingService.profile(self.user)["version"], before)  # ✅ Not committed: still the cached profile
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(BlockingService.profile(self.user)["version"], before)
+
+    def test_per_process_cache_never_serves_stale_profile(self):
+        before = BlockingService.profile(self.user)["version"]
+        BlockedApp.objects.create(user=self.user, app_name="Added", package_name="com.added")  # 🔥 Invalidation never runs
+        self.assertNotEqual(BlockingService.profile(self.user)["version"], before)
+
+
+class SubscriptionTests(BlockingTestCase):
+    def test_subscription_merges_curated_entries(self):
+        BlockedApp.objects.create(user=self.user, app_name="Own", package_name="com.own")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse("blocking-subscriptions"), {"categories": ["social"]}, format="json")
+        self.assertEqual(response.data["categories"], ["social"])
+
+        profile = self.client.get(reverse("blocking-profile")).data
+        self.assertEqual(profile["block_apps"], ["com.own", "com.facebook.katana", "com.instagram.android"])
+        self.assertEqual(profile["block_websites"], ["facebook.com", "instagram.com"])
+
+    def test_exclusion_removes_curated_entry(self):
+        BlocklistSubscription.objects.create(user=self.user, category=self.social)
+        with self.captureOnCommitCallbacks(execute=True):
+            for kind, value in [("app", "com.instagram.android"), ("website", "https://www.facebook.com/")]:
+                response = self.client.post(reverse("blocking-exclusions"), {"kind": kind, "value": value}, format="json")
+                self.assertEqual(response.status_code, 201)
+
+        profile = self.client.get(reverse("blocking-profile")).data
+        self.assertEqual(profile["block_apps"], ["com.facebook.katana"])
+        self.assertEqual(profile["block_websites"], ["instagram.com"])
+
+    def test_own_entry_survives_exclusion(self):
+        BlocklistSubscription.objects.create(user=self.user, category=self.social)
+        BlockedWebsite.objects.create(user=self.user, url="facebook.com")
+        self.client.post(reverse("blocking-exclusions"), {"kind": "website", "value": "facebook.com"}, format="json")
+        self.assertIn("facebook.com", self.client.get(reverse("blocking-profile")).data["block_websites"])
+
+
+class SeedBlocklistsTests(BlockingTestCase):
+    def seed(self, apps, websites, *args):
+        curated = [{"slug": "social", "name": "Social", "description": "", "apps": apps, "websites": websites}]
+        output = StringIO()
+        with mock.patch("api.management.commands.seed_blocklists.CURATED_BLOCKLISTS", curated):
+            call_command("seed_blocklists", *args, stdout=output)
+        return output.getvalue()
+
+    def test_reseed_updates_and_removes_entries(self):
+        output = self.seed(
+            [("com.facebook.katana", "Facebook"), ("com.instagram.android", "IG"), ("com.twitter.android", "X")],
+            ["instagram.com"],
+        )
+        self.assertIn("1 entries created, 1 renamed, 1 removed", output)
+        self.assertEqual(
+            set(BlocklistEntry.objects.filter(category=self.social).values_list("value", "name")),
+            {("com.facebook.katana", "Facebook"), ("com.instagram.android", "IG"), ("com.twitter.android", "X"), ("instagram.com", "")},
+        )
+        self.assertIn("0 entries created, 0 renamed, 0 removed", self.seed(
+            [("com.facebook.katana", "Facebook"), ("com.instagram.android", "IG"), ("com.twitter.android", "X")],
+            ["instagram.com"],
+        ))
+
+    def test_fold_keeps_excluded_rows(self):
+        BlocklistSubscription.objects.create(user=self.user, category=self.social)
+        BlockedApp.objects.bulk_create([
+            BlockedApp(user=self.user, app_name="Facebook", package_name="com.facebook.katana"),
+            BlockedApp(user=self.user, app_name="Instagram", package_name="com.instagram.android"),
+        ])
+        BlockedWebsite.objects.bulk_create([BlockedWebsite(user=self.user, url="facebook.com"), BlockedWebsite(user=self.user, url="instagram.com")])
+        BlocklistExclusion.objects.bulk_create([
+            BlocklistExclusion(user=self.user, kind="app", value="com.instagram.android"),
+            BlocklistExclusion(user=self.user, kind="website", value="https://www.instagram.com/"),
+        ])
+        before = BlockingService.compile(self.user.pk)
+
+        self.seed(
+            [("com.facebook.katana", "Facebook"), ("com.instagram.android", "Instagram")], ["facebook.com", "instagram.com"], "--fold-user-rows",
+        )
+        self.assertEqual(list(BlockedApp.objects.filter(user=self.user).values_list("package_name", flat=True)), ["com.instagram.android"])
+        self.assertEqual(list(BlockedWebsite.objects.filter(user=self.user).values_list("url", flat=True)), ["instagram.com"])
+        after = BlockingService.compile(self.user.pk)
+        self.assertEqual(set(after["block_apps"]), set(before["block_apps"]))
+        self.assertEqual(set(after["block_websites"]), set(before["block_websites"]))
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+from django.test import SimpleTestCase, TestCase
+from api.models import ReadingCalendar, User
+from api.models.calendar import ReadingDays, day_index, days_in_year
+
+
+def reading_days(days):
+    """ReadingDays over unsaved calendars holding `days`."""
+    calendars = {}
+    for day in days:
+        calendar = calendars.setdefault(day.year, ReadingCalendar(year=day.year))
+        calendar.bits |= 1 << day_index(day)
+    return ReadingDays(calendars.values())
+
+
+def span(first, last):
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+class StreakEndingTests(SimpleTestCase):
+    def test_unread_day(self):
+        days = reading_days(span(date(2025, 3, 1), date(2025, 3, 5)))
+        self.assertEqual(days.streak_ending(date(2025, 3, 6)), 0)
+        self.assertEqual(days.streak_ending(date(2025, 2, 28)), 0)
+
+    def test_within_year(self):
+        days = reading_days(span(date(2025, 3, 1), date(2025, 3, 5)))
+        self.assertEqual(days.streak_ending(date(2025, 3, 5)), 5)
+        self.assertEqual(days.streak_ending(date(2025, 3, 3)), 3)
+
+    def test_across_new_year(self):
+        days = reading_days(span(date(2024, 12, 29), date(2025, 1, 3)))
+        self.assertEqual(days.streak_ending(date(2025, 1, 1)), 4)
+        self.assertEqual(days.streak_ending(date(2025, 1, 3)), 6)
+        self.assertEqual(days.streak_ending(date(2024, 12, 31)), 3)
+
+    def test_through_whole_years(self):
+        # 🔥 2024 is a leap year: 366 bits, against 365 for 2023 and 2025
+        days = reading_days(span(date(2022, 12, 31), date(2026, 1, 2)))
+        expected = 1 + days_in_year(2023) + days_in_year(2024) + days_in_year(2025) + 2
+        self.assertEqual(days.streak_ending(date(2026, 1, 2)), expected)
+        self.assertEqual(days.streak_ending(date(2024, 12, 31)), 1 + days_in_year(2023) + days_in_year(2024))
+
+    def test_stops_at_missing_year(self):
+        days = reading_days(span(date(2025, 1, 1), date(2025, 1, 10)))
+        self.assertEqual(days.streak_ending(date(2025, 1, 10)), 10)
+
+    def test_gap_on_december_31st(self):
+        days = reading_days(span(date(2024, 12, 1), date(2024, 12, 30)) + span(date(2025, 1, 1), date(2025, 1, 4)))
+        self.assertEqual(days.streak_ending(date(2025, 1, 4)), 4)
+
+    def test_current_streak(self):
+        days = reading_days(span(date(2024, 12, 30), date(2025, 1, 1)))
+        self.assertEqual(days.current_streak(date(2025, 1, 1)), 3)
+        self.assertEqual(days.current_streak(date(2025, 1, 2)), 3)  # 🔥 Today not read yet
+        self.assertEqual(days.current_streak(date(2025, 1, 3)), 0)
+
+    def test_matches_day_by_day_count(self):
+        read = {day for day in span(date(2023, 11, 1), date(2025, 2, 28)) if day.toordinal() % 7 not in (0, 3)}
+        read |= set(span(date(2024, 12, 20), date(2025, 1, 15)))
+        days = reading_days(read)
+        for day in span(date(2023, 11, 1), date(2025, 2, 28)):
+            expected, cursor = 0, day
+            while cursor in read:
+                expected, cursor = expected + 1, cursor - timedelta(days=1)
+            self.assertEqual(days.streak_ending(day), expected, day)
+
+
+class ReadingCalendarTests(TestCase):
+    def test_mark_and_days_for(self):
+        user = User.objects.create_user(email="calendar@example.com", password="x")
+        for day in span(date(2024, 12, 30), date(2025, 1, 2)):
+            ReadingCalendar.objects.mark(user.id, day)
+        ReadingCalendar.objects.mark(user.id, date(2025, 1, 2))  # ✅ Marking twice changes nothing
+
+        days = ReadingCalendar.objects.days_for(user.id)
+        self.assertEqual(ReadingCalendar.objects.filter(user=user).count(), 2)
+        self.assertEqual(days.streak_ending(date(2025, 1, 2)), 4)
+        self.assertEqual(days.count(date(2024, 1, 1), date(2025, 12, 31)), 4)
+        self.assertEqual(days.longest_streak(2025), 2)
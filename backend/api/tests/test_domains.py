@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase
+from core.domains import DomainTrie, parse_rule
+
+RULES = [
+    "example.com",
+    "*.ads.example.net",
+    "https://www.news.site.org/path?q=1",
+    "Tracker.IO",
+    "bücher.de",
+    "a.b.c.d.e.example.com",
+]
+
+HOSTS = [
+    "example.com", "www.example.com", "deep.sub.example.com",
+    "ads.example.net", "x.ads.example.net", "example.net",
+    "news.site.org", "m.news.site.org", "site.org",
+    "tracker.io", "xn--bcher-kva.de", "b.c.d.e.example.com", "other.com", "",
+]
+
+
+class ParseRuleTests(SimpleTestCase):
+    def test_rules(self):
+        self.assertEqual(parse_rule("example.com"), ("example.com", 3))
+        self.assertEqual(parse_rule("*.example.com"), ("example.com", 2))
+        self.assertEqual(parse_rule("https://www.Example.com:8080/x"), ("example.com", 3))
+        self.assertEqual(parse_rule("www.com"), ("www.com", 3))
+        self.assertEqual(parse_rule(""), (None, 0))
+
+
+class DomainTrieTests(SimpleTestCase):
+    def test_match(self):
+        trie = DomainTrie(RULES)
+        self.assertEqual(trie.match("example.com"), "example.com")
+        self.assertEqual(trie.match("deep.sub.example.com"), "*.example.com")
+        self.assertIsNone(trie.match("ads.example.net"))
+        self.assertEqual(trie.match("x.ads.example.net"), "*.ads.example.net")
+        self.assertEqual(trie.match("m.news.site.org"), "*.news.site.org")
+        self.assertIsNone(trie.match("site.org"))
+        self.assertIsNone(trie.match(""))
+
+    def test_round_trip(self):
+        trie = DomainTrie(RULES)
+        data = trie.to_bytes()
+        loaded = DomainTrie.from_bytes(data)
+        self.assertEqual(loaded.to_bytes(), data)
+        self.assertEqual([loaded.match(host) for host in HOSTS], [trie.match(host) for host in HOSTS])
+
+    def test_round_trip_is_order_independent(self):
+        self.assertEqual(DomainTrie(RULES).to_bytes(), DomainTrie(reversed(RULES)).to_bytes())
+
+    def test_empty_round_trip(self):
+        loaded = DomainTrie.from_bytes(DomainTrie().to_bytes())
+        self.assertEqual(loaded.root, [0, {}])
+        self.assertIsNone(loaded.match("example.com"))
+
+    def test_many_children_round_trip(self):
+        # 🔥 Over 127 children and labels: varints take two bytes
+        trie = DomainTrie(f"site{index}.com" for index in range(300))
+        loaded = DomainTrie.from_bytes(trie.to_bytes())
+        self.assertEqual(loaded.root, trie.root)
+        self.assertEqual(loaded.match("www.site299.com"), "*.site299.com")
+
+    def test_update_round_trip(self):
+        merged = DomainTrie(RULES[:3]).update(DomainTrie(RULES[3:]))
+        self.assertEqual(merged.rules, len(RULES))
+        self.assertEqual(DomainTrie.from_bytes(merged.to_bytes()).to_bytes(), DomainTrie(RULES).to_bytes())
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            DomainTrie.from_bytes(b"PK\x03\x04" + bytes(16))
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+from django.test import TestCase
+from api.models import ReadingCalendar, ReadingGoal, ReadingHistory, User
+
+
+class AddProgressTests(TestCase):
+    today = date(2026, 3, 10)
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="reader@example.com", password="x")
+
+    def goal(self, **fields):
+        return ReadingGoal.objects.create(user=self.user, goal_target=10, progress_date=self.today, **fields)
+
+    def test_without_goal(self):
+        self.assertEqual(ReadingGoal.objects.add_progress(self.user.id, 5, self.today), (None, False))
+
+    def test_first_completion_starts_streak(self):
+        self.goal()
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 4, self.today)
+        self.assertFalse(completed)
+        self.assertEqual((goal.progress, goal.is_completed, goal.streak_count), (4, False, 0))
+
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 6, self.today)
+        self.assertTrue(completed)
+        self.assertEqual((goal.progress, goal.is_completed, goal.streak_count, goal.longest_streak), (10, True, 1, 1))
+        self.assertEqual(goal.last_completed_date, self.today)
+        self.assertEqual(ReadingHistory.objects.get(user=self.user, date=self.today).streak_count, 1)
+        self.assertTrue(ReadingCalendar.objects.days_for(self.user.id).read(self.today))
+
+    def test_completes_once_per_day(self):
+        self.goal()
+        ReadingGoal.objects.add_progress(self.user.id, 10, self.today)
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 5, self.today)
+        self.assertFalse(completed)
+        self.assertEqual((goal.progress, goal.streak_count), (15, 1))
+
+    def test_completed_yesterday_continues_streak(self):
+        self.goal(last_completed_date=self.today - timedelta(days=1), streak_count=4, longest_streak=4)
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 10, self.today)
+        self.assertTrue(completed)
+        self.assertEqual((goal.streak_count, goal.longest_streak), (5, 5))
+
+    def test_missed_day_restarts_streak(self):
+        self.goal(last_completed_date=self.today - timedelta(days=2), streak_count=4, longest_streak=7)
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 10, self.today)
+        self.assertTrue(completed)
+        self.assertEqual((goal.streak_count, goal.longest_streak), (1, 7))
+
+    def test_stale_day_is_rolled_over(self):
+        yesterday = self.today - timedelta(days=1)
+        ReadingGoal.objects.create(
+            user=self.user, goal_target=10, progress=10, is_completed=True, progress_date=yesterday,
+            last_completed_date=yesterday, streak_count=3, longest_streak=3,
+        )
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 4, self.today)
+        self.assertFalse(completed)
+        self.assertEqual((goal.progress, goal.is_completed, goal.progress_date), (4, False, self.today))
+        self.assertEqual(goal.streak_count, 3)  # 🔥 Completed yesterday: still alive today
+
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 6, self.today)
+        self.assertTrue(completed)
+        self.assertEqual(goal.streak_count, 4)
+
+    def test_stale_day_breaks_old_streak(self):
+        ReadingGoal.objects.create(
+            user=self.user, goal_target=10, progress=3, progress_date=self.today - timedelta(days=3),
+            last_completed_date=self.today - timedelta(days=4), streak_count=6, longest_streak=6,
+        )
+        goal, completed = ReadingGoal.objects.add_progress(self.user.id, 2, self.today)
+        self.assertFalse(completed)
+        self.assertEqual((goal.progress, goal.streak_count, goal.longest_streak), (2, 0, 6))
@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.test import TestCase
+from rest_framework.test import APIClient
+from api.models.badge import Badge, UserBadge
+from api.models.book import Book, Category, Tag
+from api.models.bookmark import Bookmark, Highlight
+from api.models.focus import ReadingSession
+from api.models.rewards import Reward, UserReward
+from api.models.user import User
+
+
+def seed_books(user, count):
+    category = Category.objects.create(name="qc-category")
+    tags = Tag.objects.bulk_create([Tag(name=f"qc-tag-{index}") for index in range(3)])
+    books = Book.objects.bulk_create([
+        Book(user=user, title=f"QC {index}", file=f"books/qc-{index}.pdf", category=category)
+        for index in range(count)
+    ])
+    Book.tags.through.objects.bulk_create([
+        Book.tags.through(book_id=book.pk, tag_id=tag.pk) for book in books for tag in tags
+    ])
+    return books
+
+
+def seed_badges(user, count):
+    return Badge.objects.bulk_create([
+        Badge(name=f"qc-badge-{index}", description="", streak_required=index) for index in range(count)
+    ])
+
+
+def seed_user_badges(user, count):
+    # 🔥 bulk_create skips UserBadge.save, so no notifications are sent
+    UserBadge.objects.bulk_create([UserBadge(user=user, badge=badge) for badge in seed_badges(user, count)])
+
+
+def seed_user_rewards(user, count):
+    rewards = Reward.objects.bulk_create([
+        Reward(badge=badge, description=f"QC reward {badge.pk}", reward_type="discount")
+        for badge in seed_badges(user, count)
+    ])
+    UserReward.objects.bulk_create([UserReward(user=user, reward=reward) for reward in rewards])
+
+
+def seed_bookmarks(user, count):
+    book = seed_books(user, 1)[0]
+    Bookmark.objects.bulk_create([Bookmark(user=user, book=book, page_number=index) for index in range(count)])
+
+
+def seed_highlights(user, count):
+    book = seed_books(user, 1)[0]
+    Highlight.objects.bulk_create([Highlight(user=user, book=book, page_number=index, text="qc") for index in range(count)])
+
+
+def seed_sessions(user, count):
+    ReadingSession.objects.bulk_create([
+        ReadingSession(user=user, book_id="qc", reading_duration=30) for _ in range(count)
+    ])
+
+
+# (name, url or callable returning the url, seeder, expected queries)
+ENDPOINTS = [
+    ("books list", "/api/v1/books/", seed_books, 2),
+    ("book detail", lambda user: f"/api/v1/books/{Book.objects.filter(user=user).latest('pk').pk}/", seed_books, 2),
+    ("earned badges", "/api/v1/badges/earned/", seed_user_badges, 1),
+    ("rewards", "/api/v1/badges/rewards/", seed_user_rewards, 1),
+    ("bookmarks", "/api/v1/bookmarks/bookmarks/", seed_bookmarks, 1),
+    ("highlights", "/api/v1/highlights/highlights/", seed_highlights, 1),
+    ("reading stats", "/api/v1/focus/reading/stats/", seed_sessions, 2),
+]
+
+
+class QueryCountTests(TestCase):
+    """List and detail endpoints run a fixed number of queries whatever the result size."""
+
+    sizes = (1, 25)
+
+    def test_endpoints(self):
+        for name, url, seed, expected in ENDPOINTS:
+            for size in self.sizes:
+                with self.subTest(endpoint=name, rows=size), transaction.atomic():
+                    user = User.objects.create_user(email="query-counts@example.com", password="x")
+                    seed(user, size)
+                    client = APIClient(SERVER_NAME="localhost")
+                    client.force_authenticate(user)
+
+                    path = url(user) if callable(url) else url
+                    with self.assertNumQueries(expected):
+                        response = client.get(path)
+                    self.assertEqual(response.status_code, 200)
+                    transaction.set_rollback(True)  # ✅ Next size starts from an empty database
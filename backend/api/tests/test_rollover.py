@@ -0,0 +1,70 @@
+from datetime import date, datetime, timezone
+from django.test import TestCase
+from api.models import ReadingGoal, User
+from core import timezones as zones
+
+
+class RollOverTests(TestCase):
+    at = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+    today = date(2026, 3, 10)
+
+    @classmethod
+    def setUpTestData(cls):
+        zones._stored.clear()  # 🔥 Days remembered from another test's rolled-back transaction
+        zones.ensure_current_days(["UTC", "Pacific/Kiritimati"], cls.at)
+
+    def goal(self, email, zone="UTC", **fields):
+        user = User.objects.create_user(email=email, password="x", timezone=zone)
+        return ReadingGoal.objects.create(user=user, goal_target=10, **fields)
+
+    def roll_over(self):
+        return ReadingGoal.objects.roll_over((0, User.objects.order_by("-id").values_list("id", flat=True).first()), self.at)
+
+    def test_completed_yesterday_keeps_streak(self):
+        goal = self.goal(
+            "kept@example.com", progress=12, is_completed=True, progress_date=date(2026, 3, 9),
+            last_completed_date=date(2026, 3, 9), streak_count=4,
+        )
+        self.assertEqual(self.roll_over(), 1)
+        goal.refresh_from_db()
+        self.assertEqual((goal.progress, goal.is_completed, goal.streak_count, goal.progress_date), (0, False, 4, self.today))
+
+    def test_missed_day_breaks_streak(self):
+        goal = self.goal(
+            "broken@example.com", progress=3, progress_date=date(2026, 3, 9),
+            last_completed_date=date(2026, 3, 8), streak_count=4, longest_streak=9,
+        )
+        self.roll_over()
+        goal.refresh_from_db()
+        self.assertEqual((goal.progress, goal.streak_count, goal.longest_streak), (0, 0, 9))
+
+    def test_current_day_is_left_alone(self):
+        goal = self.goal("current@example.com", progress=5, progress_date=self.today, last_completed_date=date(2026, 3, 7), streak_count=2)
+        self.assertEqual(self.roll_over(), 0)
+        goal.refresh_from_db()
+        self.assertEqual((goal.progress, goal.streak_count), (5, 2))
+
+    def test_rerun_changes_nothing(self):
+        self.goal("twice@example.com", progress=3, progress_date=date(2026, 3, 9))
+        self.assertEqual(self.roll_over(), 1)
+        self.assertEqual(self.roll_over(), 0)
+
+    def test_day_follows_owner_timezone(self):
+        # 🔥 12:00 UTC is already March 11th at UTC+14
+        ahead = self.goal(
+            "ahead@example.com", "Pacific/Kiritimati", progress=10, is_completed=True, progress_date=self.today,
+            last_completed_date=self.today, streak_count=2,
+        )
+        utc = self.goal("utc@example.com", progress=10, is_completed=True, progress_date=self.today, last_completed_date=self.today, streak_count=2)
+        self.assertEqual(self.roll_over(), 1)
+        ahead.refresh_from_db()
+        utc.refresh_from_db()
+        self.assertEqual((ahead.progress, ahead.streak_count, ahead.progress_date), (0, 2, date(2026, 3, 11)))
+        self.assertEqual((utc.progress, utc.is_completed), (10, True))
+
+    def test_only_range_is_rolled(self):
+        inside = self.goal("inside@example.com", progress=3, progress_date=date(2026, 3, 9))
+        outside = self.goal("outside@example.com", progress=3, progress_date=date(2026, 3, 9))
+        self.assertEqual(ReadingGoal.objects.roll_over((inside.user_id - 1, inside.user_id), self.at), 1)
+        outside.refresh_from_db()
+        self.assertEqual(outside.progress, 3)
@@ -0,0 +1,30 @@
+from django.test import SimpleTestCase
+from services.search import SNIPPET_CHARS, highlight
+
+
+class HighlightTests(SimpleTestCase):
+    def test_escapes_text(self):
+        self.assertEqual(highlight("<script>alert(1)</script> book", ["book"]), "&lt;script&gt;alert(1)&lt;/script&gt; <b>book</b>")
+
+    def test_one_letter_terms(self):
+        self.assertEqual(
+            highlight("Plan B: the book about a<b tags", ["book", "b"]),
+            "Plan <b>B</b>: the <b>book</b> about a&lt;<b>b</b> tags",
+        )
+
+    def test_entity_name_terms(self):
+        self.assertEqual(highlight("x < y & z > w", ["lt", "amp", "gt"]), "x &lt; y &amp; z &gt; w")
+        self.assertEqual(highlight("alt &lt; lt", ["lt"]), "alt &amp;<b>lt</b>; <b>lt</b>")
+
+    def test_longest_term_first(self):
+        self.assertEqual(highlight("Bookshelf of books", ["book", "bookshelf"]), "<b>Bookshelf</b> of <b>book</b>s")
+
+    def test_window_around_first_match(self):
+        text = "a " * SNIPPET_CHARS + "needle " + "z " * SNIPPET_CHARS
+        snippet = highlight(text, ["needle"])
+        self.assertTrue(snippet.startswith("…") and snippet.endswith("…"))
+        self.assertIn("<b>needle</b>", snippet)
+
+    def test_empty(self):
+        self.assertEqual(highlight("", ["book"]), "")
+        self.assertEqual(highlight("a & b", []), "a &amp; b")
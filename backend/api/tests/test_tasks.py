@@ -0,0 +1,38 @@
+from django.test import TestCase
+from api.models.jobs import Job
+from core.tasks import Worker, enqueue_many, task
+
+calls = []
+
+
+@task("tests.batched", batch_size=10)
+def batched(payloads):
+    calls.append(len(payloads))
+    return [None if payload["ok"] else "failed" for payload in payloads][:payloads[0].get("outcomes")]
+
+
+class RunBatchTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def run_jobs(self, payloads):
+        enqueue_many("tests.batched", payloads)
+        worker = Worker(batch_size=10)
+        worker.run_claimed(worker.claim())
+        return worker
+
+    def test_outcomes_per_job(self):
+        worker = self.run_jobs([{"ok": True}, {"ok": False}, {"ok": True}])
+        self.assertEqual(calls, [3])
+        self.assertEqual((worker.processed, worker.failed), (2, 1))
+        job = Job.objects.get(name="tests.batched")
+        self.assertEqual((job.status, job.last_error, job.attempts), ("queued", "failed", 1))
+
+    def test_missing_outcomes_fail_whole_batch(self):
+        worker = self.run_jobs([{"ok": True, "outcomes": 2}, {"ok": True}, {"ok": True}])
+        self.assertEqual((worker.processed, worker.failed), (0, 3))
+        jobs = Job.objects.filter(name="tests.batched")
+        self.assertEqual(jobs.count(), 3)
+        for job in jobs:
+            self.assertEqual(job.status, "queued")
+            self.assertIn("returned 2 outcomes for 3 jobs", job.last_error)
@@ -8,4 +8,5 @@ urlpatterns = [
     path("highlights/", include("api.urls.bookmark_urls")),
     path("bookmarks/", include("api.urls.bookmark_urls")),
     path("focus/", include("api.urls.focus_urls")), 
+    path("leaderboards/", include("api.urls.leaderboard_urls")),
 ]
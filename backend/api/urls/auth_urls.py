@@ -1,5 +1,5 @@
 from django.urls import path
-from api.views.auth_views import RegisterView, LoginView, LogoutView, PasswordResetView, GoogleAuthView, VerifyEmailView, PasswordResetConfirmView, VerifyOTPView
+from api.views.auth_views import RegisterView, LoginView, LogoutView, PasswordResetView, GoogleAuthView, VerifyEmailView, PasswordResetConfirmView, VerifyOTPView, TimezoneView
 from django.urls import path
 
 
@@ -14,4 +14,5 @@ urlpatterns = [
     path("verify-email/", VerifyEmailView.as_view(), name="verify-email"),
     path("reset-password-confirm/", PasswordResetConfirmView.as_view(), name="reset-password-confirm"),
     path("verify-otp/", VerifyOTPView.as_view(), name="verify-otp"),  # ✅ New route for OTP verification
+    path("timezone/", TimezoneView.as_view(), name="timezone"),
 ]
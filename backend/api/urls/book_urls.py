@@ -1,11 +1,19 @@
 from django.urls import path
-from api.views.book_views import UploadBookView, ListBooksView, BookDetailView, DeleteBookView, CategoryListView, TagListView
+from api.views.book_views import UploadBookView, ListBooksView, BookSearchView, BookDetailView, BookContentView, BookPagesView, BookPageView, DeleteBookView, CategoryListView, TagListView
+from api.views.upload_views import UploadSessionCreateView, UploadSessionView, FinalizeUploadView
 
 
 urlpatterns = [
     path("upload/", UploadBookView.as_view(), name="upload_book"),
+    path("uploads/", UploadSessionCreateView.as_view(), name="upload_session_create"),
+    path("uploads/<uuid:pk>/", UploadSessionView.as_view(), name="upload_session"),
+    path("uploads/<uuid:pk>/finalize/", FinalizeUploadView.as_view(), name="upload_session_finalize"),
     path("", ListBooksView.as_view(), name="list_books"),
+    path("search/", BookSearchView.as_view(), name="search_books"),
     path("<int:pk>/", BookDetailView.as_view(), name="book_detail"),
+    path("<int:pk>/content/", BookContentView.as_view(), name="book_content"),
+    path("<int:pk>/pages/", BookPagesView.as_view(), name="book_pages"),
+    path("<int:pk>/pages/<int:number>/", BookPageView.as_view(), name="book_page"),
     path("<int:pk>/delete/", DeleteBookView.as_view(), name="delete_book"),
     path("categories/", CategoryListView.as_view(), name="list_categories"),  
     path("tags/", TagListView.as_view(), name="list_tags"), 
@@ -1,10 +1,29 @@
 from django.urls import path
+from api.views.blocked_views import BlockedAppViewSet, BlockedWebsiteViewSet, BlocklistCatalogView, BlocklistExclusionViewSet
 from api.views.focus_views import ReadingSessionViewSet, BlockingViewSet
 
 urlpatterns = [
     path("reading/start/", ReadingSessionViewSet.as_view({"post": "start_reading"}), name="start-reading"),
     path("reading/end/", ReadingSessionViewSet.as_view({"post": "end_reading"}), name="end-reading"),
     path("reading/stats/", ReadingSessionViewSet.as_view({"get": "reading_stats"}), name="reading-stats"),
+    path("reading/stats/daily/", ReadingSessionViewSet.as_view({"get": "daily_stats"}), name="reading-stats-daily"),
     path("blocking/activate/", BlockingViewSet.as_view({"post": "activate_blocking"}), name="activate-blocking"),
+    path("blocking/profile/", BlockingViewSet.as_view({"get": "profile"}), name="blocking-profile"),
+    path("blocking/catalog/", BlocklistCatalogView.as_view(), name="blocklist-catalog"),
+    path("blocking/subscriptions/", BlockingViewSet.as_view({"get": "subscriptions", "put": "subscriptions"}), name="blocking-subscriptions"),
+    path("blocking/exclusions/", BlocklistExclusionViewSet.as_view({"get": "list", "post": "create"}), name="blocking-exclusions"),
+    path("blocking/exclusions/<int:pk>/", BlocklistExclusionViewSet.as_view({"get": "retrieve", "delete": "destroy"}), name="blocking-exclusion"),
+    path("blocking/domains/", BlockingViewSet.as_view({"get": "domains"}), name="blocking-domains"),
+    path("blocking/check/", BlockingViewSet.as_view({"get": "check"}), name="blocking-check"),
     path("blocking/deactivate/", BlockingViewSet.as_view({"post": "deactivate_blocking"}), name="deactivate-blocking"),
+    path("blocked-apps/", BlockedAppViewSet.as_view({"get": "list", "post": "create"}), name="blocked-apps"),
+    path("blocked-apps/bulk/", BlockedAppViewSet.as_view({"get": "bulk", "put": "bulk"}), name="blocked-apps-bulk"),
+    path("blocked-apps/<int:pk>/", BlockedAppViewSet.as_view({
+        "get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy",
+    }), name="blocked-app"),
+    path("blocked-websites/", BlockedWebsiteViewSet.as_view({"get": "list", "post": "create"}), name="blocked-websites"),
+    path("blocked-websites/bulk/", BlockedWebsiteViewSet.as_view({"get": "bulk", "put": "bulk"}), name="blocked-websites-bulk"),
+    path("blocked-websites/<int:pk>/", BlockedWebsiteViewSet.as_view({
+        "get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy",
+    }), name="blocked-website"),
 ]
@@ -0,0 +1,9 @@
+from django.urls import path
+from api.views.leaderboard_views import LeaderboardView, LeaderboardRankView
+
+urlpatterns = [
+    path("category/<int:category_id>/", LeaderboardView.as_view(), {"board": "category"}, name="category_leaderboard"),
+    path("category/<int:category_id>/me/", LeaderboardRankView.as_view(), {"board": "category"}, name="category_leaderboard_rank"),
+    path("<str:board>/", LeaderboardView.as_view(), name="leaderboard"),
+    path("<str:board>/me/", LeaderboardRankView.as_view(), name="leaderboard_rank"),
+]
@@ -20,10 +20,12 @@ from api.serializers.auth_serializer import (
     UserSerializer,
     PasswordResetSerializer,
     GoogleAuthSerializer,
+    TimezoneSerializer,
 )
 from django.http import JsonResponse
 from datetime import timedelta, datetime
 from django.utils.timezone import now  # ✅ Fix missing import
+from core.timezones import ensure_current_days
 
 
 User = get_user_model()
@@ -162,6 +164,24 @@ class LogoutView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class TimezoneView(generics.RetrieveUpdateAPIView):
+    """
+    API to read or set the user's timezone, which decides when their reading day
+    (goal progress, streaks, daily stats) rolls over.
+    Example:
+        >>> client.put("/api/auth/timezone/", {"timezone": "America/New_York"})
+    """
+    serializer_class = TimezoneSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_object(self):
+        return self.request.user
+
+    def perform_update(self, serializer):
+        user = serializer.save()
+        ensure_current_days([user.timezone])  # ✅ The rollover finds the new timezone's days stored
+
+
 class PasswordResetView(generics.GenericAPIView):
     """
     API endpoint to request password reset.
@@ -1,22 +1,30 @@
 from rest_framework import generics, permissions
 from api.models.badge import Badge, UserBadge
 from api.serializers.badge_serializer import BadgeSerializer, UserBadgeSerializer
+from core import catalog
+from core.catalog import CatalogListMixin
+from core.pagination import KeysetPagination
+from core.query_planning import QueryPlanMixin
 
-class BadgeListView(generics.ListAPIView):
+class BadgeListView(CatalogListMixin, generics.ListAPIView):
     """
-    API to fetch all available badges.
+    API to fetch all available badges, from the catalog cache (no queries, ETag revalidation).
     """
     queryset = Badge.objects.all()
     serializer_class = BadgeSerializer
     permission_classes = [permissions.AllowAny]
+    authentication_classes = []  # ✅ Public list: skip the JWT user lookup too
+    catalog = catalog.badges
 
 
-class UserBadgeListView(generics.ListAPIView):
+class UserBadgeListView(QueryPlanMixin, generics.ListAPIView):
     """
     API to fetch all badges earned by the user.
     """
     serializer_class = UserBadgeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("-earned_at", "-id")
 
     def get_queryset(self):
         return UserBadge.objects.filter(user=self.request.user)
@@ -1,12 +1,50 @@
-from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
+from rest_framework import generics, status, viewsets
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from api.models.blocklists import BlocklistCategory, BlocklistExclusion
 from api.models.focus import BlockedApp, BlockedWebsite
-from api.serializers.focus_serializer import BlockedAppSerializer, BlockedWebsiteSerializer
+from api.serializers.focus_serializer import (
+    BlockedAppBulkSerializer, BlockedAppSerializer, BlockedWebsiteBulkSerializer, BlockedWebsiteSerializer,
+    BlocklistCategorySerializer, BlocklistExclusionSerializer,
+)
+from core import catalog
+from core.catalog import CatalogListMixin, blocklist_entries
+from core.domains import parse_rule
+from services.blocking import BlockingService
 
-class BlockedAppViewSet(viewsets.ModelViewSet):
+
+class BulkReplaceMixin:
+    """
+    `bulk` action: GET exports every row, PUT {"items": [...]} replaces them
+    with the given list (see `BlockingService.replace`). Both return the new
+    blocking profile version. Viewsets set `bulk_key`, the function matching
+    rows to items by their `bulk_fields` values.
+    """
+    bulk_serializer_class = None
+    bulk_fields = ()
+    bulk_key = None
+
+    def bulk(self, request):
+        if request.method == "PUT":
+            serializer = self.bulk_serializer_class(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            counts = BlockingService.replace(
+                request.user, self.get_queryset().model, self.bulk_key, self.bulk_fields, serializer.validated_data["items"]
+            )
+        else:
+            counts = {}
+        items = self.get_serializer(self.get_queryset().order_by("id"), many=True).data
+        version = BlockingService.profile(request.user)["version"]
+        return Response({**counts, "version": version, "items": items}, status=status.HTTP_200_OK)
+
+
+class BlockedAppViewSet(BulkReplaceMixin, viewsets.ModelViewSet):
     """Manage blocked apps"""
     serializer_class = BlockedAppSerializer
     permission_classes = [IsAuthenticated]
+    bulk_serializer_class = BlockedAppBulkSerializer
+    bulk_fields = ("app_name", "package_name")
+    bulk_key = staticmethod(lambda values: values.get("package_name") or values["app_name"])  # ✅ Apps without a package match by name
 
     def get_queryset(self):
         return BlockedApp.objects.filter(user=self.request.user)
@@ -15,13 +53,42 @@ class BlockedAppViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class BlockedWebsiteViewSet(viewsets.ModelViewSet):
+class BlockedWebsiteViewSet(BulkReplaceMixin, viewsets.ModelViewSet):
     """Manage blocked websites"""
     serializer_class = BlockedWebsiteSerializer
     permission_classes = [IsAuthenticated]
+    bulk_serializer_class = BlockedWebsiteBulkSerializer
+    bulk_fields = ("url",)
+    bulk_key = staticmethod(lambda values: parse_rule(values["url"])[0] or values["url"])  # 🔥 By host, as the profile compiler matches rules
 
     def get_queryset(self):
         return BlockedWebsite.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+
+class BlocklistCatalogView(CatalogListMixin, generics.ListAPIView):
+    """
+    API to fetch the curated blocklist categories with their apps and websites,
+    from the catalog cache (no queries, ETag revalidation).
+    """
+    queryset = BlocklistCategory.objects.all()
+    serializer_class = BlocklistCategorySerializer
+    permission_classes = [AllowAny]
+    authentication_classes = []  # ✅ Public list: skip the JWT user lookup too
+    catalog = catalog.blocklist_categories
+    catalog_depends_on = (blocklist_entries,)  # ✅ Each category renders its entries
+
+
+class BlocklistExclusionViewSet(viewsets.ModelViewSet):
+    """Manage apps and websites kept reachable despite a subscribed category"""
+    serializer_class = BlocklistExclusionSerializer
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get", "post", "delete"]
+
+    def get_queryset(self):
+        return BlocklistExclusion.objects.filter(user=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
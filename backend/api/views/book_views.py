@@ -1,9 +1,19 @@
-from rest_framework import generics, permissions, filters
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from rest_framework import generics, permissions, serializers, status
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from api.models.book import Book, Category, Tag
+from api.models.book import Book, BookPage, Category, Tag
 from api.serializers.book_serializer import BookSerializer, CategorySerializer, TagSerializer
+from core import catalog
+from core.catalog import CatalogListMixin
+from core.http import ranged_file_response
+from core.pagination import KeysetPagination
+from core.query_planning import QueryPlanMixin
+from core.uploads import HashingFileUploadHandler, UploadTooLarge
+from services.book_ingest import BookIngestService
+from services.search import BookSearchFilter, get_search_backend
 
 class UploadBookView(generics.CreateAPIView):
     """
@@ -13,51 +23,97 @@ class UploadBookView(generics.CreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
 
-    def perform_create(self, serializer):
-        title = self.request.data.get("title")
-        existing_book = Book.objects.filter(user=self.request.user, title__iexact=title).first()
-
-        if existing_book:
-            return Response({"error": "You have already uploaded a book with this title."}, status=400)
-        
-        print("Received data:", self.request.data)  # 🔥 Debugging line
-
-        category_name = self.request.data.get("category")  # 🔥 Get category name
-        tag_names = self.request.data.getlist("tags")  # 🔥 Get tags as a list
-
-        # 🔥 Find or create category
-        category = Category.objects.filter(name__iexact=category_name).first()
-        if not category and category_name:
-            category = Category.objects.create(name=category_name)
-
-        # 🔥 Find or create tags
-        tag_objects = []
-        for tag_name in tag_names:
-            tag, created = Tag.objects.get_or_create(name=tag_name.lower())  # 🔥 Make tag lowercase
-            tag_objects.append(tag)
+    def initialize_request(self, request, *args, **kwargs):
+        """
+        Stream the upload to disk and hash it as it arrives, instead of
+        buffering it with Django's default handlers and hashing it later.
+        """
+        self.upload_handler = HashingFileUploadHandler(request)
+        request.upload_handlers = [self.upload_handler]
+        return super().initialize_request(request, *args, **kwargs)
+
+    def create(self, request, *args, **kwargs):
+        request.data  # 🔥 Parse the body so the handler can flag oversized files
+        if self.upload_handler.too_large:
+            raise UploadTooLarge()
+        return super().create(request, *args, **kwargs)
 
-        # 🔥 Save book with category & tags
-        book = serializer.save(user=self.request.user, category=category)
-        book.tags.set(tag_objects)
-
-
-class ListBooksView(generics.ListAPIView):
+    def perform_create(self, serializer):
+        upload = serializer.validated_data["file"]
+        try:
+            serializer.instance = BookIngestService.create_book(
+                user=self.request.user,
+                content=upload,
+                title=serializer.validated_data["title"],
+                author=serializer.validated_data.get("author", ""),
+                category_name=self.request.data.get("category"),  # 🔥 Get category name
+                tag_names=self.request.data.getlist("tags"),  # 🔥 Get tags as a list
+                sha256=getattr(upload, "sha256", ""),
+            )
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(BookIngestService.error_detail(e))
+
+
+class ListBooksView(QueryPlanMixin, generics.ListAPIView):
     """
-    API to list all books.
+    API to list all books, newest first, one cursor page at a time.
     """
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    @property
+    def keyset_ordering(self):
+        # 🔥 Ranked searches page through the relevance order set by BookSearchFilter
+        if self.request.query_params.get(BookSearchFilter.search_param, "").strip():
+            return ("-search_rank", "-id")
+        return ("-uploaded_at", "-id")
 
     
       # 🔥 Enable search & filtering
-    filter_backends = [filters.SearchFilter, DjangoFilterBackend]
-    search_fields = ["title", "author"]  # 🔍 Allow searching by title & author
+    filter_backends = [BookSearchFilter, DjangoFilterBackend]  # 🔍 Ranked full-text search over title, author, tags, category & pages
     filterset_fields = ["category", "tags__name"]  # 🔥 Filter by category & tag
     filterset_fields = ["uploaded_at"]  # ⏳ Allow filtering by upload date
 
 
-class BookDetailView(generics.RetrieveAPIView):
+class BookSearchView(QueryPlanMixin, generics.GenericAPIView):
+    """
+    API to search books by title, author, tags, category and page text,
+    returning ranked matches with a highlighted snippet.
+    Example:
+        >>> client.get("/api/v1/books/search/?q=dune arrakis&limit=10")
+    """
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response({"error": "A search query is required."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        except ValueError:
+            return Response({"error": "limit must be a number."}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = get_search_backend().search(query, limit)
+        books = self.filter_queryset(self.get_queryset()).in_bulk([result.book_id for result in results])
+        return Response({
+            "query": query,
+            "results": [
+                {
+                    "book": self.get_serializer(books[result.book_id]).data,
+                    "rank": result.rank,
+                    "page": result.page,
+                    "snippet": result.snippet,
+                }
+                for result in results if result.book_id in books
+            ],
+        }, status=status.HTTP_200_OK)
+
+
+class BookDetailView(QueryPlanMixin, generics.RetrieveAPIView):
     """
     API to get details of a book.
     """
@@ -66,6 +122,68 @@ class BookDetailView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
 
+class BookContentView(generics.GenericAPIView):
+    """
+    API to download a book's file, supporting `Range` requests and
+    `If-None-Match` revalidation with the file hash as a strong ETag.
+    """
+    queryset = Book.objects.all()
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        book = self.get_object()
+        storage = book.file.storage
+        try:
+            file = storage.open(book.file.name, "rb")
+        except FileNotFoundError:
+            raise Http404("Book file is missing.")
+        return ranged_file_response(request, file, storage.size(book.file.name), book.file_hash)
+
+
+class BookPagesView(generics.GenericAPIView):
+    """
+    API to get a book's page count and text extraction status.
+    """
+    queryset = Book.objects.select_related("blob")
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        book = self.get_object()
+        return Response({
+            "book": book.pk,
+            "status": book.blob.text_status if book.blob else "unsupported",
+            "page_count": book.blob.page_count if book.blob else None,
+        }, status=status.HTTP_200_OK)
+
+
+class BookPageView(BookPagesView):
+    """
+    API to get the extracted text of a single page.
+    Example:
+        >>> client.get("/api/v1/books/12/pages/42/")
+    """
+
+    def get(self, request, *args, **kwargs):
+        book = self.get_object()
+        if not book.blob or book.blob.text_status != "ready":
+            # 🔥 Extraction still running (or impossible) — tell the reader to fall back to the file
+            return Response({
+                "book": book.pk,
+                "status": book.blob.text_status if book.blob else "unsupported",
+            }, status=status.HTTP_202_ACCEPTED)
+
+        page = BookPage.objects.filter(blob_id=book.blob_id, number=kwargs["number"]).values_list("text", flat=True).first()
+        if page is None:
+            return Response({"error": "Page not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({
+            "book": book.pk,
+            "page": kwargs["number"],
+            "page_count": book.blob.page_count,
+            "text": page,
+        }, status=status.HTTP_200_OK)
+
+
 class DeleteBookView(generics.DestroyAPIView):
     """
     API to delete a book.
@@ -77,19 +195,23 @@ class DeleteBookView(generics.DestroyAPIView):
         return Book.objects.filter(user=self.request.user)  # 🔥 Users can only delete their books
 
 
-class CategoryListView(generics.ListAPIView):
+class CategoryListView(CatalogListMixin, generics.ListAPIView):
     """
-    API to fetch all book categories.
+    API to fetch all book categories, from the catalog cache (no queries, ETag revalidation).
     """
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+    catalog = catalog.categories
 
 
-class TagListView(generics.ListAPIView):
+class TagListView(CatalogListMixin, generics.ListAPIView):
     """
-    API to fetch all available book tags.
+    API to fetch all available book tags, from the catalog cache (no queries, ETag revalidation).
     """
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
-    permission_classes = [permissions.AllowAny]
\ No newline at end of file
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+    catalog = catalog.tags
\ No newline at end of file
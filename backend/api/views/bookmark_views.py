@@ -1,13 +1,16 @@
 from rest_framework import generics, permissions
 from api.models.bookmark import Bookmark, Highlight
 from api.serializers.bookmark_serializer import BookmarkSerializer, HighlightSerializer
+from core.pagination import KeysetPagination
+from core.query_planning import QueryPlanMixin
 
-class BookmarkListView(generics.ListCreateAPIView):
+class BookmarkListView(QueryPlanMixin, generics.ListCreateAPIView):
     """
     API to add & list bookmarks for a user.
     """
     serializer_class = BookmarkSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         return Bookmark.objects.filter(user=self.request.user)
@@ -27,12 +30,13 @@ class BookmarkDeleteView(generics.DestroyAPIView):
         return Bookmark.objects.filter(user=self.request.user)
 
 
-class HighlightListView(generics.ListCreateAPIView):
+class HighlightListView(QueryPlanMixin, generics.ListCreateAPIView):
     """
     API to add & list multiple highlights for a user per page.
     """
     serializer_class = HighlightSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """
@@ -3,12 +3,18 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.utils.timezone import now, timedelta
 from api.models.focus import ReadingSession, BlockedApp, BlockedWebsite
-from api.serializers.focus_serializer import ReadingSessionSerializer, BlockedAppSerializer, BlockedWebsiteSerializer
+from api.models.stats import ReadingStats, DailyReadingStats
+from api.serializers.focus_serializer import ReadingSessionSerializer, ReadingStatsSerializer, DailyReadingStatsSerializer, BlockedAppSerializer, BlockedWebsiteSerializer, BlocklistSubscriptionSerializer
 from django.contrib.auth import get_user_model
-from services.blocking import BlockingService
+from django.http import HttpResponse
+from services.blocking import BlockingService, curated_lists
+from core.http import etag_matches
+from core.pagination import KeysetPagination
+from core.timezones import local_date
 
 class ReadingSessionViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-start_time", "-id")
 
     def start_reading(self, request):
         """Start a new reading session & enforce blocking."""
@@ -67,10 +73,33 @@ class ReadingSessionViewSet(viewsets.ViewSet):
 
 
     def reading_stats(self, request):
-        """Return reading stats for the user."""
-        sessions = ReadingSession.objects.filter(user=request.user)
-        serializer = ReadingSessionSerializer(sessions, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        """
+        Return the user's maintained reading totals plus their sessions,
+        newest first, one cursor page at a time.
+        """
+        stats = ReadingStats.objects.filter(user=request.user).first() or ReadingStats(user=request.user)
+        paginator = KeysetPagination()
+        sessions = paginator.paginate_queryset(ReadingSession.objects.filter(user=request.user), request, view=self)
+        return Response({
+            "summary": ReadingStatsSerializer(stats).data,
+            "next": paginator.get_next_link(),
+            "results": ReadingSessionSerializer(sessions, many=True).data,
+        }, status=status.HTTP_200_OK)
+
+    def daily_stats(self, request):
+        """
+        Return per-day reading totals for the last `days` days (default 30, at most 366).
+        Example:
+            >>> client.get("/api/v1/focus/reading/stats/daily/?days=7")
+        """
+        try:
+            days = min(max(int(request.query_params.get("days", 30)), 1), 366)
+        except ValueError:
+            return Response({"error": "days must be a number."}, status=status.HTTP_400_BAD_REQUEST)
+
+        since = local_date(request.user.timezone) - timedelta(days=days - 1)
+        daily = DailyReadingStats.objects.filter(user=request.user, date__gte=since).order_by("date")
+        return Response(DailyReadingStatsSerializer(daily, many=True).data, status=status.HTTP_200_OK)
     
     def enforce_hard_lock(self, user):
         """Simulate hard lock by restricting access to other apps completely."""
@@ -93,6 +122,55 @@ class BlockingViewSet(viewsets.ViewSet):
         config = BlockingService.enforce(request.user)
         return Response({"message": "Blocking activated", "config": config}, status=status.HTTP_200_OK)
     
+    def profile(self, request):
+        """
+        Return the user's compiled blocking profile, revalidated with ETag / If-None-Match.
+        Example:
+            >>> client.get("/api/v1/focus/blocking/profile/", HTTP_IF_NONE_MATCH='"<version>"')
+        """
+        profile = BlockingService.profile(request.user)
+        headers = {"ETag": f'"{profile["version"]}"', "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("If-None-Match", ""), headers["ETag"]):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(profile, status=status.HTTP_200_OK, headers=headers)
+
+    def subscriptions(self, request):
+        """
+        Return the curated categories the user subscribes to; PUT replaces them.
+        Example:
+            >>> client.put("/api/v1/focus/blocking/subscriptions/", {"categories": ["social", "video"]})
+        """
+        if request.method == "PUT":
+            serializer = BlocklistSubscriptionSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            BlockingService.subscribe(request.user, serializer.validated_data["categories"])
+        profile = BlockingService.profile(request.user)
+        return Response({"categories": profile["categories"], "version": profile["version"]}, status=status.HTTP_200_OK)
+
+    def domains(self, request):
+        """
+        Return the user's blocked websites plus the curated `lists` as a compiled
+        domain trie (binary, see core.domains), revalidated with ETag / If-None-Match.
+        Example:
+            >>> client.get("/api/v1/focus/blocking/domains/?lists=news")
+        """
+        data, version = BlockingService.domain_artifact(request.user, curated_lists(request.query_params.get("lists")))
+        headers = {"ETag": f'"{version}"', "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("If-None-Match", ""), headers["ETag"]):
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return HttpResponse(data, content_type="application/octet-stream", headers=headers)
+
+    def check(self, request):
+        """
+        Return whether a URL is blocked for the user, and by which rule.
+        Example:
+            >>> client.get("/api/v1/focus/blocking/check/?url=https://m.youtube.com/watch&lists=video")
+        """
+        result = BlockingService.check(
+            request.user, request.query_params.get("url"), curated_lists(request.query_params.get("lists"))
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
     def restore_access(self, user):
          user_identifier = getattr(user, "username", None) or getattr(user, "email", "Unknown User")
          print(f"Restoring access for user: {user_identifier}")
@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.http import Http404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from api.models.leaderboard import LONGEST, STREAK, LeaderboardBucket, LeaderboardEntry, category_board, weekly_board
+from api.serializers.leaderboard_serializer import LeaderboardEntrySerializer
+from core import catalog
+from core.timezones import local_date
+
+
+def resolve_board(user, board, category_id=None):
+    """Maps a URL board name to its stored key; "weekly" is the user's current local week."""
+    if board == "category":
+        if catalog.categories.get(category_id) is None:
+            raise Http404("Unknown category")
+        return category_board(category_id)
+    if board == "weekly":
+        return weekly_board(local_date(user.timezone))
+    if board in (STREAK, LONGEST):
+        return board
+    raise Http404("Unknown leaderboard")
+
+
+def bounded(value, default, maximum):
+    try:
+        return min(max(int(value), 1), maximum)
+    except (TypeError, ValueError):
+        return default
+
+
+class LeaderboardView(APIView):
+    """
+    API to fetch the top of a leaderboard (streak, longest, weekly or category/<id>).
+    Example:
+        >>> client.get("/api/leaderboards/streak/?limit=10")
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, board, category_id=None):
+        key = resolve_board(request.user, board, category_id)
+        limit = bounded(request.query_params.get("limit"), settings.LEADERBOARD_PAGE_SIZE, settings.LEADERBOARD_MAX_PAGE_SIZE)
+        return Response({
+            "board": key,
+            "total": LeaderboardBucket.objects.size(key),
+            "results": LeaderboardEntrySerializer(LeaderboardEntry.objects.top(key, limit), many=True).data,
+        }, status=200)
+
+
+class LeaderboardRankView(APIView):
+    """
+    API to fetch the user's rank on a leaderboard with the users around them.
+    Example:
+        >>> client.get("/api/leaderboards/weekly/me/?around=5")
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, board, category_id=None):
+        key = resolve_board(request.user, board, category_id)
+        count = bounded(request.query_params.get("around"), settings.LEADERBOARD_NEIGHBOURS, settings.LEADERBOARD_MAX_NEIGHBOURS)
+        me, window = LeaderboardEntry.objects.around(key, request.user.id, count)
+        return Response({
+            "board": key,
+            "total": LeaderboardBucket.objects.size(key),
+            "rank": me.rank if me else None,  # ✅ Not on the board until the first completion
+            "score": me.score if me else 0,
+            "neighbours": LeaderboardEntrySerializer(window, many=True).data,
+        }, status=200)
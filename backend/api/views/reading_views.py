@@ -1,11 +1,17 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from api.models.reading import ReadingGoal, ReadingHistory
+from api.models.calendar import ReadingCalendar
+from api.models.reading import ReadingGoal
+from api.models.stats import ReadingStats
+from api.serializers.bookmark_serializer import BookmarkSerializer, HighlightSerializer
+from api.serializers.focus_serializer import ReadingSessionSerializer, ReadingStatsSerializer
 from api.serializers.reading_serializer import ReadingGoalSerializer
-from django.utils import timezone
-from django.utils.timezone import now, localtime
-from datetime import timedelta
+from api.serializers.sync_serializer import ReadingSyncSerializer
+from core.timezones import local_date
+from services.reading_sync import ReadingSyncService
+from datetime import date, timedelta
 
 class SetReadingGoalView(generics.CreateAPIView):
     """
@@ -26,6 +32,7 @@ class SetReadingGoalView(generics.CreateAPIView):
                     "goal_target": serializer.validated_data["goal_target"],
                     "progress": 0,
                     "is_completed": False,
+                    "progress_date": local_date(request.user.timezone),
                 },
             )
             return Response(ReadingGoalSerializer(goal).data, status=status.HTTP_201_CREATED)
@@ -41,14 +48,58 @@ class UpdateProgressView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
-        goal = ReadingGoal.objects.filter(user=request.user).first()
+        try:
+            amount = int(request.data.get("amount", 0))
+        except (TypeError, ValueError):
+            return Response({"error": "amount must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        if amount < 0:
+            return Response({"error": "amount cannot be negative"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 🔥 One atomic UPDATE ... RETURNING: no read-modify-write, no lost increments
+        goal, just_completed = ReadingGoal.objects.add_progress(request.user.id, amount, local_date(request.user.timezone))
         if not goal:
             return Response({"error": "No reading goal set"}, status=status.HTTP_400_BAD_REQUEST)
 
-        amount = request.data.get("amount", 0)
-        goal.update_progress(amount)
+        return Response({**ReadingGoalSerializer(goal).data, "just_completed": just_completed}, status=status.HTTP_200_OK)
 
-        return Response(ReadingGoalSerializer(goal).data, status=status.HTTP_200_OK)
+
+class ReadingSyncView(APIView):
+    """
+    API to upload everything read offline in one request: an ordered batch of
+    progress, session, bookmark and highlight events, each with a client
+    timestamp and an idempotency key. The batch is applied in one transaction
+    and the response carries the reconciled goal and stats. Progress counts
+    toward the day of its client timestamp; `expired` lists progress events
+    from days the goal had already moved past, which were not credited.
+    Example:
+        >>> client.post("/api/reading/sync/", {"events": [
+        ...     {"key": "6f1c...", "type": "progress", "client_time": "2025-03-01T08:15:00Z", "amount": 1},
+        ...     {"key": "9a0e...", "type": "bookmark", "client_time": "2025-03-01T08:16:00Z", "book": 7, "page_number": 42},
+        ... ]}, format="json")
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = ReadingSyncSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            result = ReadingSyncService.apply(request.user, serializer.validated_data["events"])
+        except DjangoValidationError as e:
+            return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
+
+        stats = ReadingStats.objects.filter(user=request.user).first() or ReadingStats(user=request.user)
+        return Response({
+            "applied": result["applied"],
+            "duplicates": result["duplicates"],
+            "expired": result["expired"],
+            "goal": ReadingGoalSerializer(result["goal"]).data if result["goal"] else None,
+            "just_completed": result["just_completed"],
+            "stats": ReadingStatsSerializer(stats).data,
+            "sessions": ReadingSessionSerializer(result["sessions"], many=True).data,
+            "bookmarks": BookmarkSerializer(result["bookmarks"], many=True).data,
+            "highlights": HighlightSerializer(result["highlights"], many=True).data,
+        }, status=status.HTTP_200_OK)
 
 
 class GetReadingGoalView(generics.RetrieveAPIView):
@@ -77,11 +128,20 @@ class GetReadingStreakView(APIView):
             return Response({"error": "No reading goal set"}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({
-            "streak_count": goal.streak_count,
+            "streak_count": goal.current_streak(local_date(request.user.timezone)),
             "last_completed_date": goal.last_completed_date,
         }, status=status.HTTP_200_OK)
 
 
+def streak_history(days, first, last):
+    """The read days from `first` to `last`, each with the streak it reached."""
+    return [
+        {"date": day, "streak_count": days.streak_ending(day)}
+        for day in (first + timedelta(days=offset) for offset in range((last - first).days + 1))
+        if days.read(day)
+    ]
+
+
 class WeeklyStreakView(APIView):
     """
     API to fetch weekly reading streak history.
@@ -90,14 +150,12 @@ class WeeklyStreakView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        today = localtime(now()).date()
+        today = local_date(request.user.timezone)
         week_start = today - timedelta(days=today.weekday())  # 🔥 Get Monday of this week
-        week_data = ReadingHistory.objects.filter(user=request.user, date__gte=week_start)
+        days = ReadingCalendar.objects.days_for(request.user.id)
 
         return Response({
-            "weekly_streaks": [
-                {"date": record.date, "streak_count": record.streak_count} for record in week_data
-            ]
+            "weekly_streaks": streak_history(days, week_start, today)
         }, status=200)
 
 
@@ -109,13 +167,48 @@ class MonthlyStreakView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        today = localtime(now()).date()
+        today = local_date(request.user.timezone)
         month_start = today.replace(day=1)  # 🔥 Get 1st day of this month
-        month_data = ReadingHistory.objects.filter(user=request.user, date__gte=month_start)
+        days = ReadingCalendar.objects.days_for(request.user.id)
 
         return Response({
-            "monthly_streaks": [
-                {"date": record.date, "streak_count": record.streak_count} for record in month_data
-            ]
+            "monthly_streaks": streak_history(days, month_start, today)
         }, status=200)
 
+
+class ReadingCalendarView(APIView):
+    """
+    API to fetch a year of reading as a heatmap with weekly, monthly and yearly totals and streaks.
+    Example:
+        >>> client.get("/api/reading/calendar/?year=2025")
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        today = local_date(request.user.timezone)
+        try:
+            year = int(request.query_params.get("year", today.year))
+        except ValueError:
+            return Response({"error": "year must be a number"}, status=status.HTTP_400_BAD_REQUEST)
+        if not 2000 <= year <= today.year:
+            return Response({"error": "year out of range"}, status=status.HTTP_400_BAD_REQUEST)
+
+        days = ReadingCalendar.objects.days_for(request.user.id)
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        weeks = [first - timedelta(days=first.weekday()) + timedelta(weeks=week) for week in range(54)]
+        return Response({
+            "year": year,
+            "heatmap": days.heatmap(year),
+            "days_read": days.count(first, last),
+            "months": [
+                days.count(date(year, month, 1), date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1))
+                for month in range(1, 13)
+            ],
+            "weeks": [
+                {"week_start": start, "days_read": days.count(start, start + timedelta(days=6))}
+                for start in weeks if start <= last
+            ],
+            "longest_streak": days.longest_streak(year),
+            "current_streak": days.current_streak(today),
+        }, status=200)
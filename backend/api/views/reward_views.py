@@ -2,13 +2,17 @@ from rest_framework import generics, permissions
 from rest_framework.response import Response
 from api.models.rewards import UserReward
 from api.serializers.reward_serializer import UserRewardSerializer
+from core.pagination import KeysetPagination
+from core.query_planning import QueryPlanMixin
 
-class UserRewardListView(generics.ListAPIView):
+class UserRewardListView(QueryPlanMixin, generics.ListAPIView):
     """
     API to fetch all rewards earned by the user.
     """
     serializer_class = UserRewardSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("-earned_at", "-id")
 
     def get_queryset(self):
         return UserReward.objects.filter(user=self.request.user, redeemed=False)
@@ -0,0 +1,196 @@
+import hashlib
+import os
+import shutil
+import uuid
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from api.models.book import Book, BookBlob
+from api.models.upload import UploadSession
+from api.serializers.book_serializer import BookSerializer
+from api.serializers.upload_serializer import UploadSessionSerializer
+from core.uploads import StagedUpload, UploadTooLarge
+from services.book_ingest import BookIngestService
+
+
+class UploadSessionMixin:
+    """
+    Shared lookup and offset reporting for resumable upload endpoints.
+    """
+
+    def get_session(self, pk, lock=False):
+        sessions = UploadSession.objects.active().filter(user=self.request.user)
+        if lock:
+            sessions = sessions.select_for_update()
+        return get_object_or_404(sessions, pk=pk)
+
+    def offset_response(self, session, status_code=status.HTTP_200_OK):
+        response = Response({
+            "id": session.pk,
+            "offset": session.offset,
+            "size": session.total_size,
+            "expires_at": session.expires_at,
+        }, status=status_code)
+        response["Upload-Offset"] = str(session.offset)
+        return response
+
+
+class UploadSessionCreateView(generics.CreateAPIView):
+    """
+    API to start a resumable upload.
+    Example:
+        >>> client.post("/api/v1/books/uploads/", {"title": "Dune", "filename": "dune.pdf", "size": 209715200, "sha256": "..."})
+    """
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def perform_create(self, serializer):
+        session = serializer.save(user=self.request.user)
+        os.makedirs(settings.BOOK_UPLOAD_STAGING_DIR, exist_ok=True)
+        open(session.staging_path, "wb").close()
+
+
+class UploadSessionView(UploadSessionMixin, APIView):
+    """
+    API to query the offset of a resumable upload (GET/HEAD), append a chunk
+    at that offset (PUT with `?offset=` or an `Upload-Offset` header), or abort it (DELETE).
+    Example:
+        >>> client.put(f"/api/v1/books/uploads/{upload_id}/?offset=0", chunk, content_type="application/octet-stream")
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        return self.offset_response(self.get_session(pk))
+
+    def put(self, request, pk):
+        try:
+            offset = int(request.query_params.get("offset", request.headers.get("Upload-Offset")))
+        except (TypeError, ValueError):
+            return Response({"error": "A numeric chunk offset is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        length = int(request.META.get("CONTENT_LENGTH") or 0)
+        if length <= 0:
+            return Response({"error": "Chunk body is empty."}, status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.BOOK_UPLOAD_MAX_CHUNK_BYTES:
+            raise UploadTooLarge(f"Chunks may not exceed {settings.BOOK_UPLOAD_MAX_CHUNK_BYTES} bytes.")
+
+        # 🔥 Only the next missing byte range is accepted; the client resumes from the returned offset
+        session = self.get_session(pk)
+        if offset != session.offset:
+            return self.offset_response(session, status.HTTP_409_CONFLICT)
+        if offset + length > session.total_size:
+            return Response({"error": "Chunk extends past the declared file size."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # ✅ The body is received into its own file first, so the session is only locked for a local append
+        chunk_path = f"{session.staging_path}.{uuid.uuid4().hex}"
+        try:
+            if not self.receive_chunk(chunk_path, request.stream, length):
+                return Response({"error": "Chunk ended before Content-Length bytes were received."}, status=status.HTTP_400_BAD_REQUEST)
+
+            with transaction.atomic():
+                session = self.get_session(pk, lock=True)
+                if offset != session.offset:  # 🔥 Another request appended this range meanwhile
+                    return self.offset_response(session, status.HTTP_409_CONFLICT)
+                if offset and not os.path.exists(session.staging_path):
+                    session.delete()
+                    return Response({"error": "Staged data was lost, restart the upload."}, status=status.HTTP_410_GONE)
+
+                self.append_chunk(session.staging_path, chunk_path, offset)
+                session.offset = offset + length
+                session.save(update_fields=["offset"])
+        finally:
+            try:
+                os.remove(chunk_path)
+            except FileNotFoundError:
+                pass
+
+        return self.offset_response(session)
+
+    def delete(self, request, pk):
+        self.get_session(pk).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def receive_chunk(self, path, stream, length):
+        """Reads `length` bytes from the request stream into a new file; False if the body ends early."""
+        with open(path, "wb") as chunk_file:
+            remaining = length
+            while remaining:
+                chunk = stream.read(min(remaining, settings.BOOK_UPLOAD_CHUNK_SIZE))
+                if not chunk:
+                    return False
+                chunk_file.write(chunk)
+                remaining -= len(chunk)
+        return True
+
+    def append_chunk(self, path, chunk_path, offset):
+        """
+        Copies a received chunk into the staged file at `offset`, replacing anything a failed
+        attempt left past it. The offset is only advanced once the bytes are on disk.
+        """
+        with open(path, "r+b" if os.path.exists(path) else "w+b") as staged, open(chunk_path, "rb") as chunk_file:
+            staged.seek(offset)
+            staged.truncate()
+            shutil.copyfileobj(chunk_file, staged, settings.BOOK_UPLOAD_CHUNK_SIZE)
+            staged.flush()
+            os.fsync(staged.fileno())
+
+
+class FinalizeUploadView(UploadSessionMixin, APIView):
+    """
+    API to verify a fully staged upload against its declared SHA-256 and turn it into a Book.
+    Example:
+        >>> client.post(f"/api/v1/books/uploads/{upload_id}/finalize/")
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        session = self.get_session(pk)
+        if not session.is_complete:
+            response = self.offset_response(session, status.HTTP_400_BAD_REQUEST)
+            response.data["error"] = "Upload is incomplete."
+            return response
+
+        # 🔥 Hashed before locking: a complete upload accepts no more chunks, so the staged file cannot change
+        digest = self.hash_staged_file(session.staging_path)
+
+        with BookBlob.objects.storing():
+            session = self.get_session(pk, lock=True)  # ✅ A concurrent finalize of this upload already won: 404
+            if digest != session.sha256:
+                session.delete()
+                return Response({"error": "Checksum mismatch, restart the upload."}, status=status.HTTP_400_BAD_REQUEST)
+
+            if Book.objects.filter(user=request.user, file_hash=digest).exists():
+                session.delete()
+                return Response({"file": ["This book has already been uploaded."]}, status=status.HTTP_400_BAD_REQUEST)
+
+            content = StagedUpload(session.staging_path, session.filename)
+            try:
+                book = BookIngestService.create_book(
+                    user=request.user,
+                    content=content,
+                    title=session.title,
+                    author=session.author,
+                    category_name=session.category,
+                    tag_names=session.tags,
+                    sha256=digest,
+                )
+            except DjangoValidationError as e:
+                session.delete()  # ✅ The staged file may have been moved into the blob that was just rolled back
+                return Response(BookIngestService.error_detail(e), status=status.HTTP_400_BAD_REQUEST)
+            finally:
+                content.close()
+
+            session.delete()
+
+        return Response(BookSerializer(book, context={"request": request}).data, status=status.HTTP_201_CREATED)
+
+    def hash_staged_file(self, path):
+        hasher = hashlib.sha256()
+        with open(path, "rb") as staged:
+            while chunk := staged.read(settings.BOOK_UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+        return hasher.hexdigest()
@@ -32,11 +32,14 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'fallback-secret-key')
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
-# Default Email Backend (Only for Development)
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
-
-# Default Email Backend (Only for Development)
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Default Email Backend (console for development; core.mail.PooledSMTPEmailBackend in production)
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', 587))
+EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'true').lower() == 'true'
+EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', 30))
 DEFAULT_FROM_EMAIL = "Codexia <noreply@example.com>"
 
 ALLOWED_HOSTS = ['codexia.onrender.com', 'localhost', '127.0.0.1', 'www.codexia.onrender.com']
@@ -79,6 +82,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',  # 🔥 First, so wall time covers every other middleware
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -219,6 +223,100 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.getenv('MEDIA_ROOT', BASE_DIR / 'media')
 
+# Book uploads are streamed to disk and hashed in BOOK_UPLOAD_CHUNK_SIZE pieces,
+# so memory per upload stays at one chunk; anything above BOOK_UPLOAD_MAX_BYTES is rejected.
+BOOK_UPLOAD_CHUNK_SIZE = int(os.getenv('BOOK_UPLOAD_CHUNK_SIZE', 256 * 1024))
+BOOK_UPLOAD_MAX_BYTES = int(os.getenv('BOOK_UPLOAD_MAX_BYTES', 512 * 1024 * 1024))
+
+# Resumable uploads stage chunks on local disk and expire when idle for BOOK_UPLOAD_SESSION_TTL.
+BOOK_UPLOAD_STAGING_DIR = os.getenv('BOOK_UPLOAD_STAGING_DIR', BASE_DIR / 'upload_staging')
+BOOK_UPLOAD_MAX_CHUNK_BYTES = int(os.getenv('BOOK_UPLOAD_MAX_CHUNK_BYTES', 16 * 1024 * 1024))
+BOOK_UPLOAD_SESSION_TTL = timedelta(hours=int(os.getenv('BOOK_UPLOAD_SESSION_TTL_HOURS', 24)))
+
+# Per-page text extraction runs on the job workers (core.tasks) after uploads commit; an extraction
+# still unfinished after TEXT_EXTRACTION_TIMEOUT is assumed dead and requeued.
+# Plain-text books without form feeds are split into pages of about TEXT_EXTRACTION_PAGE_CHARS characters.
+TEXT_EXTRACTION_TIMEOUT = timedelta(minutes=int(os.getenv('TEXT_EXTRACTION_TIMEOUT_MINUTES', 30)))
+TEXT_EXTRACTION_PAGE_CHARS = int(os.getenv('TEXT_EXTRACTION_PAGE_CHARS', 3000))
+
+# Full-text search: Postgres text search configuration for book and page vectors;
+# list endpoints rank at most BOOK_SEARCH_MAX_RESULTS matches.
+BOOK_SEARCH_CONFIG = os.getenv('BOOK_SEARCH_CONFIG', 'english')
+BOOK_SEARCH_MAX_RESULTS = int(os.getenv('BOOK_SEARCH_MAX_RESULTS', 1000))
+
+# Offline sync (reading/sync/): events per batch, each applied once per idempotency key.
+SYNC_MAX_EVENTS = int(os.getenv('SYNC_MAX_EVENTS', 1000))
+
+# Daily goal rollover (services.goal_rollover): workers run it every ROLLOVER_INTERVAL_MINUTES, so each
+# user's day turns over within that long after their local midnight; ROLLOVER_CHUNK_SIZE user ids per transaction.
+ROLLOVER_INTERVAL_MINUTES = int(os.getenv('ROLLOVER_INTERVAL_MINUTES', 15))
+ROLLOVER_CHUNK_SIZE = int(os.getenv('ROLLOVER_CHUNK_SIZE', 10000))
+
+# Leaderboards (leaderboards/): page sizes for top N and "around me"; weekly boards older than
+# LEADERBOARD_WEEKLY_KEEP_WEEKS are pruned daily (services.leaderboards).
+LEADERBOARD_PAGE_SIZE = int(os.getenv('LEADERBOARD_PAGE_SIZE', 50))
+LEADERBOARD_MAX_PAGE_SIZE = int(os.getenv('LEADERBOARD_MAX_PAGE_SIZE', 200))
+LEADERBOARD_NEIGHBOURS = int(os.getenv('LEADERBOARD_NEIGHBOURS', 5))
+LEADERBOARD_MAX_NEIGHBOURS = int(os.getenv('LEADERBOARD_MAX_NEIGHBOURS', 50))
+LEADERBOARD_WEEKLY_KEEP_WEEKS = int(os.getenv('LEADERBOARD_WEEKLY_KEEP_WEEKS', 8))
+
+# Per-request instrumentation (core.middleware): query count, DB/serializer/wall time as Server-Timing
+# and JSON log lines; a sample of requests keeps its SQL for the slow-request log.
+REQUEST_METRICS_SLOW_MS = int(os.getenv('REQUEST_METRICS_SLOW_MS', 500))
+REQUEST_METRICS_SQL_SAMPLE_RATE = float(os.getenv('REQUEST_METRICS_SQL_SAMPLE_RATE', 0.1))
+REQUEST_METRICS_MAX_SQL = int(os.getenv('REQUEST_METRICS_MAX_SQL', 200))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'plain': {'format': '%(asctime)s %(levelname)s %(name)s %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'plain'},
+    },
+    'root': {'handlers': ['console'], 'level': 'WARNING'},
+    'loggers': {
+        'core.middleware': {'level': os.getenv('REQUEST_METRICS_LOG_LEVEL', 'INFO')},
+        'core.notifications': {'level': 'INFO'},
+        'services': {'level': 'INFO'},
+    },
+}
+
+# Shared cache tier (catalog versions and rows, search index version). Point CACHE_BACKEND at
+# Redis or Memcached in production so all processes share it; locmem is per process.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'codexia'),
+    }
+}
+CATALOG_LOCAL_TTL = float(os.getenv('CATALOG_LOCAL_TTL', 5))  # Seconds a process trusts its catalog copy unchecked
+CATALOG_CACHE_TIMEOUT = 24 * 60 * 60  # Rows of superseded catalog versions expire from the shared cache
+BLOCKLIST_BULK_MAX_ITEMS = int(os.getenv('BLOCKLIST_BULK_MAX_ITEMS', 1000))  # Rows per blocked-apps/blocked-websites bulk PUT
+BLOCKING_PROFILE_CACHE_TIMEOUT = int(os.getenv('BLOCKING_PROFILE_CACHE_TIMEOUT', 7 * 24 * 60 * 60))  # Compiled blocking profiles (services.blocking); only cached when CACHE_BACKEND is shared
+
+# Background jobs (core.tasks): run with `manage.py run_worker`. Failed jobs retry with
+# exponential backoff and are dead-lettered after JOB_MAX_ATTEMPTS.
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 5))
+JOB_RETRY_BASE_SECONDS = int(os.getenv('JOB_RETRY_BASE_SECONDS', 10))
+JOB_RETRY_MAX_SECONDS = int(os.getenv('JOB_RETRY_MAX_SECONDS', 3600))
+JOB_LOCK_TIMEOUT = timedelta(minutes=int(os.getenv('JOB_LOCK_TIMEOUT_MINUTES', 10)))
+JOB_SCHEDULE_INTERVAL = int(os.getenv('JOB_SCHEDULE_INTERVAL', 60))  # Seconds between a worker's periodic-task checks
+JOB_TASK_MODULES = ['core.notifications', 'services.goal_rollover', 'services.leaderboards', 'services.text_extraction']
+JOB_RUN_INLINE = os.getenv('JOB_RUN_INLINE', 'false').lower() == 'true'
+
+# Notifications: FCM in production, core.push.LocMemPushBackend / core.mail.LocMemSinkEmailBackend locally.
+PUSH_BACKEND = os.getenv('PUSH_BACKEND', 'core.push.FirebasePushBackend')
+FIREBASE_CREDENTIALS = os.getenv('FIREBASE_CREDENTIALS')
+PUSH_BATCH_SIZE = int(os.getenv('PUSH_BATCH_SIZE', 500))  # Pending pushes coalesced into one send_each call (FCM max 500)
+PUSH_SINK_LATENCY_MS = int(os.getenv('PUSH_SINK_LATENCY_MS', 0))
+EMAIL_SINK_LATENCY_MS = int(os.getenv('EMAIL_SINK_LATENCY_MS', 0))
+EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', 100))  # Queued emails sent per pooled connection checkout
+EMAIL_POOL_SIZE = int(os.getenv('EMAIL_POOL_SIZE', 4))  # Idle SMTP connections kept per worker process
+EMAIL_POOL_IDLE_SECONDS = int(os.getenv('EMAIL_POOL_IDLE_SECONDS', 30))  # Older idle connections are checked with NOOP
+NOTIFICATION_FROM_EMAIL = "no-reply@focusread.com"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
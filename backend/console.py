@@ -19,6 +19,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")  # Adjust if
 django.setup()
 
 from api.models import User, Book, ReadingGoal, Highlight  # Import models after setup
+from services.search import get_search_backend
 
 class FocusReaderCommand(cmd.Cmd):
     """Command-line interface for managing Codexia backend."""
@@ -118,20 +119,24 @@ class FocusReaderCommand(cmd.Cmd):
 
     ### 🔍 SEARCH BOOKS ###
     def do_search_books(self, arg):
-        """Search for books by title. Usage: search_books "title keyword" """
+        """Full-text search over titles, authors, tags, categories and pages. Usage: search_books "keywords" """
         if not arg:
-            print("❌ Error: Provide a title keyword to search.")
+            print("❌ Error: Provide keywords to search.")
             return
         
-        books = Book.objects.filter(title__icontains=arg)
+        results = get_search_backend().search(arg.strip('"'), 20)
+        books = Book.objects.select_related("user").in_bulk([result.book_id for result in results])
         
         if not books:
             print(f"ℹ️ No books found matching '{arg}'.")
             return
         
         print(f"🔍 Books matching '{arg}':")
-        for book in books:
-            print(f"- {book.title} by {book.author} (User: {book.user.email})")
+        for result in results:
+            book = books.get(result.book_id)
+            if book:
+                page = f" p.{result.page}" if result.page else ""
+                print(f"- {book.title} by {book.author} (User: {book.user.email}) [{result.rank:.3f}]{page} {result.snippet}")
 
     ### 📚 LIST USER BOOKS ###
     def do_user_books(self, arg):
@@ -0,0 +1,78 @@
+# Curated blocklist categories, loaded into the shared catalog by `manage.py seed_blocklists`.
+# Users subscribe to categories (focus/blocking/subscriptions/) instead of copying these into their own rows.
+# Website rules follow core.domains.parse_rule: a domain blocks itself and all its subdomains.
+
+CURATED_BLOCKLISTS = [
+    {
+        "slug": "social",
+        "name": "Social media",
+        "description": "Feeds, stories and chat",
+        "apps": [
+            ("com.instagram.android", "Instagram"), ("com.facebook.katana", "Facebook"),
+            ("com.zhiliaoapp.musically", "TikTok"), ("com.twitter.android", "X"), ("com.snapchat.android", "Snapchat"),
+            ("com.instagram.barcelona", "Threads"), ("com.reddit.frontpage", "Reddit"), ("com.pinterest", "Pinterest"),
+            ("com.linkedin.android", "LinkedIn"), ("com.discord", "Discord"), ("com.tumblr", "Tumblr"),
+            ("xyz.blueskyweb.app", "Bluesky"),
+        ],
+        "websites": [
+            "facebook.com", "fb.com", "instagram.com", "twitter.com", "x.com", "threads.net", "snapchat.com",
+            "tiktok.com", "linkedin.com", "pinterest.com", "tumblr.com", "reddit.com", "redd.it", "bsky.app",
+            "mastodon.social", "discord.com", "discord.gg",
+        ],
+    },
+    {
+        "slug": "video",
+        "name": "Video & streaming",
+        "description": "Video sites, streaming services and live streams",
+        "apps": [
+            ("com.google.android.youtube", "YouTube"), ("com.netflix.mediaclient", "Netflix"), ("tv.twitch.android.app", "Twitch"),
+            ("com.disney.disneyplus", "Disney+"), ("com.amazon.avod.thirdpartyclient", "Prime Video"),
+            ("com.crunchyroll.crunchyroid", "Crunchyroll"), ("com.hulu.plus", "Hulu"),
+        ],
+        "websites": [
+            "youtube.com", "youtu.be", "netflix.com", "twitch.tv", "vimeo.com", "dailymotion.com", "hulu.com",
+            "disneyplus.com", "primevideo.com", "max.com", "crunchyroll.com",
+        ],
+    },
+    {
+        "slug": "news",
+        "name": "News",
+        "description": "News sites and aggregators",
+        "apps": [
+            ("com.google.android.apps.magazines", "Google News"), ("bbc.mobile.news.ww", "BBC News"),
+            ("com.cnn.mobile.android.phone", "CNN"), ("com.nytimes.android", "The New York Times"),
+        ],
+        "websites": [
+            "news.google.com", "cnn.com", "bbc.com", "bbc.co.uk", "nytimes.com", "theguardian.com", "foxnews.com",
+            "reuters.com", "apnews.com", "news.ycombinator.com", "buzzfeed.com", "huffpost.com",
+        ],
+    },
+    {
+        "slug": "games",
+        "name": "Games",
+        "description": "Game stores, launchers and browser games",
+        "apps": [
+            ("com.roblox.client", "Roblox"), ("com.supercell.clashofclans", "Clash of Clans"),
+            ("com.king.candycrushsaga", "Candy Crush Saga"), ("com.chess", "Chess.com"),
+            ("com.activision.callofduty.shooter", "Call of Duty: Mobile"), ("com.mojang.minecraftpe", "Minecraft"),
+        ],
+        "websites": [
+            "store.steampowered.com", "steamcommunity.com", "epicgames.com", "roblox.com", "miniclip.com",
+            "poki.com", "chess.com", "lichess.org", "itch.io",
+        ],
+    },
+    {
+        "slug": "shopping",
+        "name": "Shopping",
+        "description": "Online stores and marketplaces",
+        "apps": [
+            ("com.amazon.mShop.android.shopping", "Amazon Shopping"), ("com.ebay.mobile", "eBay"),
+            ("com.alibaba.aliexpresshd", "AliExpress"), ("com.einnovation.temu", "Temu"), ("com.zzkko", "SHEIN"),
+            ("com.jumia.android", "Jumia"),
+        ],
+        "websites": [
+            "amazon.com", "ebay.com", "aliexpress.com", "temu.com", "shein.com", "etsy.com", "walmart.com",
+            "jumia.com.ng", "konga.com",
+        ],
+    },
+]
@@ -0,0 +1,139 @@
+import hashlib
+import threading
+import time
+import uuid
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from core.http import etag_matches
+
+
+class Snapshot:
+    """One version of a catalog's rows, plus whatever has been derived from them (indexes, serialized lists)."""
+
+    def __init__(self, version, rows):
+        self.version = version
+        self.rows = rows
+        self.derived = {}
+
+    def derive(self, key, build):
+        if key not in self.derived:
+            self.derived[key] = build(self.rows)
+        return self.derived[key]
+
+
+class Catalog:
+    """
+    Versioned read-through cache of a small, nearly static table.
+
+    Reads are served from process memory, then the shared Django cache, then
+    the database. Each committed change replaces the version token in the
+    shared cache (see core.signals); a process checks its copy against that
+    token at most every CATALOG_LOCAL_TTL seconds, so changes reach every
+    process within that window and steady-state reads cost no query at all.
+
+    Bulk writes (bulk_create, update) skip model signals and must call
+    `invalidate()` themselves.
+    """
+
+    def __init__(self, name, model, ordering=("id",)):
+        self.name = name
+        self.model_label = model
+        self.ordering = ordering
+        self.local = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    @property
+    def version_key(self):
+        return f"catalog:{self.name}:version"
+
+    def current_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid.uuid4().hex, None)  # 🔥 add, so racing processes agree on one token
+            version = cache.get(self.version_key)
+        return version
+
+    def snapshot(self):
+        local = self.local
+        if local and time.monotonic() - self.checked_at < settings.CATALOG_LOCAL_TTL:
+            return local
+
+        version = self.current_version()
+        if not (local and local.version == version):
+            rows = cache.get(f"catalog:{self.name}:{version}")
+            if rows is None:
+                rows = list(self.model.objects.order_by(*self.ordering))
+                if connection.in_atomic_block:
+                    # 🔥 The transaction may hold uncommitted catalog writes; use the rows but don't publish them
+                    return Snapshot(version, rows)
+                cache.set(f"catalog:{self.name}:{version}", rows, settings.CATALOG_CACHE_TIMEOUT)
+            local = Snapshot(version, rows)
+
+        with self.lock:
+            self.local, self.checked_at = local, time.monotonic()
+        return local
+
+    def invalidate(self):
+        """Publishes a new version, so every process reloads on its next check."""
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+        with self.lock:
+            self.local = None
+
+    def all(self):
+        return self.snapshot().rows
+
+    def derive(self, key, build):
+        """Returns `build(rows)`, computed once per version and process."""
+        return self.snapshot().derive(key, build)
+
+    def get(self, pk):
+        return self.derive("pk", lambda rows: {row.pk: row for row in rows}).get(pk)
+
+    def serialized(self, serializer_class, depends_on=()):
+        """
+        The rows as `serializer_class` renders them, with a strong ETag over the
+        rendered JSON. A serializer that also reads other catalogs names them in
+        `depends_on`, so it is rerendered when any of them changes.
+        """
+        def build(rows):
+            data = serializer_class(rows, many=True).data
+            return data, f'"{hashlib.sha1(JSONRenderer().render(data)).hexdigest()}"'
+        versions = tuple(other.snapshot().version for other in depends_on)
+        return self.derive((serializer_class, versions), build)
+
+
+badges = Catalog("badges", "api.Badge")
+rewards = Catalog("rewards", "api.Reward")
+categories = Catalog("categories", "api.Category")
+tags = Catalog("tags", "api.Tag")
+blocklist_categories = Catalog("blocklist_categories", "api.BlocklistCategory", ordering=("slug",))
+blocklist_entries = Catalog("blocklist_entries", "api.BlocklistEntry", ordering=("category_id", "kind", "value"))
+
+CATALOGS = {
+    catalog.model_label: catalog
+    for catalog in (badges, rewards, categories, tags, blocklist_categories, blocklist_entries)
+}
+
+
+class CatalogListMixin:
+    """
+    Serves a ListAPIView from `catalog` with no queries, revalidated with ETag / If-None-Match.
+    """
+    catalog = None
+    catalog_depends_on = ()
+
+    def list(self, request, *args, **kwargs):
+        data, etag = self.catalog.serialized(self.get_serializer_class(), self.catalog_depends_on)
+        headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+        if etag_matches(request.headers.get("If-None-Match", ""), etag):
+            return Response(status=304, headers=headers)
+        return Response(data, headers=headers)
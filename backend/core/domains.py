@@ -0,0 +1,167 @@
+import struct
+from urllib.parse import urlsplit
+
+SELF = 1  # The domain itself is blocked
+SUBDOMAINS = 2  # Every name under the domain is blocked
+
+MAGIC = b"CXDT"
+FORMAT_VERSION = 1
+
+
+def normalize_host(value):
+    """
+    The lowercase ASCII (IDNA) host of a URL or bare host name, without port
+    or trailing dot, or None if there is no usable host.
+    """
+    value = (value or "").strip()
+    try:
+        host = urlsplit(value if "://" in value else f"//{value}").hostname
+        host = (host or "").rstrip(".").encode("idna").decode("ascii")
+    except (ValueError, UnicodeError):
+        return None
+    return host or None
+
+
+def parse_rule(rule):
+    """
+    (host, flags) for a blocklist rule. "example.com" (or any URL on it)
+    blocks the domain and all its subdomains; "*.example.com" only the
+    subdomains. A leading "www." is dropped, so blocking https://www.site.com
+    blocks the whole site.
+    """
+    rule = (rule or "").strip().lower()
+    wildcard = rule.startswith("*.")
+    host = normalize_host(rule[2:] if wildcard else rule)
+    if host is None:
+        return None, 0
+    if not wildcard and host.startswith("www.") and host.count(".") > 1:
+        host = host[4:]
+    return host, SUBDOMAINS if wildcard else SELF | SUBDOMAINS
+
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class DomainTrie:
+    """
+    Blocked domains as a trie over reversed labels (com -> example -> www),
+    so a lookup walks at most as many nodes as the host has labels, whatever
+    the number of rules.
+
+    Nodes are [flags, {label: child}]. The binary form (`to_bytes`) is what
+    clients download:
+
+        "CXDT", u8 format version,
+        u32 label count, then per label: u8 length + ASCII bytes,
+        u32 node count, then per node in breadth-first order (root first):
+            u8 flags, varint child count, then the children's label
+            indexes (varints), sorted by label
+
+    Breadth-first order puts every node's children next to each other, right
+    after those of the nodes before it, so child node indexes are implied by
+    the running total of child counts and not stored. Labels are stored once
+    however many domains share them, and children are sorted so clients can
+    binary search them.
+    """
+
+    def __init__(self, rules=()):
+        self.root = [0, {}]
+        self.rules = 0
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule):
+        host, flags = parse_rule(rule)
+        if host is None:
+            return False
+        node = self.root
+        for label in reversed(host.split(".")):
+            node = node[1].setdefault(label, [0, {}])
+        node[0] |= flags
+        self.rules += 1
+        return True
+
+    def update(self, other):
+        """Merges another trie's rules into this one."""
+        stack = [(self.root, other.root)]
+        while stack:
+            mine, theirs = stack.pop()
+            mine[0] |= theirs[0]
+            for label, child in theirs[1].items():
+                stack.append((mine[1].setdefault(label, [0, {}]), child))
+        self.rules += other.rules
+        return self
+
+    def match(self, host):
+        """The blocking rule matching `host` (e.g. "*.example.com"), or None."""
+        labels = host.split(".") if host else []
+        node = self.root
+        for index in range(len(labels) - 1, -1, -1):
+            node = node[1].get(labels[index])
+            if node is None:
+                return None
+            if index and node[0] & SUBDOMAINS:  # 🔥 Labels left over: a subdomain of a blocked domain
+                return "*." + ".".join(labels[index:])
+        return ".".join(labels) if node[0] & SELF else None
+
+    def to_bytes(self):
+        labels, nodes, queue = {}, [], [self.root]
+        for node in queue:  # 🔥 Appending while iterating: breadth-first numbering
+            nodes.append(node)
+            for label in sorted(node[1]):
+                labels.setdefault(label, len(labels))
+                queue.append(node[1][label])
+
+        out = bytearray(MAGIC)
+        out += struct.pack(">BI", FORMAT_VERSION, len(labels))
+        for label in labels:
+            encoded = label.encode("ascii")
+            out.append(len(encoded))
+            out += encoded
+        out += struct.pack(">I", len(nodes))
+        for node in nodes:
+            out.append(node[0])
+            write_varint(out, len(node[1]))
+            for label in sorted(node[1]):
+                write_varint(out, labels[label])
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != MAGIC or data[4] != FORMAT_VERSION:
+            raise ValueError("Not a domain trie artifact")
+        (label_count,) = struct.unpack_from(">I", data, 5)
+        offset, labels = 9, []
+        for _ in range(label_count):
+            length = data[offset]
+            labels.append(data[offset + 1:offset + 1 + length].decode("ascii"))
+            offset += 1 + length
+        (node_count,) = struct.unpack_from(">I", data, offset)
+        offset += 4
+        nodes = [[0, {}] for _ in range(node_count)]
+        position = 1
+        for node in nodes:
+            node[0] = data[offset]
+            children, offset = read_varint(data, offset + 1)
+            for _ in range(children):
+                label, offset = read_varint(data, offset)
+                node[1][labels[label]] = nodes[position]
+                position += 1
+        trie = cls()
+        trie.root = nodes[0]
+        return trie
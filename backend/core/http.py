@@ -0,0 +1,104 @@
+import re
+from django.http import FileResponse, HttpResponse
+from django.utils.http import parse_etags, quote_etag
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class FileRange:
+    """
+    Read-only view over `length` bytes of an open file starting at `start`.
+
+    It keeps ``fileno()`` so servers with ``wsgi.file_wrapper`` (gunicorn)
+    can sendfile() the slice straight from the page cache, while plain
+    iteration stops at the end of the range.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.name = file.name
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    Parses a single-range `Range` header into an inclusive (start, end) pair.
+
+    Returns None when the header is absent, malformed or asks for several
+    ranges (served as a full response), and raises ValueError when the
+    range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.replace(" ", "")) if header else None
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if not first:  # 🔥 Suffix range: the last N bytes
+        length = int(last)
+        if not length:
+            raise ValueError("Empty suffix range")
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def etag_matches(header, etag):
+    """Weak comparison as required for If-None-Match."""
+    tags = parse_etags(header)
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def ranged_file_response(request, file, size, etag, cache_control="private, no-cache"):
+    """
+    Serves `file` honouring If-None-Match (304), If-Range and single byte
+    ranges (206 / 416), with `etag` as the strong validator.
+    """
+    etag = quote_etag(etag)
+    headers = {"ETag": etag, "Accept-Ranges": "bytes", "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        file.close()
+        return HttpResponse(status=304, headers=headers)
+
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if if_range and if_range != etag:  # 🔥 Strong comparison: stale copies get the full body
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        file.close()
+        return HttpResponse(status=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if byte_range is None:
+        response = FileResponse(file)
+        response["Content-Length"] = size
+    else:
+        start, end = byte_range
+        response = FileResponse(FileRange(file, start, end - start + 1), status=206)
+        response["Content-Length"] = end - start + 1
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    for header, value in headers.items():
+        response[header] = value
+    return response
@@ -0,0 +1,255 @@
+import queue
+import re
+import smtplib
+import threading
+import time
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend as LocMemEmailBackend
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+from django.core.mail.message import sanitize_address
+
+
+class LocMemSinkEmailBackend(LocMemEmailBackend):
+    """
+    Local stand-in for an SMTP server: stores mail in `django.core.mail.outbox`
+    and simulates one round trip per message with EMAIL_SINK_LATENCY_MS.
+    """
+
+    def send_messages(self, messages):
+        latency = settings.EMAIL_SINK_LATENCY_MS / 1000
+        if latency:
+            time.sleep(latency * len(messages))
+        return super().send_messages(messages)
+
+
+class ConnectionPool:
+    """Idle SMTP connections to one server and account, most recently used first."""
+
+    def __init__(self, size):
+        self.size = size
+        self.idle = queue.LifoQueue()
+
+    def get(self):
+        """Returns a live idle connection, or None if a new one must be opened."""
+        while True:
+            try:
+                connection, last_used = self.idle.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - last_used < settings.EMAIL_POOL_IDLE_SECONDS:
+                return connection
+            try:
+                # 🔥 Servers drop idle clients; check before trusting an old connection
+                if connection.noop()[0] == 250:
+                    return connection
+            except (smtplib.SMTPException, OSError):
+                pass
+            discard(connection)
+
+    def put(self, connection):
+        if self.idle.qsize() >= self.size:
+            return discard(connection)
+        self.idle.put_nowait((connection, time.monotonic()))
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key):
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(settings.EMAIL_POOL_SIZE)
+        return _pools[key]
+
+
+def close_pools():
+    """Quits every idle pooled connection, e.g. on worker shutdown or after changing servers."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        while True:
+            try:
+                connection, _ = pool.idle.get_nowait()
+            except queue.Empty:
+                break
+            discard(connection)
+
+
+def discard(connection):
+    try:
+        connection.quit()
+    except (smtplib.SMTPException, OSError):
+        connection.close()
+
+
+UNSENT = object()
+
+
+def quote_data(data):
+    """Dot-stuffs a CRLF message and appends the end-of-data marker, as smtplib.SMTP.data does."""
+    data = re.sub(rb"(?m)^\.", b"..", data)
+    if not data.endswith(b"\r\n"):
+        data += b"\r\n"
+    return data + b".\r\n"
+
+
+class PooledSMTPEmailBackend(SMTPEmailBackend):
+    """
+    SMTP backend that reuses connections and pipelines commands.
+
+    Closed connections go back to a per-process pool (EMAIL_POOL_SIZE per
+    server and account) instead of being quit, so the TCP connect, STARTTLS
+    and AUTH exchange is paid once per pooled connection, not once per email.
+    When the server advertises PIPELINING (RFC 2920) each message's MAIL,
+    RCPT and DATA commands go out in one write, together with the end of
+    the previous message, so a batch costs about one round trip per message
+    instead of three or more.
+    """
+
+    @property
+    def pool(self):
+        return get_pool((self.host, self.port, self.username, self.use_tls, self.use_ssl))
+
+    def open(self):
+        if self.connection:
+            return False
+        self.connection = self.pool.get()
+        if self.connection:
+            return True
+        return super().open()
+
+    def close(self):
+        """Returns the connection to the pool."""
+        if self.connection is None:
+            return
+        connection, self.connection = self.connection, None
+        self.pool.put(connection)
+
+    def discard(self):
+        """Drops a connection that is broken or in an unknown state."""
+        if self.connection is not None:
+            connection, self.connection = self.connection, None
+            discard(connection)
+
+    def send_messages(self, email_messages):
+        outcomes = self.send_each(email_messages)
+        errors = [outcome for outcome in outcomes if outcome is not None]
+        if errors and not self.fail_silently:
+            raise errors[0]
+        return len(outcomes) - len(errors)
+
+    def send_each(self, email_messages):
+        """
+        Sends a batch over one connection.
+        Returns one outcome per message: None once the server accepted it, else the exception.
+        """
+        outcomes = [UNSENT] * len(email_messages)
+        envelopes = []
+        for index, message in enumerate(email_messages):
+            if not message.recipients():
+                outcomes[index] = None
+                continue
+            encoding = message.encoding or settings.DEFAULT_CHARSET
+            envelopes.append((
+                index,
+                sanitize_address(message.from_email, encoding),
+                [sanitize_address(address, encoding) for address in message.recipients()],
+                message.message().as_bytes(linesep="\r\n"),
+            ))
+        if not envelopes:
+            return outcomes
+
+        with self._lock:
+            try:
+                new_connection = self.open()
+                if not self.connection:
+                    return [None if outcome is None else smtplib.SMTPServerDisconnected("Could not connect") for outcome in outcomes]
+                self.connection.ehlo_or_helo_if_needed()
+                if self.connection.has_extn("pipelining"):
+                    self.send_pipelined(envelopes, outcomes)
+                else:
+                    for index, sender, recipients, data in envelopes:
+                        try:
+                            self.connection.sendmail(sender, recipients, data)
+                            outcomes[index] = None
+                        except (smtplib.SMTPSenderRefused, smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as error:
+                            outcomes[index] = error
+            except (smtplib.SMTPException, OSError) as error:
+                # ✅ Whatever was not acknowledged is reported failed; the connection cannot be trusted
+                outcomes = [error if outcome is UNSENT else outcome for outcome in outcomes]
+                self.discard()
+                new_connection = False
+            if new_connection:
+                self.close()
+        return outcomes
+
+    def send_pipelined(self, envelopes, outcomes):
+        connection = self.connection
+        pending = None  # 🔥 Message whose body goes out in the same write as the next envelope
+        body = b""
+
+        for index, sender, recipients, data in envelopes:
+            commands = [f"MAIL FROM:{smtplib.quoteaddr(sender)}"]
+            commands += [f"RCPT TO:{smtplib.quoteaddr(recipient)}" for recipient in recipients]
+            connection.send(body + "".join(f"{command}\r\n" for command in commands + ["DATA"]).encode("ascii"))
+            body = b""
+
+            if pending is not None:
+                outcomes[pending] = self.check_data(connection.getreply())
+                pending = None
+            mail_reply = connection.getreply()
+            refused = {}
+            for recipient in recipients:
+                code, reply = connection.getreply()
+                if code not in (250, 251):
+                    refused[recipient] = (code, reply)
+            data_code, data_reply = connection.getreply()
+
+            if data_code != 354:
+                if mail_reply[0] != 250:
+                    outcomes[index] = smtplib.SMTPSenderRefused(*mail_reply, sender)
+                elif refused:
+                    outcomes[index] = smtplib.SMTPRecipientsRefused(refused)
+                else:
+                    outcomes[index] = smtplib.SMTPDataError(data_code, data_reply)
+                if 421 in (mail_reply[0], data_code):
+                    raise smtplib.SMTPServerDisconnected(data_reply)
+                connection.rset()
+                continue
+
+            body = quote_data(data)
+            pending = index
+
+        if pending is not None:
+            connection.send(body)
+            outcomes[pending] = self.check_data(connection.getreply())
+
+    def check_data(self, reply):
+        code, message = reply
+        if code == 421:
+            raise smtplib.SMTPServerDisconnected(message)
+        return None if code == 250 else smtplib.SMTPDataError(code, message)
+
+
+def send_each(email_messages, connection=None):
+    """
+    Sends a batch through `connection` (default: EMAIL_BACKEND) and returns one
+    outcome per message, None or the exception. Backends without their own
+    `send_each` send one message at a time over a single opened connection.
+    """
+    connection = connection or get_connection(fail_silently=False)
+    if hasattr(connection, "send_each"):
+        return connection.send_each(email_messages)
+
+    outcomes = []
+    with connection:
+        for message in email_messages:
+            try:
+                connection.send_messages([message])
+                outcomes.append(None)
+            except Exception as error:
+                outcomes.append(error)
+    return outcomes
@@ -0,0 +1,140 @@
+import json
+import logging
+import random
+from contextlib import ExitStack
+from contextvars import ContextVar
+from time import perf_counter
+from django.conf import settings
+from django.db import connections
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.serializers import ListSerializer, Serializer
+
+logger = logging.getLogger(__name__)
+slow_logger = logging.getLogger(f"{__name__}.slow")
+
+_current = ContextVar("request_metrics", default=None)
+_serializer_timing_installed = False
+
+
+class RequestMetrics:
+    """Counters for one request; `sql` is only kept for requests sampled for the slow log."""
+    __slots__ = ("queries", "db_time", "serializer_time", "serializer_depth", "sql")
+
+    def __init__(self, capture_sql):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.sql = [] if capture_sql else None
+
+    def record_query(self, sql, duration):
+        self.queries += 1
+        self.db_time += duration
+        if self.sql is not None and len(self.sql) < settings.REQUEST_METRICS_MAX_SQL:
+            self.sql.append((sql, duration))  # 🔥 Keeps a reference, the statement is never copied or formatted
+
+
+def query_recorder(execute, sql, params, many, context):
+    """`connection.execute_wrapper` hook: one timer and two additions per query."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, perf_counter() - started)
+
+
+def timed_data(data):
+    """Wraps a serializer's `.data` property so rendering time is added to the current request."""
+    getter = data.fget
+
+    def wrapper(self):
+        metrics = _current.get()
+        if metrics is None or metrics.serializer_depth:
+            return getter(self)  # 🔥 Serializers rendered inside another one are already being timed
+        metrics.serializer_depth += 1
+        started = perf_counter()
+        try:
+            return getter(self)
+        finally:
+            metrics.serializer_time += perf_counter() - started
+            metrics.serializer_depth -= 1
+
+    return property(wrapper, doc=data.__doc__)
+
+
+def install_serializer_timing():
+    global _serializer_timing_installed
+    if _serializer_timing_installed:
+        return
+    Serializer.data = timed_data(Serializer.data)
+    ListSerializer.data = timed_data(ListSerializer.data)
+    _serializer_timing_installed = True
+
+
+class RequestMetricsMiddleware:
+    """
+    Records per request the SQL query count, DB time, serializer time,
+    response size and wall time.
+
+    The numbers go out as a `Server-Timing` header and one JSON log line
+    per request. A sample of requests (REQUEST_METRICS_SQL_SAMPLE_RATE)
+    also keeps its SQL, which is logged when the request is slower than
+    REQUEST_METRICS_SLOW_MS.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install_serializer_timing()
+
+    def __call__(self, request):
+        metrics = RequestMetrics(capture_sql=random.random() < settings.REQUEST_METRICS_SQL_SAMPLE_RATE)
+        token = _current.set(metrics)
+        started = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(query_recorder))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        wall_time = perf_counter() - started
+
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+            f"ser;dur={metrics.serializer_time * 1000:.1f}",
+            f"total;dur={wall_time * 1000:.1f}",
+        ])
+
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "view": request.resolver_match.view_name if request.resolver_match else None,
+            "status": response.status_code,
+            "user": self.user_id(request),
+            "queries": metrics.queries,
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "serializer_ms": round(metrics.serializer_time * 1000, 2),
+            "wall_ms": round(wall_time * 1000, 2),
+            "bytes": self.response_size(response),
+        }
+        logger.info(json.dumps(record))
+
+        if metrics.sql is not None and wall_time * 1000 >= settings.REQUEST_METRICS_SLOW_MS:
+            record["sql"] = [{"sql": sql, "ms": round(duration * 1000, 2)} for sql, duration in metrics.sql]
+            slow_logger.warning(json.dumps(record))
+        return response
+
+    def user_id(self, request):
+        user = getattr(request, "user", None)
+        if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+            return None  # 🔥 Never resolved during the request; don't hit the session store just to log it
+        return getattr(user, "pk", None)
+
+    def response_size(self, response):
+        if response.streaming:
+            length = response.get("Content-Length")
+            return int(length) if length else None
+        return len(response.content)
@@ -1,33 +1,168 @@
-from django.core.mail import send_mail
-from firebase_admin import messaging
+import logging
+import smtplib
+import threading
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage
+from core.mail import send_each
+from core.push import PushMessage, get_push_backend
+from core.tasks import enqueue, enqueue_many, task
 
-def send_push_notification(user, message):
+logger = logging.getLogger(__name__)
+
+
+class PushMetrics:
+    """Running push delivery counters for this process, logged after every batch."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.batches = self.sent = self.failed = self.pruned = 0
+        self.seconds = 0.0
+
+    def record(self, sent, failed, pruned, seconds):
+        with self.lock:
+            self.batches += 1
+            self.sent += sent
+            self.failed += failed
+            self.pruned += pruned
+            self.seconds += seconds
+
+    @property
+    def throughput(self):
+        """Messages handed to FCM per second of send time."""
+        return (self.sent + self.failed) / self.seconds if self.seconds else 0.0
+
+    def snapshot(self):
+        return {
+            "batches": self.batches,
+            "sent": self.sent,
+            "failed": self.failed,
+            "pruned_tokens": self.pruned,
+            "seconds": round(self.seconds, 3),
+            "messages_per_second": round(self.throughput, 1),
+        }
+
+
+push_metrics = PushMetrics()
+
+
+def send_push_notification(user, message, title="New Achievement!"):
     """
-    Sends a push notification to the user's device.
+    Queues a push notification to the user's device.
+    Delivery happens on a worker, batched with other pending pushes (see `deliver_pushes`).
     """
     if not user.device_token:
         return  # ✅ Skip if user has no push notification token
 
-    message = messaging.Message(
-        notification=messaging.Notification(
-            title="New Achievement!",
-            body=message,
-        ),
-        token=user.device_token,
-    )
+    return enqueue("notifications.push", {"user_id": user.pk, "title": title, "body": message})
+
+
+def send_push_notifications(user_ids, message, title="Codexia"):
+    """
+    Queues the same push to many users (reminders, announcements) with one INSERT per
+    1000 users; workers deliver them in `send_each` batches of PUSH_BATCH_SIZE.
+    """
+    return enqueue_many("notifications.push", [{"user_id": user_id, "title": title, "body": message} for user_id in user_ids])
+
+
+def send_push_notification_batch(notifications):
+    """Queues many individual pushes at once; `notifications` are (user_id, title, body) tuples."""
+    return enqueue_many("notifications.push", [
+        {"user_id": user_id, "title": title, "body": body} for user_id, title, body in notifications
+    ])
 
-    response = messaging.send(message)
-    return response
 
+def send_email_notification_batch(notifications, from_email=None):
+    """Queues many individual emails at once; `notifications` are (email, subject, body) tuples."""
+    return enqueue_many("notifications.email", [
+        {"email": email, "subject": subject, "body": body, "from_email": from_email} for email, subject, body in notifications
+    ])
 
-def send_email_notification(email, subject, message):
+
+def send_email_notification(email, subject, message, from_email=None):
     """
-    Sends an email notification to the user.
+    Queues an email to one address (default sender: NOTIFICATION_FROM_EMAIL).
+    Workers send queued emails in batches over pooled SMTP connections (see `deliver_emails`).
     """
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email="no-reply@focusread.com",
-        recipient_list=[email],
-        fail_silently=True,
+    return enqueue("notifications.email", {"email": email, "subject": subject, "body": message, "from_email": from_email})
+
+
+@task("notifications.push", batch_size=settings.PUSH_BATCH_SIZE)
+def deliver_pushes(payloads):
+    """
+    Sends a batch of queued pushes with one `send_each` call.
+
+    Tokens are re-read in one query, as they may have changed or been cleared
+    since the jobs were queued. Tokens FCM reports as unregistered or invalid
+    are cleared from every user holding them and those messages are not
+    retried; other per-message errors are returned so only their jobs retry.
+    """
+    User = get_user_model()
+    tokens = dict(
+        User.objects.filter(pk__in={payload["user_id"] for payload in payloads}, device_token__isnull=False)
+        .exclude(device_token="")
+        .values_list("pk", "device_token")
     )
+    outcomes = [None] * len(payloads)
+    positions, messages = [], []
+    for position, payload in enumerate(payloads):
+        token = tokens.get(payload["user_id"])
+        if token:  # ✅ Users who logged out of every device are skipped
+            positions.append(position)
+            messages.append(PushMessage(token, payload["title"], payload["body"], payload.get("data")))
+    if not messages:
+        return outcomes
+
+    started = time.perf_counter()
+    results = get_push_backend().send_each(messages)
+    elapsed = time.perf_counter() - started
+
+    invalid = set()
+    for position, message, result in zip(positions, messages, results):
+        if result.invalid_token:
+            invalid.add(message.token)
+        elif not result.success:
+            outcomes[position] = result.error
+    if invalid:
+        User.objects.filter(device_token__in=invalid).update(device_token=None)
+
+    sent = sum(result.success for result in results)
+    push_metrics.record(sent, len(results) - sent, len(invalid), elapsed)
+    logger.info(
+        "Push batch: %s messages, %s sent, %s failed, %s tokens pruned in %.1f ms (%.0f msg/s)",
+        len(results), sent, len(results) - sent, len(invalid), elapsed * 1000, len(results) / elapsed if elapsed else 0,
+    )
+    return outcomes
+
+
+@task("notifications.email", batch_size=settings.EMAIL_BATCH_SIZE)
+def deliver_emails(payloads):
+    """
+    Sends a batch of queued emails over one pooled SMTP connection.
+    Mail the server refuses outright (5xx) is logged and dropped; anything else is retried.
+    """
+    messages = [
+        EmailMessage(payload["subject"], payload["body"], payload.get("from_email") or settings.NOTIFICATION_FROM_EMAIL, [payload["email"]])
+        for payload in payloads
+    ]
+    started = time.perf_counter()
+    outcomes = send_each(messages)
+    elapsed = time.perf_counter() - started
+
+    for position, outcome in enumerate(outcomes):
+        if permanent_failure(outcome):
+            logger.warning("Dropping email to %s: %s", payloads[position]["email"], outcome)
+            outcomes[position] = None
+    failed = sum(outcome is not None for outcome in outcomes)
+    logger.info("Email batch: %s messages, %s failed in %.1f ms", len(messages), failed, elapsed * 1000)
+    return outcomes
+
+
+def permanent_failure(error):
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(500 <= code < 600 for code, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
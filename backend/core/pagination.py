@@ -0,0 +1,110 @@
+import base64
+import json
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks past the last row seen instead of using OFFSET.
+
+    Rows are ordered by the view's `keyset_ordering` (default newest first on
+    `created_at`, `id`), which must end in a unique field. The cursor is an
+    opaque token holding the ordering values of the last row on the page, so
+    every page is one index range scan of `page_size + 1` rows however deep
+    the client scrolls, and rows inserted meanwhile never shift a page.
+    """
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = tuple(getattr(view, "keyset_ordering", self.ordering))
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+
+        queryset = queryset.order_by(*self.ordering)
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            queryset = queryset.filter(self.seek(self.decode_cursor(token)))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def seek(self, values):
+        """
+        Rows strictly after `values` in the ordering, e.g. for (-created_at, -id):
+        created_at < c OR (created_at = c AND id < i).
+        """
+        condition = Q()
+        for position in reversed(range(len(self.ordering))):
+            field = self.ordering[position].lstrip("-")
+            lookup = "lt" if self.ordering[position].startswith("-") else "gt"
+            ties = {self.ordering[i].lstrip("-"): values[i] for i in range(position)}
+            condition |= Q(**ties, **{f"{field}__{lookup}": values[position]})
+        return condition
+
+    def encode_cursor(self, row):
+        values = [getattr(row, field.lstrip("-")) for field in self.ordering]
+        payload = json.dumps([value.isoformat() if hasattr(value, "isoformat") else value for value in values])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, token):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        except (ValueError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return [self.to_python(field.lstrip("-"), value) for field, value in zip(self.ordering, values)]
+
+    def to_python(self, field, value):
+        """Parse cursor values with the model field, so timestamps compare as timestamps."""
+        try:
+            return self.model._meta.get_field(field).to_python(value)
+        except FieldDoesNotExist:
+            # 🔥 Annotations such as search_rank are plain JSON numbers
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return value
+            raise NotFound(self.invalid_cursor_message)
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,126 @@
+import threading
+import time
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# FCM accepts at most 500 messages per send_each call.
+MAX_BATCH_SIZE = 500
+
+_backend = None
+
+
+class PushMessage:
+    __slots__ = ("token", "title", "body", "data")
+
+    def __init__(self, token, title, body, data=None):
+        self.token = token
+        self.title = title
+        self.body = body
+        self.data = data
+
+
+class PushResult:
+    """
+    Outcome of one message. `invalid_token` means the device token will never work
+    again and should be removed; other failures are worth retrying.
+    """
+    __slots__ = ("success", "message_id", "error", "invalid_token")
+
+    def __init__(self, success, message_id=None, error=None, invalid_token=False):
+        self.success = success
+        self.message_id = message_id
+        self.error = error
+        self.invalid_token = invalid_token
+
+
+class FirebasePushBackend:
+    """
+    Sends through Firebase Cloud Messaging with `send_each`, up to 500 messages per call.
+
+    The app is initialised on first use from FIREBASE_CREDENTIALS (a service
+    account file) or application default credentials. Only the public
+    firebase_admin API is used.
+    """
+
+    def __init__(self):
+        import firebase_admin
+        from firebase_admin import credentials
+
+        try:
+            self.app = firebase_admin.get_app()
+        except ValueError:
+            path = settings.FIREBASE_CREDENTIALS
+            self.app = firebase_admin.initialize_app(credentials.Certificate(path) if path else None)
+
+    def send_each(self, messages):
+        from firebase_admin import messaging
+
+        results = []
+        for start in range(0, len(messages), MAX_BATCH_SIZE):
+            batch = messages[start:start + MAX_BATCH_SIZE]
+            response = messaging.send_each([
+                messaging.Message(
+                    notification=messaging.Notification(title=message.title, body=message.body),
+                    data=message.data,
+                    token=message.token,
+                )
+                for message in batch
+            ], app=self.app)
+            for item in response.responses:
+                if item.success:
+                    results.append(PushResult(True, message_id=item.message_id))
+                else:
+                    results.append(PushResult(False, error=item.exception, invalid_token=invalid_token(item.exception)))
+        return results
+
+    def send(self, token, title, body, data=None):
+        return self.send_each([PushMessage(token, title, body, data)])[0]
+
+
+def invalid_token(error):
+    """
+    Whether FCM rejected the token itself: UNREGISTERED, or INVALID_ARGUMENT
+    about the registration token. Any other invalid argument is a problem with
+    the message, not the device, and must not cost the user their token.
+    """
+    from firebase_admin import exceptions, messaging
+
+    if isinstance(error, messaging.UnregisteredError):
+        return True
+    return isinstance(error, exceptions.InvalidArgumentError) and "registration token" in str(error).lower()
+
+
+class LocMemPushBackend:
+    """
+    In-process stand-in for FCM: keeps sent messages in `LocMemPushBackend.outbox`,
+    rejects tokens starting with "invalid" as unregistered, and simulates one
+    round trip per call with PUSH_SINK_LATENCY_MS.
+    """
+    outbox = []
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.latency = settings.PUSH_SINK_LATENCY_MS / 1000
+
+    def send_each(self, messages):
+        if self.latency:
+            time.sleep(self.latency)
+        results = []
+        with self.lock:
+            for message in messages:
+                if message.token.startswith("invalid"):
+                    results.append(PushResult(False, error=LookupError("Unregistered token"), invalid_token=True))
+                    continue
+                self.outbox.append({"token": message.token, "title": message.title, "body": message.body, "data": message.data})
+                results.append(PushResult(True, message_id=f"projects/local/messages/{len(self.outbox)}"))
+        return results
+
+    def send(self, token, title, body, data=None):
+        return self.send_each([PushMessage(token, title, body, data)])[0]
+
+
+def get_push_backend():
+    global _backend
+    if _backend is None or not isinstance(_backend, import_string(settings.PUSH_BACKEND)):
+        _backend = import_string(settings.PUSH_BACKEND)()
+    return _backend
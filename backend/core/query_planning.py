@@ -0,0 +1,92 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+_plans = {}
+
+
+class QueryPlan:
+    """
+    The `select_related` / `prefetch_related` lookups a serializer needs so
+    that serializing any number of rows costs a fixed number of queries.
+    """
+
+    def __init__(self, select_related=(), prefetch_related=()):
+        self.select_related = tuple(sorted(select_related))
+        self.prefetch_related = tuple(sorted(prefetch_related))
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+    def __repr__(self):
+        return f"QueryPlan(select_related={self.select_related}, prefetch_related={self.prefetch_related})"
+
+
+def plan_for(serializer_class):
+    """
+    Derives (and caches) the query plan of a ModelSerializer by walking its fields.
+
+    Nested serializers and dotted sources that cross a forward FK/one-to-one
+    are joined with select_related; anything reached through a many-valued
+    relation is prefetched. Primary key related fields read the `<field>_id`
+    column and need nothing. Needs the walk cannot see (SerializerMethodField
+    and the like) are declared on the serializer's Meta as `select_related`
+    and `prefetch_related`.
+    """
+    if serializer_class not in _plans:
+        select, prefetch = set(), set()
+        serializer = serializer_class()
+        walk(serializer, serializer.Meta.model, [], False, select, prefetch)
+        _plans[serializer_class] = QueryPlan(select, prefetch)
+    return _plans[serializer_class]
+
+
+def walk(serializer, model, prefix, many, select, prefetch):
+    meta = getattr(serializer, "Meta", None)
+    for lookup in getattr(meta, "select_related", ()):
+        (prefetch if many else select).add("__".join(prefix + [lookup]))
+    for lookup in getattr(meta, "prefetch_related", ()):
+        prefetch.add("__".join(prefix + [lookup]))
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+
+        path, related_model, field_many = [], model, many
+        for position, attr in enumerate(field.source_attrs):
+            try:
+                model_field = related_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation:
+                break
+
+            field_many = field_many or model_field.many_to_many or model_field.one_to_many
+            path.append(attr)
+            related_model = model_field.related_model
+
+            is_last = position == len(field.source_attrs) - 1
+            if is_last and isinstance(field, RelatedField) and field.use_pk_only_optimization() and not field_many:
+                break  # 🔥 Rendered from the local `<field>_id` column, no join needed
+            (prefetch if field_many else select).add("__".join(prefix + path))
+
+        nested = field.child if isinstance(field, ListSerializer) else field
+        if isinstance(nested, BaseSerializer) and path:
+            walk(nested, related_model, prefix + path, field_many, select, prefetch)
+        elif isinstance(field, ManyRelatedField) and path:
+            prefetch.add("__".join(prefix + path))
+
+
+class QueryPlanMixin:
+    """
+    GenericAPIView mixin that applies the serializer's query plan to every
+    list and detail lookup. Hooks `filter_queryset` so views that override
+    `get_queryset` are covered too.
+    """
+
+    def filter_queryset(self, queryset):
+        return plan_for(self.get_serializer_class()).apply(super().filter_queryset(queryset))
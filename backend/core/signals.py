@@ -0,0 +1,88 @@
+import os
+from django.db import transaction
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from api.models.blocklists import BlocklistExclusion, BlocklistSubscription
+from api.models.book import Book, BookBlob
+from api.models.focus import BlockedApp, BlockedWebsite
+from api.models.leaderboard import LeaderboardEntry
+from api.models.upload import UploadSession
+from core.catalog import CATALOGS
+from services.blocking import BlockingService
+from services.search import remove_book_on_commit
+
+
+@receiver(post_delete, sender=Book)
+def release_book_blob(sender, instance, **kwargs):
+    """
+    Drops the deleted book's reference on its blob, including cascades from user deletion.
+    """
+    if instance.blob_id:
+        BookBlob.objects.release(instance.blob_id)
+
+
+@receiver(post_delete, sender=Book)
+def unindex_book(sender, instance, **kwargs):
+    """
+    Takes the deleted book out of the search index once the delete commits.
+    """
+    remove_book_on_commit(instance.pk)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def sync_category_boards(sender, instance, **kwargs):
+    """
+    Moves the owner onto or off category leaderboards once their books change.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "category" not in update_fields:
+        return  # ✅ Progress and metadata saves cannot change which boards the owner is on
+    transaction.on_commit(lambda: LeaderboardEntry.objects.sync_categories(instance.user_id))
+
+
+@receiver(pre_delete, sender=get_user_model())
+def leave_leaderboards(sender, instance, **kwargs):
+    """
+    Takes a deleted user's scores out of the board histograms before their entries cascade away.
+    """
+    LeaderboardEntry.objects.remove_user(instance.pk)
+
+
+@receiver(post_delete, sender=UploadSession)
+def remove_staged_upload(sender, instance, **kwargs):
+    """
+    Removes whatever a finished, aborted or expired upload left in the staging directory.
+    """
+    try:
+        os.remove(instance.staging_path)
+    except FileNotFoundError:
+        pass
+
+
+@receiver(post_save, sender=BlockedApp)
+@receiver(post_delete, sender=BlockedApp)
+@receiver(post_save, sender=BlockedWebsite)
+@receiver(post_delete, sender=BlockedWebsite)
+@receiver(post_save, sender=BlocklistSubscription)
+@receiver(post_delete, sender=BlocklistSubscription)
+@receiver(post_save, sender=BlocklistExclusion)
+@receiver(post_delete, sender=BlocklistExclusion)
+def invalidate_blocking_profile(sender, instance, **kwargs):
+    """
+    Recompiles the owner's blocking profile (see services.blocking) on next use, once the change commits.
+    """
+    transaction.on_commit(lambda: BlockingService.invalidate(instance.user_id))
+
+
+def invalidate_catalog(sender, **kwargs):
+    """
+    Drops every process's cached copy of a catalog table (see core.catalog) once the change commits.
+    """
+    transaction.on_commit(CATALOGS[sender._meta.label].invalidate)
+
+
+for label in CATALOGS:
+    post_save.connect(invalidate_catalog, sender=label, dispatch_uid=f"catalog-save-{label}")
+    post_delete.connect(invalidate_catalog, sender=label, dispatch_uid=f"catalog-delete-{label}")
@@ -0,0 +1,255 @@
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils.timezone import now
+from api.models.jobs import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+_schedules = {}
+_running = threading.local()
+
+
+def task(name, max_attempts=None, queue="default", batch_size=None):
+    """
+    Registers a function as a background task under `name`.
+    The function receives the job payload as keyword arguments and must be idempotent:
+    a job interrupted mid-run is retried.
+
+    With `batch_size`, the worker coalesces up to that many due jobs of this task
+    into one call: the function receives the list of payloads and returns one
+    outcome per payload, None for success or the error for a job to retry.
+    """
+    def register(func):
+        _registry[name] = {"func": func, "max_attempts": max_attempts, "queue": queue, "batch_size": batch_size}
+        return func
+    return register
+
+
+def periodic(name, interval, **options):
+    """
+    Registers a task (see `task`) that workers run every `interval`, in slots
+    aligned to multiples of it: every 15 minutes means :00, :15, :30 and :45 UTC.
+    Each slot is enqueued once however many workers share the queue, and a
+    slot that passed while no worker was up is skipped, not replayed.
+    """
+    def register(func):
+        task(name, **options)(func)
+        _schedules[name] = interval
+        return func
+    return register
+
+
+def schedule_periodic():
+    """Queues the next slot of every periodic task; a slot queued before (by any worker) is left alone."""
+    current = now().timestamp()
+    jobs = []
+    for name, interval in _schedules.items():
+        step = interval.total_seconds()
+        slot = datetime.fromtimestamp((current // step + 1) * step, tz=timezone.utc)
+        job = build_job(name)
+        job.run_at, job.unique_key = slot, f"{name}@{slot.isoformat()}"
+        jobs.append(job)
+    Job.objects.bulk_create(jobs, ignore_conflicts=True)  # 🔥 unique_key makes racing workers agree on one job
+
+
+def run_inline(name, payloads):
+    entry = _registry[name]
+    if not entry["batch_size"]:
+        return [entry["func"](**payload) for payload in payloads]
+    outcomes = list(entry["func"](payloads))
+    if len(outcomes) != len(payloads):
+        raise RuntimeError(f"{name} returned {len(outcomes)} outcomes for {len(payloads)} payloads")
+    errors = [outcome for outcome in outcomes if outcome is not None]
+    if errors:
+        raise errors[0] if isinstance(errors[0], Exception) else RuntimeError(errors[0])
+
+
+def build_job(name, payload=None, delay=None, queue=None, max_attempts=None):
+    options = _registry.get(name, {})
+    return Job(
+        name=name,
+        payload=payload or {},
+        queue=queue or options.get("queue", "default"),
+        max_attempts=max_attempts or options.get("max_attempts") or settings.JOB_MAX_ATTEMPTS,
+        run_at=now() + delay if delay else now(),
+    )
+
+
+def enqueue(name, payload=None, delay=None, queue=None, max_attempts=None):
+    """
+    Queues one job; it commits (or rolls back) with the caller's transaction.
+    With JOB_RUN_INLINE the task runs immediately instead (development, benchmarks).
+    """
+    if settings.JOB_RUN_INLINE:
+        run_inline(name, [payload or {}])
+        return None
+    job = build_job(name, payload, delay, queue, max_attempts)
+    job.save()
+    return job
+
+
+def enqueue_many(name, payloads, delay=None, queue=None):
+    """Queues one job per payload with a single INSERT per batch."""
+    if not payloads:
+        return []
+    if settings.JOB_RUN_INLINE:
+        run_inline(name, payloads)
+        return []
+    return Job.objects.bulk_create([build_job(name, payload, delay, queue) for payload in payloads], batch_size=1000)
+
+
+def heartbeat():
+    """
+    Refreshes the lock of the job running on this thread. Long tasks call it
+    between steps (more often than JOB_LOCK_TIMEOUT) so they are not taken
+    for dead and requeued while still running. A no-op outside a worker.
+    """
+    job_id = getattr(_running, "job_id", None)
+    if job_id is not None:
+        Job.objects.filter(pk=job_id, status="running").update(locked_at=now())
+
+
+def retry_delay(attempt):
+    """Exponential backoff with jitter (50-100% of the step), capped at JOB_RETRY_MAX_SECONDS."""
+    ceiling = min(settings.JOB_RETRY_MAX_SECONDS, settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+    return timedelta(seconds=random.uniform(ceiling / 2, ceiling))
+
+
+class Worker:
+    """
+    Pulls due jobs from one queue and runs them. Jobs of batched tasks are
+    topped up to the task's `batch_size` and handed over in one call.
+
+    Claiming uses SELECT ... FOR UPDATE SKIP LOCKED, so any number of worker
+    processes can share a queue without blocking on each other or running a
+    job twice. Failures are retried with backoff until `max_attempts`, then
+    the job is dead-lettered. Jobs left `running` by a crashed worker are
+    requeued once their lock is older than JOB_LOCK_TIMEOUT (long tasks
+    keep theirs fresh with `heartbeat`). Workers also
+    enqueue the upcoming slots of periodic tasks (see `periodic`).
+    """
+
+    def __init__(self, queue="default", batch_size=10, poll_interval=1.0):
+        self.queue = queue
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.scheduled_at = None
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.processed = 0
+        self.failed = 0
+
+    def claim(self, limit=None, name=None):
+        due = Job.objects.filter(queue=self.queue, status="queued", run_at__lte=now())
+        if name:
+            due = due.filter(name=name)
+        with transaction.atomic():
+            jobs = list(due.select_for_update(skip_locked=True).order_by("run_at", "id")[:limit or self.batch_size])
+            if jobs:
+                Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                    status="running", locked_at=now(), locked_by=self.worker_id, attempts=F("attempts") + 1
+                )
+        for job in jobs:
+            job.attempts += 1
+        return jobs
+
+    def recover_stale(self):
+        """Requeues jobs whose worker died mid-run."""
+        return Job.objects.filter(
+            queue=self.queue, status="running", locked_at__lt=now() - settings.JOB_LOCK_TIMEOUT
+        ).update(status="queued", locked_at=None, locked_by="")
+
+    def run_job(self, job):
+        entry = _registry.get(job.name)
+        started = time.perf_counter()
+        try:
+            if entry is None:
+                raise LookupError(f"No task registered as {job.name!r}")
+            _running.job_id = job.pk
+            try:
+                entry["func"](**job.payload)
+            finally:
+                _running.job_id = None
+        except Exception:
+            self.failed += 1
+            self.fail(job, traceback.format_exc())
+        else:
+            self.processed += 1
+            Job.objects.filter(pk=job.pk).delete()
+            logger.info("Job %s %s done in %.1f ms", job.pk, job.name, (time.perf_counter() - started) * 1000)
+
+    def run_batch(self, name, jobs):
+        """Runs a batched task over `jobs`, deleting the successes and retrying each failure on its own."""
+        entry = _registry[name]
+        started = time.perf_counter()
+        try:
+            outcomes = list(entry["func"]([job.payload for job in jobs]))
+            if len(outcomes) != len(jobs):  # 🔥 Outcomes can no longer be matched to jobs: retry them all
+                raise ValueError(f"{name} returned {len(outcomes)} outcomes for {len(jobs)} jobs")
+        except Exception:
+            outcomes = [traceback.format_exc()] * len(jobs)
+
+        done = [job.pk for job, outcome in zip(jobs, outcomes) if outcome is None]
+        Job.objects.filter(pk__in=done).delete()
+        self.processed += len(done)
+        for job, outcome in zip(jobs, outcomes):
+            if outcome is not None:
+                self.failed += 1
+                self.fail(job, outcome if isinstance(outcome, str) else repr(outcome))
+        logger.info("Batch of %s %s jobs done in %.1f ms (%s failed)", len(jobs), name, (time.perf_counter() - started) * 1000, len(jobs) - len(done))
+
+    def run_claimed(self, jobs):
+        batches = {}
+        for job in jobs:
+            entry = _registry.get(job.name)
+            if entry and entry["batch_size"]:
+                batches.setdefault(job.name, []).append(job)
+            else:
+                self.run_job(job)
+        for name, batch in batches.items():
+            size = _registry[name]["batch_size"]
+            if len(batch) < size:
+                batch += self.claim(limit=size - len(batch), name=name)  # 🔥 Top up with more due jobs of the same task
+            self.run_batch(name, batch)
+
+    def fail(self, job, error):
+        jobs = Job.objects.filter(pk=job.pk)
+        if job.attempts >= job.max_attempts:
+            jobs.update(status="dead", last_error=error, finished_at=now(), locked_at=None)
+            logger.error("Job %s %s dead-lettered after %s attempts", job.pk, job.name, job.attempts)
+            return
+        delay = retry_delay(job.attempts)
+        jobs.update(status="queued", last_error=error, run_at=now() + delay, locked_at=None, locked_by="")
+        logger.warning("Job %s %s failed (attempt %s), retrying in %.0fs", job.pk, job.name, job.attempts, delay.total_seconds())
+
+    def schedule(self):
+        """Enqueues upcoming periodic slots, at most every JOB_SCHEDULE_INTERVAL seconds."""
+        if self.scheduled_at is not None and time.monotonic() - self.scheduled_at < settings.JOB_SCHEDULE_INTERVAL:
+            return
+        self.scheduled_at = time.monotonic()
+        schedule_periodic()
+
+    def run(self, burst=False, max_jobs=None):
+        """Processes jobs until stopped; with `burst`, returns once the queue has nothing due."""
+        self.recover_stale()
+        while max_jobs is None or self.processed + self.failed < max_jobs:
+            close_old_connections()
+            self.schedule()
+            jobs = self.claim()
+            if not jobs:
+                if burst:
+                    break
+                time.sleep(self.poll_interval)
+                self.recover_stale()
+                continue
+            self.run_claimed(jobs)
+        return self.processed
@@ -0,0 +1,70 @@
+import threading
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+from django.conf import settings
+from django.utils.timezone import now
+from api.models.timezones import TimezoneDayBoundary
+
+
+@lru_cache(maxsize=None)
+def get_zone(name):
+    """The ZoneInfo for an IANA name; unknown or empty names fall back to TIME_ZONE."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(settings.TIME_ZONE)
+
+
+@lru_cache(maxsize=1)
+def valid_timezones():
+    return frozenset(available_timezones())
+
+
+def local_date(name, at=None):
+    """The calendar date at `at` (default: now) in timezone `name`."""
+    return (at or now()).astimezone(get_zone(name)).date()
+
+
+@lru_cache(maxsize=4096)
+def day_start(name, day):
+    """The UTC instant local `day` starts at in timezone `name` (its first instant if DST skips midnight)."""
+    return datetime.combine(day, time.min, tzinfo=get_zone(name)).astimezone(timezone.utc)
+
+
+def day_bounds(name, day):
+    """(starts_at, ends_at) of local `day` in timezone `name`, as UTC datetimes; ends_at is the next day's start."""
+    return day_start(name, day), day_start(name, day + timedelta(days=1))
+
+
+_stored = set()
+_stored_lock = threading.Lock()
+
+
+def ensure_day_boundaries(names, first, last):
+    """
+    Makes sure TimezoneDayBoundary has the local days `first`..`last` for every
+    timezone in `names`. Rows never change, so what this process has seen
+    stored is remembered and costs no query the next time.
+    """
+    wanted = {(name, first + timedelta(days=offset)) for name in names for offset in range((last - first).days + 1)}
+    missing = wanted - _stored
+    if not missing:
+        return
+
+    existing = set(TimezoneDayBoundary.objects.filter(
+        timezone__in={name for name, _ in missing}, date__gte=first, date__lte=last,
+    ).values_list("timezone", "date"))
+    TimezoneDayBoundary.objects.bulk_create([
+        TimezoneDayBoundary(timezone=name, date=day, starts_at=start, ends_at=end)
+        for name, day in missing - existing
+        for start, end in [day_bounds(name, day)]
+    ], ignore_conflicts=True)  # 🔥 Another process may be storing the same days
+    with _stored_lock:
+        _stored.update(missing)
+
+
+def ensure_current_days(names, at=None):
+    """Stores yesterday, today and tomorrow as seen from every timezone in `names`."""
+    day = (at or now()).astimezone(timezone.utc).date()
+    ensure_day_boundaries(names, day - timedelta(days=2), day + timedelta(days=1))
@@ -0,0 +1,90 @@
+import hashlib
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile, StopUpload
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+# Multipart framing (boundaries, part headers, small form fields) on top of the file itself.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Uploaded file exceeds the maximum allowed size."
+    default_code = "upload_too_large"
+
+
+class HashedTemporaryUploadedFile(TemporaryUploadedFile):
+    """
+    A temporary upload that carries the SHA-256 of its contents.
+    """
+    sha256 = ""
+
+
+class StagedUpload(File):
+    """
+    A fully staged resumable upload. Exposing ``temporary_file_path`` lets
+    FileSystemStorage move it into place instead of copying it.
+    """
+
+    def __init__(self, path, name):
+        super().__init__(open(path, "rb"), name=name)
+        self.path = path
+
+    def temporary_file_path(self):
+        return self.path
+
+
+class HashingFileUploadHandler(FileUploadHandler):
+    """
+    Streams uploaded files to disk while hashing them chunk by chunk.
+
+    Each chunk is written to a temporary file and fed to SHA-256 as it
+    arrives, so memory stays bounded by ``chunk_size`` whatever the file
+    size, and the finished digest travels with the file (``file.sha256``)
+    instead of being recomputed by reading it back.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.chunk_size = settings.BOOK_UPLOAD_CHUNK_SIZE
+        self.max_bytes = settings.BOOK_UPLOAD_MAX_BYTES
+        self.too_large = False
+        self.hasher = None
+        self.received = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        """Reject bodies that cannot fit under the limit before reading them."""
+        if content_length and content_length > self.max_bytes + MULTIPART_OVERHEAD_BYTES:
+            self.too_large = True
+
+    def new_file(self, *args, **kwargs):
+        if self.too_large:
+            raise StopUpload(connection_reset=True)
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.sha256()
+        self.received = 0
+        self.file = HashedTemporaryUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
+        )
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_bytes:
+            self.too_large = True
+            raise SkipFile()
+
+        self.hasher.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.hasher.hexdigest()
+        return self.file
+
+    def upload_interrupted(self):
+        if hasattr(self, "file"):
+            self.file.close()
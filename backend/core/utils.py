@@ -42,7 +42,7 @@ def send_password_reset_email(user):
 
     subject = "Reset Your Password"
     message = f"Click the link to reset your password: {reset_url}"
-    
+
     send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [user.email])
 
 
@@ -66,15 +66,9 @@ def send_otp_email(user_email, otp_code):
     subject = "Your Codexia Verification Code"
     message = f"Your OTP code is: {otp_code}\nValid for 5 minutes."
     from_email = settings.DEFAULT_FROM_EMAIL
-    
-    send_mail(
-        subject,
-        message,
-        from_email,
-        [user_email],
-        fail_silently=False
-    )
-    print(f"📨 OTP sent to {user_email}")  # Debugging
+
+    # ✅ Sent inline (over the pooled SMTP backend), not queued: an OTP valid for 5 minutes cannot wait on a worker or retry backoff
+    send_mail(subject, message, from_email, [user_email], fail_silently=False)
 
 def send_welcome_email(user):
     subject = f"Welcome to Codexia, {user.get_full_name() or user.email}!"
@@ -1,19 +1,242 @@
+import hashlib
+import uuid
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection, transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from api.models.blocklists import BlocklistExclusion, BlocklistSubscription
 from api.models.focus import BlockedApp, BlockedWebsite
+from core import catalog
+from core.domains import DomainTrie, normalize_host, parse_rule
+
+ALLOWED_APPS = ("com.android.contacts", "com.android.mms")  # 🔥 Messages & Phonebook stay reachable
+
+
+def category_sets():
+    """{category id: {"app": frozenset, "website": frozenset}} of the curated catalog, built once per catalog version."""
+    def build(rows):
+        sets = {}
+        for entry in rows:
+            sets.setdefault(entry.category_id, {"app": set(), "website": set()})[entry.kind].add(entry.value)
+        return {category_id: {kind: frozenset(values) for kind, values in kinds.items()} for category_id, kinds in sets.items()}
+    return catalog.blocklist_entries.derive("sets", build)
+
+
+def category_slugs():
+    return catalog.blocklist_categories.derive("slugs", lambda rows: {row.slug: row.pk for row in rows})
+
+
+def category_trie(category_id):
+    """A curated category's websites as a DomainTrie, built once per catalog version."""
+    return catalog.blocklist_entries.derive(
+        ("trie", category_id), lambda rows: DomainTrie(category_sets().get(category_id, {}).get("website", ()))
+    )
+
+
+def shared_cache():
+    """
+    Whether the default cache is shared between processes. A per-process one
+    would only see the invalidations of the process that made the write.
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+@lru_cache(maxsize=1024)
+def website_trie(rules):
+    """A user's websites compiled once per process and distinct rule tuple."""
+    return DomainTrie(rules)
+
+
+def curated_lists(value):
+    """Parses a comma-separated `lists` parameter of category slugs into sorted category ids."""
+    slugs = category_slugs()
+    names = sorted({name.strip() for name in (value or "").split(",") if name.strip()})
+    unknown = [name for name in names if name not in slugs]
+    if unknown:
+        raise ValidationError({"lists": f"Unknown lists: {unknown}. Available: {sorted(slugs)}"})
+    return tuple(sorted(slugs[name] for name in names))
+
 
 class BlockingService:
+    """
+    Per-user blocking profiles, compiled once per blocklist change.
+
+    A profile merges the curated categories the user subscribes to (the
+    shared catalog, see core.catalog) with their overlays: their own
+    BlockedApp/BlockedWebsite additions and their BlocklistExclusions. Its
+    `version` is the SHA-1 of its canonical JSON (also its ETag). It is kept
+    in the shared cache under a per-user token that writes to any of those
+    rows replace once they commit (see core.signals), together with the
+    catalog version, so reads between changes cost no query and a profile
+    compiled from rows a concurrent write has since changed is never served
+    under the new token.
+
+    Bulk writes (bulk_create, queryset update/delete) skip model signals and
+    must call `invalidate()` themselves. With a per-process cache (the locmem
+    default) profiles are compiled on every read instead, since other workers
+    would never see the invalidation.
+    """
+
+    @staticmethod
+    def token_key(user_id):
+        return f"blocking:{user_id}:token"
+
+    @staticmethod
+    def current_token(user_id):
+        token = cache.get(BlockingService.token_key(user_id))
+        if token is None:
+            cache.add(BlockingService.token_key(user_id), uuid.uuid4().hex, None)  # 🔥 add, so racing requests agree on one token
+            token = cache.get(BlockingService.token_key(user_id))
+        return token
+
+    @staticmethod
+    def invalidate(user_id):
+        cache.set(BlockingService.token_key(user_id), uuid.uuid4().hex, None)
+
+    @staticmethod
+    def compile(user_id):
+        """
+        Builds the profile: four small queries for the user's rows, and set
+        operations over the cached catalog for their subscriptions. The user's
+        own entries come first in the order they were added, then what their
+        categories add, sorted.
+        """
+        own_apps = list(BlockedApp.objects.filter(user_id=user_id).order_by("id").values_list("package_name", flat=True))
+        own_websites = list(BlockedWebsite.objects.filter(user_id=user_id).order_by("id").values_list("url", flat=True))
+        subscribed = set(BlocklistSubscription.objects.filter(user_id=user_id).values_list("category_id", flat=True))
+        excluded = set(BlocklistExclusion.objects.filter(user_id=user_id).values_list("kind", "value"))
+
+        sets = [category_sets().get(category_id, {}) for category_id in subscribed]
+        apps = frozenset().union(*(kinds.get("app", ()) for kinds in sets))
+        websites = frozenset().union(*(kinds.get("website", ()) for kinds in sets))
+        excluded_apps = {value for kind, value in excluded if kind == "app"} | set(ALLOWED_APPS) | set(own_apps)
+        excluded_hosts = {parse_rule(value)[0] for kind, value in excluded if kind == "website"}
+
+        rules = {
+            "block_apps": [app for app in own_apps if app not in ALLOWED_APPS] + sorted(apps - excluded_apps),
+            "block_websites": own_websites + sorted(
+                website for website in websites - set(own_websites) if parse_rule(website)[0] not in excluded_hosts
+            ),
+            "allowed_apps": list(ALLOWED_APPS),
+            "categories": sorted(slug for slug, pk in category_slugs().items() if pk in subscribed),
+        }
+        return {"version": hashlib.sha1(JSONRenderer().render(rules)).hexdigest(), **rules}
+
+    @staticmethod
+    def profile(user):
+        """The user's compiled profile, from the cache when their blocklist has not changed."""
+        if not shared_cache():
+            return BlockingService.compile(user.pk)  # 🔥 A blocklist write in another process would never reach this one
+        catalogs = f"{catalog.blocklist_categories.snapshot().version}:{catalog.blocklist_entries.snapshot().version}"
+        key = f"blocking:{user.pk}:{BlockingService.current_token(user.pk)}:{catalogs}"
+        profile = cache.get(key)
+        if profile is None:
+            profile = BlockingService.compile(user.pk)
+            if not connection.in_atomic_block:  # ✅ Uncommitted blocklist writes may be in it; use, don't publish
+                cache.set(key, profile, settings.BLOCKING_PROFILE_CACHE_TIMEOUT)
+        return profile
+
+    @staticmethod
+    def replace(user, model, key, fields, items):
+        """
+        Makes `items` (validated field dicts) the user's full set of `model`
+        rows (BlockedApp or BlockedWebsite), matching rows to items on
+        `key(values)`: missing rows are bulk created, changed ones bulk
+        updated and the rest deleted, in one transaction and a constant number
+        of queries. Duplicate keys in `items` keep the last one; duplicate rows
+        keep the oldest. Returns the created / updated / deleted counts.
+        """
+        desired = {key(item): item for item in items}
+        with transaction.atomic():
+            # 🔥 One replace per user at a time, so overlapping uploads cannot both create the same rows
+            list(get_user_model().objects.select_for_update().filter(pk=user.pk).values_list("pk"))
+
+            existing, stale = {}, []
+            for row in model.objects.filter(user=user).order_by("id"):
+                row_key = key({field: getattr(row, field) for field in fields})
+                if row_key in desired and row_key not in existing:
+                    existing[row_key] = row
+                else:
+                    stale.append(row.pk)
+
+            changed = []
+            for row_key, row in existing.items():
+                values = desired[row_key]
+                if any(getattr(row, field) != values.get(field) for field in fields):
+                    for field in fields:
+                        setattr(row, field, values.get(field))
+                    changed.append(row)
+
+            created = model.objects.bulk_create([
+                model(user=user, **{field: values.get(field) for field in fields})
+                for row_key, values in desired.items() if row_key not in existing
+            ])
+            if changed:
+                model.objects.bulk_update(changed, fields)
+            if stale:
+                model.objects.filter(pk__in=stale).delete()
+            transaction.on_commit(lambda: BlockingService.invalidate(user.pk))  # ✅ bulk_create/bulk_update send no signals
+        return {"created": len(created), "updated": len(changed), "deleted": len(stale)}
+
+    @staticmethod
+    def subscribe(user, slugs):
+        """Makes `slugs` the user's full set of subscribed categories, in one transaction."""
+        wanted = {category_slugs()[slug] for slug in slugs}
+        with transaction.atomic():
+            current = set(BlocklistSubscription.objects.filter(user=user).values_list("category_id", flat=True))
+            BlocklistSubscription.objects.bulk_create(
+                [BlocklistSubscription(user=user, category_id=category_id) for category_id in wanted - current],
+                ignore_conflicts=True,
+            )
+            BlocklistSubscription.objects.filter(user=user, category_id__in=current - wanted).delete()
+            transaction.on_commit(lambda: BlockingService.invalidate(user.pk))  # ✅ bulk_create sends no signals
+
     @staticmethod
     def enforce(user, hard_lock=False):
         """Generate blocking configuration for mobile clients"""
-        allowed_apps = {"com.android.mms", "com.android.contacts"}
-        
-        blocked_apps = BlockedApp.objects.filter(user=user).exclude(
-            package_name__in=allowed_apps
-        )
-        blocked_websites = BlockedWebsite.objects.filter(user=user)
-        
-        return {
-            "block_apps": list(blocked_apps.values_list('package_name', flat=True)),
-            "block_websites": list(blocked_websites.values_list('url', flat=True)),
-            "hard_lock": hard_lock,
-            "allowed_apps": list(allowed_apps)
-        }
\ No newline at end of file
+        return {**BlockingService.profile(user), "hard_lock": hard_lock}
+
+    @staticmethod
+    def domain_artifact(user, lists=()):
+        """
+        (bytes, version) of the user's blocked websites merged with the curated
+        categories in `lists` (ids, on top of the subscribed ones) as one
+        DomainTrie (see core.domains for the format). Cached per profile
+        version, catalog version and list selection, so it is rebuilt only
+        after the blocklist changes.
+        """
+        profile = BlockingService.profile(user)
+        entries = catalog.blocklist_entries.snapshot().version
+        key = f"blocking:{user.pk}:domains:{profile['version']}:{entries}:{','.join(map(str, lists))}"
+        artifact = cache.get(key)
+        if artifact is None:
+            trie = DomainTrie(profile["block_websites"])
+            for category_id in lists:
+                trie.update(category_trie(category_id))
+            data = trie.to_bytes()
+            artifact = (data, hashlib.sha1(data).hexdigest())
+            cache.set(key, artifact, settings.BLOCKING_PROFILE_CACHE_TIMEOUT)
+        return artifact
+
+    @staticmethod
+    def check(user, url, lists=()):
+        """
+        Whether `url` (or a bare host) is blocked for the user, and by which
+        rule and list ("profile" for their own and subscribed entries).
+        """
+        host = normalize_host(url)
+        if host is None:
+            raise ValidationError({"url": "Not a URL or host name."})
+        slugs = {pk: slug for slug, pk in category_slugs().items()}
+        tries = [("profile", website_trie(tuple(BlockingService.profile(user)["block_websites"])))]
+        tries += [(slugs[category_id], category_trie(category_id)) for category_id in lists]
+        for source, trie in tries:
+            rule = trie.match(host)
+            if rule:
+                return {"host": host, "blocked": True, "rule": rule, "list": source}
+        return {"host": host, "blocked": False, "rule": None, "list": None}
@@ -0,0 +1,57 @@
+from django.core.exceptions import ValidationError
+from api.models.book import Book, BookBlob, Category, Tag
+from core import catalog
+from services.search import index_book_on_commit
+from services.text_extraction import TextExtractionService
+
+
+class BookIngestService:
+    @staticmethod
+    def create_book(user, content, title, author="", category_name=None, tag_names=(), sha256=""):
+        """
+        Store `content` through the blob store and create the user's Book for it.
+        Shared by single-request uploads and finalized resumable uploads.
+        """
+        if Book.objects.filter(user=user, title__iexact=title).exists():
+            raise ValidationError({"error": "You have already uploaded a book with this title."})
+
+        # 🔥 Find or create category (known ones come from the catalog cache)
+        categories = catalog.categories.derive("by_name", lambda rows: {row.name.lower(): row for row in rows})
+        category = categories.get(category_name.lower()) if category_name else None
+        if not category and category_name:
+            category = Category.objects.filter(name__iexact=category_name).first() or Category.objects.create(name=category_name)
+
+        # 🔥 Find or create tags
+        tags = catalog.tags.derive("by_name", lambda rows: {row.name: row for row in rows})
+        tag_objects = []
+        for tag_name in tag_names:
+            tag = tags.get(tag_name.lower()) or Tag.objects.get_or_create(name=tag_name.lower())[0]  # 🔥 Make tag lowercase
+            tag_objects.append(tag)
+
+        # 🔥 Save book with category & tags, pointing at the shared blob for these bytes
+        with BookBlob.objects.storing():
+            blob = BookBlob.objects.acquire(content, sha256=sha256)
+            book = Book(
+                user=user,
+                title=title,
+                author=author or "",
+                category=category,
+                blob=blob,
+                file=blob.file.name,
+                file_hash=blob.sha256,
+            )
+            book.save()
+            book.tags.set(tag_objects)
+            index_book_on_commit(book)
+
+        # 🔥 New bytes get their pages extracted off the request path
+        if blob.text_status == "pending":
+            TextExtractionService.schedule(blob.pk)
+        return book
+
+    @staticmethod
+    def error_detail(error):
+        """Shape a model ValidationError the way the upload endpoints report it."""
+        if hasattr(error, "error_dict"):
+            return error.message_dict
+        return {"file": error.messages}
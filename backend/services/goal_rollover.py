@@ -0,0 +1,74 @@
+import logging
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils.timezone import now
+from api.models.jobs import Checkpoint
+from api.models.leaderboard import LeaderboardEntry
+from api.models.reading import ReadingGoal
+from api.models.user import User
+from core.tasks import heartbeat, periodic
+from core.timezones import ensure_current_days
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT = "reading.rollover"
+
+
+class GoalRolloverService:
+    @staticmethod
+    def run(chunk_size=None, restart=False):
+        """
+        Starts a new day for every goal whose owner's local midnight has passed
+        since its progress_date (see `ReadingGoalManager.roll_over`).
+
+        Goal owners are walked in user id ranges of `chunk_size`. Each range
+        is one transaction: one UPDATE covering every timezone (through the
+        stored day boundaries), the leaderboard entries of broken streaks and
+        the checkpoint, so an interrupted run
+        resumes after the last committed range unless `restart` is given.
+        Run as a job, it refreshes the job's lock after every range.
+        Returns a report.
+        """
+        chunk_size = chunk_size or settings.ROLLOVER_CHUNK_SIZE
+        started = time.perf_counter()
+        bounds = ReadingGoal.objects.aggregate(low=Min("user_id"), high=Max("user_id"))
+        timezones = list(User.objects.order_by().values_list("timezone", flat=True).distinct())
+
+        checkpoint, _ = Checkpoint.objects.get_or_create(name=CHECKPOINT)
+        resumed_from = checkpoint.position if checkpoint.position and not restart else None
+        if resumed_from is None:
+            Checkpoint.objects.filter(name=CHECKPOINT).update(started_at=now())
+        position = resumed_from or (bounds["low"] or 1) - 1
+        rolled = chunks = 0
+
+        while bounds["high"] is not None and position < bounds["high"]:
+            end = position + chunk_size
+            at = now()  # 🔥 Per range, so a run that spans a midnight picks it up as it goes
+            ensure_current_days(timezones, at)
+            with transaction.atomic():
+                rolled += ReadingGoal.objects.roll_over((position, end), at)
+                LeaderboardEntry.objects.sync_streaks((position, end))
+                Checkpoint.objects.filter(name=CHECKPOINT).update(position=end)
+            position = end
+            chunks += 1
+            heartbeat()  # ✅ Keeps the job's lock fresh, so a long run is not requeued and run twice
+
+        Checkpoint.objects.filter(name=CHECKPOINT).update(position=0)
+        elapsed = time.perf_counter() - started
+        report = {
+            "rolled_over": rolled,
+            "chunks": chunks,
+            "resumed_from": resumed_from,
+            "seconds": round(elapsed, 2),
+            "goals_per_second": round(rolled / elapsed) if elapsed else 0,
+        }
+        logger.info("Goal rollover: %s", report)
+        return report
+
+
+@periodic("reading.rollover", timedelta(minutes=settings.ROLLOVER_INTERVAL_MINUTES))
+def rollover_goals():
+    GoalRolloverService.run()
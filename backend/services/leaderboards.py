@@ -0,0 +1,87 @@
+import logging
+import time
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.timezone import now
+from api.models.book import Book
+from api.models.leaderboard import LONGEST, STREAK, LeaderboardBucket, LeaderboardEntry, category_board, weekly_board
+from api.models.reading import ReadingGoal
+from core.tasks import periodic
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderboardService:
+    @staticmethod
+    def rebuild(chunk_size=5000):
+        """
+        Rebuilds the streak, longest and category boards and their histograms
+        from ReadingGoal in one transaction (initial backfill, or repair after
+        scores were changed behind the managers' back). Goals are streamed in
+        user id order and entries written `chunk_size` at a time; weekly
+        boards fill up as users complete goals. Returns a report.
+        """
+        started = time.perf_counter()
+        boards = Q(board__in=[STREAK, LONGEST]) | Q(board__startswith="category:")
+        counts, written = Counter(), 0
+
+        def flush(entries):
+            nonlocal written
+            LeaderboardEntry.objects.bulk_create(entries)
+            written += len(entries)
+            entries.clear()
+
+        with transaction.atomic():
+            LeaderboardEntry.objects.filter(boards).delete()
+            LeaderboardBucket.objects.filter(boards).delete()
+
+            entries = []
+            goals = ReadingGoal.objects.filter(longest_streak__gt=0).order_by("user_id").values_list("user_id", "streak_count", "longest_streak")
+            for user_id, streak, longest in goals.iterator(chunk_size=chunk_size):
+                for board, score in ((STREAK, streak), (LONGEST, longest)):
+                    if score:
+                        entries.append(LeaderboardEntry(board=board, user_id=user_id, score=score))
+                        counts[board, score] += 1
+                if len(entries) >= chunk_size:
+                    flush(entries)
+
+            readers = Book.objects.filter(category__isnull=False, user__readinggoal__streak_count__gt=0).order_by("user_id", "category_id")
+            for user_id, category_id, streak in readers.values_list("user_id", "category_id", "user__readinggoal__streak_count").distinct().iterator(chunk_size=chunk_size):
+                entries.append(LeaderboardEntry(board=category_board(category_id), user_id=user_id, score=streak))
+                counts[category_board(category_id), streak] += 1
+                if len(entries) >= chunk_size:
+                    flush(entries)
+            flush(entries)
+
+            LeaderboardBucket.objects.bulk_create(
+                [LeaderboardBucket(board=board, score=score, count=count) for (board, score), count in counts.items()],
+                batch_size=chunk_size,
+            )
+
+        elapsed = time.perf_counter() - started
+        report = {"entries": written, "buckets": len(counts), "seconds": round(elapsed, 2)}
+        logger.info("Leaderboard rebuild: %s", report)
+        return report
+
+    @staticmethod
+    def prune_weekly(today=None):
+        """Drops weekly boards older than LEADERBOARD_WEEKLY_KEEP_WEEKS. Returns the boards removed."""
+        today = today or now().date()
+        keep = {weekly_board(today - timedelta(weeks=weeks)) for weeks in range(-1, settings.LEADERBOARD_WEEKLY_KEEP_WEEKS)}
+        stale = set(
+            LeaderboardBucket.objects.filter(board__startswith="weekly:").exclude(board__in=keep)
+            .order_by().values_list("board", flat=True).distinct()
+        )
+        if stale:
+            with transaction.atomic():
+                LeaderboardEntry.objects.filter(board__in=stale).delete()
+                LeaderboardBucket.objects.filter(board__in=stale).delete()
+        return sorted(stale)
+
+
+@periodic("leaderboards.prune", timedelta(days=1))
+def prune_weekly_leaderboards():
+    LeaderboardService.prune_weekly()
@@ -0,0 +1,119 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from api.models.book import Book
+from api.models.bookmark import Bookmark, Highlight
+from api.models.focus import ReadingSession
+from api.models.reading import ReadingGoal
+from api.models.stats import ReadingStats
+from api.models.sync import SyncEvent
+from core.timezones import local_date
+
+
+class ReadingSyncService:
+    @staticmethod
+    def apply(user, events):
+        """
+        Applies a batch of validated offline events (see SyncEventSerializer) in one transaction.
+
+        Events whose key was already applied are skipped, so clients can resend
+        a batch until they see the response. Progress is summed per local date
+        of its `client_time` and each day is applied in order, as an atomic
+        goal update for that day, so streaks see the days it was read on.
+        Progress from a day the goal has already moved past cannot be credited
+        any more (the goal only holds its current day) and is reported as
+        `expired` instead. Progress without a goal is dropped, as the single
+        progress endpoint would reject it. Sessions, bookmarks and highlights
+        are written with one bulk_create each. Bookmarks on an already
+        bookmarked page update its note, the last event winning.
+        """
+        with transaction.atomic():
+            # 🔥 One sync per user at a time, so the key check below cannot race an overlapping batch
+            list(get_user_model().objects.select_for_update().filter(pk=user.pk).values_list("pk"))
+
+            applied = set(SyncEvent.objects.filter(user=user, key__in=[event["key"] for event in events]).values_list("key", flat=True))
+            duplicates = [event["key"] for event in events if event["key"] in applied]
+            fresh = []
+            for event in events:
+                if event["key"] not in applied:
+                    applied.add(event["key"])
+                    fresh.append(event)
+
+            by_type = {kind: [] for kind, _ in SyncEvent.KINDS}
+            for event in fresh:
+                by_type[event["type"]].append(event)
+
+            book_ids = {event["book"] for event in by_type["bookmark"] + by_type["highlight"]}
+            unknown = book_ids - set(Book.objects.filter(user=user, pk__in=book_ids).values_list("pk", flat=True))
+            if unknown:
+                raise ValidationError({"book": f"Unknown book ids: {sorted(unknown)}"})
+
+            days = {}
+            for event in by_type["progress"]:
+                if event["amount"]:
+                    days.setdefault(local_date(user.timezone, event["client_time"]), []).append(event)
+
+            goal, just_completed, expired = ReadingGoal.objects.select_for_update().filter(user=user).first(), False, []
+            for day in sorted(days):
+                if goal is None:
+                    break
+                if goal.progress_date and day < goal.progress_date:
+                    expired += [event["key"] for event in days[day]]  # ✅ Flagged, never moved onto a later day
+                    continue
+                goal, completed = ReadingGoal.objects.add_progress(user.id, sum(event["amount"] for event in days[day]), day)
+                just_completed = just_completed or completed
+
+            sessions = []
+            for event in by_type["session"]:
+                session = ReadingSession(
+                    user=user,
+                    book_id=event["book_id"],
+                    start_time=event["start_time"],
+                    end_time=event["end_time"],
+                    reading_duration=event["reading_duration"],
+                    interruptions=event["interruptions"],
+                    completed=True,
+                )
+                session.calculate_focus_score()
+                sessions.append(session)
+            sessions = ReadingSession.objects.bulk_create(sessions)
+            ReadingStats.objects.record_sessions(sessions)
+
+            bookmarks = {}
+            for event in by_type["bookmark"]:
+                bookmarks[event["book"], event["page_number"]] = Bookmark(
+                    user=user, book_id=event["book"], page_number=event["page_number"],
+                    note=event.get("note"), created_at=event["client_time"],
+                )
+            # 🔥 Deduplicated above: one upsert may not touch the same row twice
+            bookmarks = Bookmark.objects.bulk_create(
+                bookmarks.values(), update_conflicts=True,
+                unique_fields=["user", "book", "page_number"], update_fields=["note"],
+            )
+            if bookmarks:
+                # ✅ Upserted pages keep their original created_at; report what is stored
+                bookmarks = list(Bookmark.objects.filter(pk__in=[bookmark.pk for bookmark in bookmarks]))
+
+            highlights = Highlight.objects.bulk_create([
+                Highlight(
+                    user=user, book_id=event["book"], page_number=event["page_number"],
+                    text=event["text"], created_at=event["client_time"],
+                )
+                for event in by_type["highlight"]
+            ])
+
+            SyncEvent.objects.bulk_create([
+                SyncEvent(user=user, key=event["key"], kind=event["type"], client_time=event["client_time"])
+                for event in fresh
+            ])
+
+        return {
+            "applied": [event["key"] for event in fresh],
+            "duplicates": duplicates,
+            "expired": expired,
+            "goal": goal,
+            "just_completed": just_completed,
+            "sessions": sessions,
+            "bookmarks": bookmarks,
+            "highlights": highlights,
+        }
@@ -0,0 +1,489 @@
+import heapq
+import html
+import json
+import math
+import re
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, models, transaction
+from django.db.models import Case, F, FloatField, Func, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Cast, Concat
+from rest_framework.filters import BaseFilterBackend
+from api.models.book import Book, BookPage, Category
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# 🔥 Relative weight of each field, mirroring the A/B/C/D weights of the Postgres vector
+FIELD_WEIGHTS = {"title": 1.0, "author": 0.4, "tags": 0.2, "category": 0.2}
+CONTENT_WEIGHT = 0.1
+
+SNIPPET_CHARS = 160
+INDEX_VERSION_KEY = "search:index:version"
+INDEX_CHANGE_KEY = "search:index:change:{}"
+INDEX_CHANGE_TIMEOUT = 24 * 60 * 60
+MAX_REPLAYED_CHANGES = 1000  # 🔥 A process further behind than this rebuilds instead
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) > 1]
+
+
+def book_fields(book):
+    """The searchable metadata of a book, as plain strings per field."""
+    return {
+        "title": book.title,
+        "author": book.author,
+        "tags": " ".join(tag.name for tag in book.tags.all()),
+        "category": book.category.name if book.category else "",
+    }
+
+
+def highlight(text, terms):
+    """Returns an HTML-escaped window of `text` around the first matching term, with matches in <b>."""
+    if not text:
+        return ""
+    lowered = text.lower()
+    hits = [lowered.find(term) for term in terms if term in lowered]
+    first = min(hits) if hits else 0
+    start = max(0, first - SNIPPET_CHARS // 3)
+    window = text[start:start + SNIPPET_CHARS]
+
+    # 🔥 Matched on the raw text, longest term first, and escaped while joining, so markup is never matched
+    parts, position = [], 0
+    if terms:
+        pattern = re.compile(r"(?i)\b(?:%s)" % "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True)))
+        for match in pattern.finditer(window):
+            parts.append(html.escape(window[position:match.start()]))
+            parts.append(f"<b>{html.escape(match.group())}</b>")
+            position = match.end()
+    parts.append(html.escape(window[position:]))
+    snippet = "".join(parts)
+    prefix = "…" if start else ""
+    suffix = "…" if start + SNIPPET_CHARS < len(text) else ""
+    return f"{prefix}{snippet.strip()}{suffix}"
+
+
+class SearchResult:
+    __slots__ = ("book_id", "rank", "page", "metadata", "snippet")
+
+    def __init__(self, book_id, rank, page=None, metadata=True, snippet=""):
+        self.book_id = book_id
+        self.rank = rank
+        self.page = page
+        self.metadata = metadata  # Whether the book's metadata matched, not only its pages
+        self.snippet = snippet
+
+
+class InvertedIndex:
+    """
+    In-process inverted index over book metadata and page text.
+
+    Metadata postings map a term to {book_id: weighted term frequency};
+    content postings map a term to {blob_id: {page: tf}} so a file shared
+    by several books is indexed once. All query terms must match, either
+    in a book's metadata or somewhere in its pages.
+    """
+
+    def __init__(self):
+        self.meta = defaultdict(dict)
+        self.content = defaultdict(lambda: defaultdict(dict))
+        self.book_blob = {}
+        self.blob_books = defaultdict(set)
+        self.lengths = {}
+        self.book_terms = {}
+        self.blob_terms = defaultdict(set)
+
+    def add_book(self, book_id, blob_id, fields):
+        self.remove_book(book_id)
+        length = 0
+        terms = set()
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text or ""):
+                postings = self.meta[token]
+                postings[book_id] = postings.get(book_id, 0.0) + weight
+                terms.add(token)
+                length += 1
+        self.lengths[book_id] = max(1, length)
+        self.book_terms[book_id] = terms
+        if blob_id:
+            self.book_blob[book_id] = blob_id
+            self.blob_books[blob_id].add(book_id)
+
+    def remove_book(self, book_id):
+        if book_id not in self.lengths:
+            return
+        for term in self.book_terms.pop(book_id):
+            postings = self.meta[term]
+            postings.pop(book_id, None)
+            if not postings:
+                del self.meta[term]
+        del self.lengths[book_id]
+        blob_id = self.book_blob.pop(book_id, None)
+        if blob_id:
+            self.blob_books[blob_id].discard(book_id)
+
+    def add_page(self, blob_id, number, text):
+        counts = defaultdict(int)
+        for token in tokenize(text):
+            counts[token] += 1
+        for token, count in counts.items():
+            self.content[token][blob_id][number] = count
+        self.blob_terms[blob_id].update(counts)
+
+    def remove_pages(self, blob_id):
+        for term in self.blob_terms.pop(blob_id, ()):
+            postings = self.content[term]
+            postings.pop(blob_id, None)
+            if not postings:
+                del self.content[term]
+
+    def term_scores(self, term, idf, candidates=None):
+        """Scores of `term` per book, restricted to `candidates` when given."""
+        meta = self.meta.get(term, {})
+        pages = self.content.get(term, {})
+        scores, best_pages = {}, {}
+
+        if candidates is None:
+            for book_id, tf in meta.items():
+                scores[book_id] = tf / self.lengths[book_id] * idf
+            page_books = ((book_id, blob_id) for blob_id in pages for book_id in self.blob_books.get(blob_id, ()))
+        else:
+            for book_id in candidates:
+                if book_id in meta:
+                    scores[book_id] = meta[book_id] / self.lengths[book_id] * idf
+            page_books = ((book_id, self.book_blob.get(book_id)) for book_id in candidates if self.book_blob.get(book_id) in pages)
+
+        for book_id, blob_id in page_books:
+            page, count = max(pages[blob_id].items(), key=lambda item: item[1])
+            scores[book_id] = scores.get(book_id, 0.0) + CONTENT_WEIGHT * math.log1p(count) * idf
+            best_pages[book_id] = page
+        return scores, best_pages
+
+    def search(self, query, limit):
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        total = max(1, len(self.lengths))
+        frequency = {term: len(self.meta.get(term, ())) + len(self.content.get(term, ())) for term in terms}
+        scores, best_pages = None, {}
+        # 🔥 AND semantics: start from the rarest term and only probe its candidates for the others
+        for term in sorted(terms, key=frequency.get):
+            idf = math.log(1 + total / (1 + frequency[term]))
+            term_scores, term_pages = self.term_scores(term, idf, scores)
+            if scores is not None:
+                term_scores = {book_id: scores[book_id] + score for book_id, score in term_scores.items()}
+            scores = term_scores
+            for book_id, page in term_pages.items():
+                best_pages.setdefault(book_id, page)
+            if not scores:
+                return []
+
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+        return [SearchResult(book_id, score, best_pages.get(book_id)) for book_id, score in ranked]
+
+
+class SearchBackend:
+    """
+    A backend ranks matches (`rank`: ids, ranks and best pages only) and
+    renders snippets for a page of them (`snippets`), so list endpoints that
+    rank many matches never pay for snippets they do not show.
+    """
+
+    def search(self, query, limit):
+        """The best `limit` matches with their snippets."""
+        return self.snippets(query, self.rank(query, limit))
+
+
+class MemoryBookSearch(SearchBackend):
+    """
+    Fallback backend for SQLite and tests. The index is built lazily per
+    process. Changes are published to the shared cache as a numbered log
+    (`publish`), which other processes replay on their next search, reloading
+    only the books and pages that changed; a process that finds a gap in the
+    log (evicted, or too far behind) rebuilds instead.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = None
+        self.version = None
+
+    def get_index(self):
+        version = cache.get_or_set(INDEX_VERSION_KEY, 1, None)
+        with self.lock:
+            if self.index is not None and self.version != version and not self.replay(self.index, self.version, version):
+                self.index = None
+            if self.index is None:
+                self.index = self.build()
+            self.version = version
+            return self.index
+
+    def build(self):
+        index = InvertedIndex()
+        books = Book.objects.select_related("category").prefetch_related("tags")
+        for book in books.iterator(chunk_size=2000):
+            index.add_book(book.pk, book.blob_id, book_fields(book))
+        for blob_id, number, text in BookPage.objects.values_list("blob_id", "number", "text").iterator(chunk_size=2000):
+            index.add_page(blob_id, number, text)
+        return index
+
+    def replay(self, index, since, until):
+        """Applies the changes published after `since` up to `until`; False when the log cannot cover them."""
+        if not since < until <= since + MAX_REPLAYED_CHANGES:
+            return False
+        keys = [INDEX_CHANGE_KEY.format(number) for number in range(since + 1, until + 1)]
+        changes = cache.get_many(keys)
+        if len(changes) < len(keys):
+            return False  # ✅ Also a change whose number was taken but not yet written: rebuild rather than wait
+
+        books, blobs = set(), set()
+        for key in keys:
+            kind, pk = changes[key]
+            if kind == "rebuild":
+                return False
+            (books if kind == "book" else blobs).add(pk)
+
+        found = Book.objects.filter(pk__in=books).select_related("category").prefetch_related("tags")
+        for book in found:
+            index.add_book(book.pk, book.blob_id, book_fields(book))
+        for book_id in books - {book.pk for book in found}:
+            index.remove_book(book_id)  # 🔥 Deleted since
+        for blob_id in blobs:
+            index.remove_pages(blob_id)
+        for blob_id, number, text in BookPage.objects.filter(blob_id__in=blobs).values_list("blob_id", "number", "text").iterator():
+            index.add_page(blob_id, number, text)
+        return True
+
+    def bump_version(self):
+        try:
+            version = cache.incr(INDEX_VERSION_KEY)
+        except ValueError:
+            version = 1
+            cache.set(INDEX_VERSION_KEY, version, None)
+        return version
+
+    def publish(self, kind, pk=None):
+        """Appends a change ("book", "pages" or "rebuild") to the shared log; every process applies it on its next search."""
+        cache.set(INDEX_CHANGE_KEY.format(self.bump_version()), (kind, pk), INDEX_CHANGE_TIMEOUT)
+
+    def index_book(self, book):
+        self.publish("book", book.pk)
+
+    def remove_book(self, book_id):
+        self.publish("book", book_id)
+
+    def index_pages(self, blob_id):
+        self.publish("pages", blob_id)
+
+    def rebuild(self, batch_size=None):
+        """Drops the index everywhere; each process rebuilds it on its next search."""
+        self.publish("rebuild")
+        index = self.get_index()
+        return {"Book": len(index.lengths), "BookPage": BookPage.objects.count()}
+
+    def rank(self, query, limit):
+        return self.get_index().search(query, limit)
+
+    def snippets(self, query, results):
+        terms = tokenize(query)
+        books = Book.objects.in_bulk([result.book_id for result in results])
+        pages = dict(
+            ((blob_id, number), text)
+            for blob_id, number, text in BookPage.objects.filter(
+                blob_id__in=[books[r.book_id].blob_id for r in results if r.page and r.book_id in books],
+                number__in=[r.page for r in results if r.page],
+            ).values_list("blob_id", "number", "text")
+        )
+        for result in results:
+            book = books.get(result.book_id)
+            if not book:
+                continue
+            page_text = pages.get((book.blob_id, result.page))
+            result.snippet = highlight(page_text if page_text and not any(t in book.title.lower() for t in terms) else book.title, terms)
+        return [result for result in results if result.book_id in books]
+
+    def rank_expression(self, results):
+        """Each book's rank as one json_extract over a {book id: rank} parameter."""
+        ranks = json.dumps({str(result.book_id): float(result.rank) for result in results})
+        path = Concat(Value('$."'), Cast("pk", models.CharField()), Value('"'))
+        return Func(Value(ranks), path, function="json_extract", output_field=FloatField())
+
+
+def array_lookup(mapping, key, output_field):
+    """`mapping[key]` per row as one expression, with the mapping sent as a keys array and a values array."""
+    from django.contrib.postgres.fields import ArrayField
+
+    keys = Cast(Value(list(mapping)), ArrayField(models.BigIntegerField()))
+    values = Cast(Value(list(mapping.values())), ArrayField(output_field))
+    position = Func(keys, key, function="array_position")
+    return Func(values, position, arg_joiner=")[", template="((%(expressions)s])", output_field=output_field)
+
+
+class PostgresBookSearch(SearchBackend):
+    """
+    Production backend: weighted tsvectors on Book (title A, author B,
+    tags/category C) and on BookPage text, both behind GIN indexes.
+    """
+
+    def __init__(self):
+        self.config = settings.BOOK_SEARCH_CONFIG
+
+    def query(self, text):
+        from django.contrib.postgres.search import SearchQuery
+
+        return SearchQuery(text, search_type="websearch", config=self.config)
+
+    def book_vector(self):
+        """Weighted vector computed in SQL, so one UPDATE reindexes any number of books."""
+        from django.contrib.postgres.aggregates import StringAgg
+        from django.contrib.postgres.search import SearchVector
+
+        tags = (
+            Book.tags.through.objects.filter(book_id=OuterRef("pk"))
+            .values("book_id")
+            .annotate(names=StringAgg("tag__name", " "))
+            .values("names")
+        )
+        category = Category.objects.filter(pk=OuterRef("category_id")).values("name")
+        return (
+            SearchVector("title", weight="A", config=self.config)
+            + SearchVector("author", weight="B", config=self.config)
+            + SearchVector(Subquery(tags), weight="C", config=self.config)
+            + SearchVector(Subquery(category), weight="C", config=self.config)
+        )
+
+    def page_vector(self):
+        from django.contrib.postgres.search import SearchVector
+
+        return SearchVector("text", weight="D", config=self.config)
+
+    def index_book(self, book):
+        Book.objects.filter(pk=book.pk).update(search_vector=self.book_vector())
+
+    def remove_book(self, book_id):
+        pass  # ✅ The vector lives on the deleted row
+
+    def index_pages(self, blob_id):
+        BookPage.objects.filter(blob_id=blob_id).update(search_vector=self.page_vector())
+
+    def rebuild(self, batch_size=5000):
+        """Reindexes every book and page in primary key ranges, one short UPDATE per range."""
+        counts = {}
+        for model, vector in ((Book, self.book_vector()), (BookPage, self.page_vector())):
+            last = model.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+            updated = 0
+            for start in range(0, last + 1, batch_size):
+                updated += model.objects.filter(pk__gte=start, pk__lt=start + batch_size).update(search_vector=vector)
+            counts[model.__name__] = updated
+        return counts
+
+    def rank(self, query, limit):
+        """Ids, ranks and best pages of the best `limit` matches: three short queries, no headlines."""
+        from django.contrib.postgres.search import SearchRank
+
+        search_query = self.query(query)
+
+        # 🔥 Two GIN-indexed legs (metadata, page text) merged here instead of an OR the planner cannot index
+        meta_hits = dict(
+            Book.objects.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank")
+            .values_list("pk", "rank")[:limit]
+        )
+        page_hits = {}
+        for blob_id, number, rank in (
+            BookPage.objects.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank")
+            .values_list("blob_id", "number", "rank")[:limit]
+        ):
+            page_hits.setdefault(blob_id, (number, rank))
+
+        scores, best_pages = dict(meta_hits), {}
+        for book_id, blob_id in Book.objects.filter(blob_id__in=page_hits).values_list("pk", "blob_id"):
+            number, rank = page_hits[blob_id]
+            scores[book_id] = scores.get(book_id, 0.0) + CONTENT_WEIGHT * rank
+            best_pages[book_id] = number
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))[:limit]
+        return [SearchResult(book_id, rank, best_pages.get(book_id), book_id in meta_hits) for book_id, rank in ranked]
+
+    def snippets(self, query, results):
+        """
+        Headlines for `results` in one query: the title for metadata matches,
+        the best page for books that only matched in their text.
+        """
+        from django.contrib.postgres.search import SearchHeadline
+
+        if not results:
+            return results
+        search_query = self.query(query)
+        options = {"config": self.config, "start_sel": "<b>", "stop_sel": "</b>", "max_words": 35, "min_words": 15}
+        headline = SearchHeadline("title", search_query, **options)
+
+        pages = {result.book_id: result.page for result in results if result.page and not result.metadata}
+        if pages:
+            page_text = BookPage.objects.filter(
+                blob_id=OuterRef("blob_id"), number=array_lookup(pages, OuterRef("pk"), IntegerField()),
+            ).values("text")[:1]
+            headline = Case(
+                When(pk__in=list(pages), then=SearchHeadline(Subquery(page_text), search_query, **options)),
+                default=headline,
+            )
+        snippets = dict(
+            Book.objects.filter(pk__in=[result.book_id for result in results])
+            .annotate(snippet=headline)
+            .values_list("pk", "snippet")
+        )
+        for result in results:
+            result.snippet = snippets.get(result.book_id) or ""
+        return results
+
+    def rank_expression(self, results):
+        """Each book's rank as one array lookup, whatever the number of results."""
+        return array_lookup({result.book_id: float(result.rank) for result in results}, F("pk"), FloatField())
+
+
+_backends = {}
+
+
+def get_search_backend():
+    """Postgres full-text search in production, the in-process index elsewhere."""
+    vendor = connection.vendor
+    if vendor not in _backends:
+        _backends[vendor] = PostgresBookSearch() if vendor == "postgresql" else MemoryBookSearch()
+    return _backends[vendor]
+
+
+def index_book_on_commit(book):
+    transaction.on_commit(lambda: get_search_backend().index_book(book))
+
+
+def remove_book_on_commit(book_id):
+    transaction.on_commit(lambda: get_search_backend().remove_book(book_id))
+
+
+class BookSearchFilter(BaseFilterBackend):
+    """
+    Ranked full-text `?search=` for book lists, replacing SearchFilter's ILIKE scans.
+    Annotates `search_rank` and orders by it, best match first. Only ranks
+    are computed here; list pages show no snippets.
+    """
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+
+        backend = get_search_backend()
+        results = backend.rank(query, settings.BOOK_SEARCH_MAX_RESULTS)
+        if not results:
+            return queryset.none()
+        return queryset.filter(pk__in=[result.book_id for result in results]).annotate(
+            search_rank=backend.rank_expression(results),
+        ).order_by("-search_rank", "-pk")
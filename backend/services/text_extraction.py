@@ -0,0 +1,126 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.timezone import now
+from api.models.book import BookBlob, BookPage
+from core.tasks import enqueue_many, periodic, task
+from services.search import get_search_backend
+
+logger = logging.getLogger(__name__)
+
+PAGE_BATCH_SIZE = 500
+
+
+def iter_pdf_pages(path):
+    from pypdf import PdfReader  # 🔥 Only the extraction workers need the PDF parser
+
+    for page in PdfReader(path).pages:
+        yield page.extract_text() or ""
+
+
+def iter_text_pages(path, page_chars):
+    """
+    Splits plain text on form feeds when the file has them, otherwise into
+    pages of roughly `page_chars` characters ending on a line break.
+    Reads line by line so memory stays at about one page.
+    """
+    page = []
+    size = 0
+    with open(path, encoding="utf-8", errors="replace") as text:
+        for line in text:
+            while "\f" in line:
+                head, line = line.split("\f", 1)
+                page.append(head)
+                yield "".join(page)
+                page, size = [], 0
+            page.append(line)
+            size += len(line)
+            if size >= page_chars:
+                yield "".join(page)
+                page, size = [], 0
+    if page:
+        yield "".join(page)
+
+
+def detect_format(path):
+    with open(path, "rb") as file:
+        head = file.read(4096)
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.start < len(head) - 4:  # 🔥 Tolerate a multi-byte character cut at the sample boundary
+            return None
+    return "txt"
+
+
+class TextExtractionService:
+    @staticmethod
+    def schedule(*blob_ids):
+        """Queues extraction on the job workers (see core.tasks); the jobs commit with the caller's transaction."""
+        enqueue_many("books.extract_text", [{"blob_id": blob_id} for blob_id in blob_ids])
+
+    @staticmethod
+    def run(blob_id, force=False):
+        """Job and command entry point: never raises, a failed extraction is recorded on the blob."""
+        try:
+            TextExtractionService.extract(blob_id, force=force)
+        except Exception:
+            logger.exception("Text extraction failed for blob %s", blob_id)
+            BookBlob.objects.filter(pk=blob_id).update(text_status="failed")
+
+    @staticmethod
+    def stale():
+        """Blobs left "processing" longer than TEXT_EXTRACTION_TIMEOUT: their worker died mid-extraction."""
+        return Q(text_status="processing", text_started_at__lt=now() - settings.TEXT_EXTRACTION_TIMEOUT)
+
+    @staticmethod
+    def extract(blob_id, force=False):
+        """
+        Extracts per-page text for one blob into BookPage rows and records the page count.
+        Only one worker can claim a blob, so duplicate schedules are harmless; a
+        stale claim (see `stale`) can be taken over.
+        """
+        claim = BookBlob.objects.filter(pk=blob_id)
+        if not force:
+            claim = claim.filter(Q(text_status="pending") | TextExtractionService.stale())
+        if not claim.update(text_status="processing", text_started_at=now()):
+            return
+
+        blob = BookBlob.objects.get(pk=blob_id)
+        path = blob.file.path
+        file_format = detect_format(path)
+        if file_format is None:
+            BookBlob.objects.filter(pk=blob_id).update(text_status="unsupported")
+            return
+
+        pages = iter_pdf_pages(path) if file_format == "pdf" else iter_text_pages(path, settings.TEXT_EXTRACTION_PAGE_CHARS)
+
+        with transaction.atomic():
+            BookPage.objects.filter(blob_id=blob_id).delete()
+            batch = []
+            page_count = 0
+            for page_count, text in enumerate(pages, start=1):
+                batch.append(BookPage(blob_id=blob_id, number=page_count, text=text.replace("\x00", "")))
+                if len(batch) >= PAGE_BATCH_SIZE:
+                    BookPage.objects.bulk_create(batch)
+                    batch = []
+            BookPage.objects.bulk_create(batch)
+            BookBlob.objects.filter(pk=blob_id).update(text_status="ready", page_count=page_count)
+            transaction.on_commit(lambda: get_search_backend().index_pages(blob_id))  # ✅ Index pages other processes can read
+
+
+@task("books.extract_text")
+def extract_text(blob_id):
+    TextExtractionService.run(blob_id)
+
+
+@periodic("books.reclaim_extractions", settings.TEXT_EXTRACTION_TIMEOUT / 2)
+def reclaim_extractions():
+    """Requeues extraction of blobs whose worker died mid-extraction."""
+    blob_ids = list(BookBlob.objects.filter(TextExtractionService.stale()).values_list("pk", flat=True))
+    if blob_ids:
+        logger.warning("Reclaiming text extraction of %s stale blobs", len(blob_ids))
+        TextExtractionService.schedule(*blob_ids)